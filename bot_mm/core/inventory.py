@@ -42,6 +42,9 @@ class InventoryManager:
         self.state = InventoryState(symbol=symbol)
         self.max_position_usd = max_position_usd
         self.fills: list = []
+        # Set by on_fill, cleared by update_unrealized: position/entry changed
+        # since unrealized PnL was last marked
+        self.dirty: bool = False
 
     @property
     def position_usd(self) -> float:
@@ -118,11 +121,13 @@ class InventoryManager:
             timestamp=time.time(),
             side=side, price=price, size=size, fee=fee,
         ))
+        self.dirty = True
 
         return realized
 
     def update_unrealized(self, current_price: float):
         """Update unrealized PnL based on current price."""
+        self.dirty = False
         if self.state.position_size == 0:
             self.state.unrealized_pnl = 0.0
             return
@@ -6,16 +6,22 @@ Calculates optimal bid/ask prices based on:
 - Volatility (ATR-based)
 - Inventory position (skew)
 - Order book imbalance
+
+calculate_quotes() returns Quote objects; calculate_quotes_arrays() returns
+the same ladder as parallel NumPy arrays (structure-of-arrays) for callers
+that post-process every quote with vector math before placing orders.
 """
 
 import math
 from dataclasses import dataclass
 from typing import List, Tuple
 
+import numpy as np
+
 from bot_mm.config import QuoteParams
 
 
-@dataclass
+@dataclass(slots=True)
 class Quote:
     """A single quote (one side)."""
     price: float
@@ -59,25 +65,10 @@ class QuoteEngine:
         Returns:
             List of Quote objects (bids + asks)
         """
-        # Directional bias shifts the effective mid price
-        bias_shift = directional_bias * volatility_pct * 0.5
-        effective_mid = mid_price * (1 + bias_shift)
-
-        spread_bps = self._calc_spread(volatility_pct, inventory_usd, max_position_usd)
-        skew_bps = self._calc_skew(inventory_usd, max_position_usd, volatility_pct)
-
-        # Profitability gate: half-spread per side must exceed maker fee
-        fee_bps = abs(maker_fee) * 10000.0
-        if fee_bps > 0:
-            min_profitable_spread = fee_bps * 2.0  # round-trip cost
-            spread_bps = max(spread_bps, min_profitable_spread)
-
-        # Add book imbalance effect (widen on heavy-flow side)
-        imbalance_adj = book_imbalance * 0.3 * spread_bps
-
-        spread_pct = spread_bps / 10000.0
-        skew_pct = skew_bps / 10000.0
-        imb_pct = imbalance_adj / 10000.0
+        effective_mid, spread_pct, skew_pct, imb_pct = self._quote_offsets(
+            mid_price, volatility_pct, inventory_usd, max_position_usd,
+            book_imbalance, directional_bias, maker_fee,
+        )
 
         quotes = []
         for level in range(self.params.num_levels):
@@ -99,6 +90,98 @@ class QuoteEngine:
 
         return quotes
 
+    def calculate_quotes_arrays(
+        self,
+        mid_price: float,
+        volatility_pct: float,
+        inventory_usd: float,
+        max_position_usd: float,
+        book_imbalance: float = 0.0,
+        directional_bias: float = 0.0,
+        maker_fee: float = 0.0,
+        skip_buy: bool = False,
+        skip_sell: bool = False,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Same ladder as calculate_quotes(), as parallel arrays.
+
+        Returns:
+            (prices, sizes, is_buy, levels) — float64, float64, bool, int64
+            arrays in calculate_quotes() order (bid, ask per level).
+        """
+        effective_mid, spread_pct, skew_pct, imb_pct = self._quote_offsets(
+            mid_price, volatility_pct, inventory_usd, max_position_usd,
+            book_imbalance, directional_bias, maker_fee,
+        )
+
+        n = self.params.num_levels
+        levels = np.arange(n)
+        level_offset = levels * self.params.level_spacing_bps / 10000.0
+        bid_prices = effective_mid * (1 - spread_pct / 2 - skew_pct - level_offset + imb_pct)
+        ask_prices = effective_mid * (1 + spread_pct / 2 - skew_pct + level_offset + imb_pct)
+        weights = np.array([self._level_weight(level) for level in range(n)])
+        level_sizes = self.params.order_size_usd * weights / mid_price
+
+        sides = []
+        if not skip_buy:
+            sides.append((bid_prices, True))
+        if not skip_sell:
+            sides.append((ask_prices, False))
+        k = len(sides)
+
+        prices = np.empty(n * k)
+        is_buy = np.empty(n * k, dtype=bool)
+        for offset, (side_prices, buy) in enumerate(sides):
+            prices[offset::k] = side_prices
+            is_buy[offset::k] = buy
+        sizes = np.repeat(level_sizes, k)
+        return prices, sizes, is_buy, np.repeat(levels, k)
+
+    @staticmethod
+    def quotes_from_arrays(
+        prices: np.ndarray, sizes: np.ndarray, is_buy: np.ndarray, levels: np.ndarray
+    ) -> List[Quote]:
+        """Materialize Quote objects from calculate_quotes_arrays()-style arrays."""
+        return [
+            Quote(price=p, size=sz, side="buy" if b else "sell", level=lv)
+            for p, sz, b, lv in zip(
+                prices.tolist(), sizes.tolist(), is_buy.tolist(), levels.tolist()
+            )
+        ]
+
+    def _quote_offsets(
+        self,
+        mid_price: float,
+        volatility_pct: float,
+        inventory_usd: float,
+        max_position_usd: float,
+        book_imbalance: float,
+        directional_bias: float,
+        maker_fee: float,
+    ) -> Tuple[float, float, float, float]:
+        """Return (effective_mid, spread_pct, skew_pct, imb_pct) shared by all levels."""
+        # Directional bias shifts the effective mid price
+        bias_shift = directional_bias * volatility_pct * 0.5
+        effective_mid = mid_price * (1 + bias_shift)
+
+        spread_bps = self._calc_spread(volatility_pct, inventory_usd, max_position_usd)
+        skew_bps = self._calc_skew(inventory_usd, max_position_usd, volatility_pct)
+
+        # Profitability gate: half-spread per side must exceed maker fee
+        fee_bps = abs(maker_fee) * 10000.0
+        if fee_bps > 0:
+            min_profitable_spread = fee_bps * 2.0  # round-trip cost
+            spread_bps = max(spread_bps, min_profitable_spread)
+
+        # Add book imbalance effect (widen on heavy-flow side)
+        imbalance_adj = book_imbalance * 0.3 * spread_bps
+
+        spread_pct = spread_bps / 10000.0
+        skew_pct = skew_bps / 10000.0
+        imb_pct = imbalance_adj / 10000.0
+
+        return effective_mid, spread_pct, skew_pct, imb_pct
+
     # Base weights for up to 5 levels (50%, 30%, 15%, 5%, ...)
     _BASE_WEIGHTS = [0.50, 0.30, 0.15, 0.05]
 
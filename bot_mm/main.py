@@ -22,7 +22,8 @@ from dotenv import load_dotenv
 from bot_mm.config import MMBotConfig, AssetMMConfig, QuoteParams, RiskLimits, Exchange
 from bot_mm.exchanges.hl_mm import HyperliquidMMExchange
 from bot_mm.strategies.basic_mm import BasicMMStrategy
-from bot_mm.utils.notifier import MMDiscordNotifier
+from bot_mm.utils.logger import queue_handler
+from bot_mm.utils.notifier import MMDiscordNotifier, close_session
 
 logger = logging.getLogger("bot_mm")
 
@@ -45,11 +46,13 @@ def parse_args() -> argparse.Namespace:
 
 def setup_logging(level: str = "INFO"):
     fmt = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
-    logging.basicConfig(
-        level=getattr(logging, level.upper(), logging.INFO),
-        format=fmt,
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, level.upper(), logging.INFO))
+    if not root.handlers:
+        # stderr writes happen on a listener thread, off the event loop
+        console = logging.StreamHandler()
+        console.setFormatter(logging.Formatter(fmt, datefmt="%Y-%m-%d %H:%M:%S"))
+        root.addHandler(queue_handler(console))
     # Quiet noisy libraries
     logging.getLogger("urllib3").setLevel(logging.WARNING)
     logging.getLogger("hyperliquid").setLevel(logging.WARNING)
@@ -276,6 +279,8 @@ async def run(args: argparse.Namespace):
         # Send shutdown notification
         if notifier and notifier.is_configured:
             await notifier.send_shutdown("Graceful shutdown")
+            await notifier.close()
+            await close_session()
         await exchange.disconnect()
         logger.info("BotMM stopped")
 
@@ -11,7 +11,7 @@ from typing import List, Tuple
 
 import numpy as np
 
-from bot_mm.ml.fill_predictor import FillPredictor, FEATURE_NAMES
+from bot_mm.ml.fill_predictor import FillPredictor, FEATURE_NAMES, FEATURE_DTYPE
 
 
 class FillDataGenerator:
@@ -86,7 +86,7 @@ class FillDataGenerator:
         n_sides = 2
         n_samples = n_candles_usable * n_distances * n_sides
 
-        X = np.zeros((n_samples, len(FEATURE_NAMES)), dtype=np.float64)
+        X = np.zeros((n_samples, len(FEATURE_NAMES)), dtype=FEATURE_DTYPE)
         y_fill = np.zeros(n_samples, dtype=np.int32)
         y_adverse = np.zeros(n_samples, dtype=np.int32)
 
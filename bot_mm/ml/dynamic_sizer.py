@@ -14,6 +14,19 @@ class DynamicSizer:
     DynamicSizer recomputes size on EVERY quote cycle based on current state.
     """
 
+    __slots__ = (
+        "base_size_usd",
+        "capital_usd",
+        "max_size_pct",
+        "min_size_usd",
+        "max_size_usd",
+        "vol_scale",
+        "kelly_fraction",
+        "_recent_pnls",
+        "_win_streak",
+        "_lose_streak",
+    )
+
     def __init__(
         self,
         base_size_usd: float = 150.0,
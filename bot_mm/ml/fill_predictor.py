@@ -3,6 +3,9 @@ ML model predicting fill probability and adverse selection risk for MM quotes.
 
 Uses GradientBoosting classifiers trained on historical candle data.
 Replaces/augments the simple penetration-based fill model in the backtester.
+Features are carried as float32 end-to-end (training, batch and single-quote
+inference) — the tree ensembles split on float32 thresholds internally, so
+wider inputs only add conversion and memory traffic.
 """
 
 import math
@@ -37,6 +40,17 @@ FEATURE_NAMES = [
     "momentum_20",
 ]
 
+# Feature dtype shared by training and inference (matches sklearn's tree dtype)
+FEATURE_DTYPE = np.float32
+
+# Distance bypass: quotes whose fill probability is pinned below/above these
+# bounds at every calibration sample skip the tree walk in predict().
+BYPASS_FILL_LOW = 0.02
+BYPASS_FILL_HIGH = 0.98
+BYPASS_GRID_BPS = np.arange(0.0, 100.5, 0.5)
+BYPASS_SAMPLE_ROWS = 256
+_DISTANCE_COL = FEATURE_NAMES.index("distance_to_mid_bps")
+
 
 class FillPredictor:
     """
@@ -70,6 +84,12 @@ class FillPredictor:
         self._adverse_model: Optional[GradientBoostingClassifier] = None
         self._trained = False
 
+        # Distance-bypass thresholds (None = bypass disabled on that side)
+        self._bypass_near_bps: Optional[float] = None
+        self._bypass_far_bps: Optional[float] = None
+        self._bypass_near_result: Tuple[float, float] = (BYPASS_FILL_HIGH, 0.0)
+        self._bypass_far_result: Tuple[float, float] = (BYPASS_FILL_LOW, 0.0)
+
     @property
     def is_trained(self) -> bool:
         return self._trained
@@ -162,6 +182,10 @@ class FillPredictor:
         """
         Predict fill probability and adverse selection probability.
 
+        Quotes closer than the calibrated near threshold or farther than the
+        far threshold return the calibrated constant result without running
+        the models (see calibrate_bypass()).
+
         Args:
             features: Dict from extract_features().
 
@@ -174,6 +198,12 @@ class FillPredictor:
         if not self._trained:
             raise RuntimeError("Model not trained. Call train() or load() first.")
 
+        distance = features["distance_to_mid_bps"]
+        if self._bypass_far_bps is not None and distance >= self._bypass_far_bps:
+            return self._bypass_far_result
+        if self._bypass_near_bps is not None and distance <= self._bypass_near_bps:
+            return self._bypass_near_result
+
         x = self._features_to_array(features)
         fill_prob = float(self._fill_model.predict_proba(x)[:, 1][0])
         adverse_prob = float(self._adverse_model.predict_proba(x)[:, 1][0])
@@ -192,6 +222,7 @@ class FillPredictor:
         if not self._trained:
             raise RuntimeError("Model not trained. Call train() or load() first.")
 
+        X = np.ascontiguousarray(X, dtype=FEATURE_DTYPE)
         fill_probs = self._fill_model.predict_proba(X)[:, 1]
         adverse_probs = self._adverse_model.predict_proba(X)[:, 1]
         return fill_probs, adverse_probs
@@ -223,6 +254,7 @@ class FillPredictor:
             random_state=42,
         )
 
+        X = np.ascontiguousarray(X, dtype=FEATURE_DTYPE)
         fp = {**default_params, **(fill_params or {})}
         ap = {**default_params, **(adverse_params or {})}
 
@@ -233,23 +265,88 @@ class FillPredictor:
         self._adverse_model.fit(X, y_adverse)
 
         self._trained = True
+        self.calibrate_bypass(X)
+
+    def calibrate_bypass(self, X: np.ndarray) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Derive the distance thresholds used by predict() to skip the models.
+
+        Sweeps distance_to_mid_bps over BYPASS_GRID_BPS for a sample of rows
+        from X. The far threshold is the smallest distance beyond which every
+        sampled fill probability stays <= BYPASS_FILL_LOW; the near threshold
+        is the largest distance below which every one stays >= BYPASS_FILL_HIGH.
+        The bypass returns the mean fill/adverse probability of that region.
+        Call again with fresh feature rows to recalibrate.
+
+        Returns:
+            (near_bps, far_bps) — None where no such region exists.
+        """
+        if not self._trained:
+            raise RuntimeError("Model not trained. Call train() or load() first.")
+
+        X = np.ascontiguousarray(X, dtype=FEATURE_DTYPE)
+        if len(X) > BYPASS_SAMPLE_ROWS:
+            step = len(X) // BYPASS_SAMPLE_ROWS
+            X = X[::step][:BYPASS_SAMPLE_ROWS]
+
+        n_rows, n_grid = len(X), len(BYPASS_GRID_BPS)
+        grid_X = np.tile(X, (n_grid, 1))
+        grid_X[:, _DISTANCE_COL] = np.repeat(BYPASS_GRID_BPS, n_rows)
+        fill = self._fill_model.predict_proba(grid_X)[:, 1].reshape(n_grid, n_rows)
+        adverse = self._adverse_model.predict_proba(grid_X)[:, 1].reshape(n_grid, n_rows)
+
+        # Suffix/prefix "all rows pinned" masks over the distance grid
+        far_ok = np.logical_and.accumulate((fill.max(axis=1) <= BYPASS_FILL_LOW)[::-1])[::-1]
+        near_ok = np.logical_and.accumulate(fill.min(axis=1) >= BYPASS_FILL_HIGH)
+
+        self._bypass_far_bps = None
+        self._bypass_near_bps = None
+        if far_ok.any():
+            i = int(np.argmax(far_ok))
+            self._bypass_far_bps = float(BYPASS_GRID_BPS[i])
+            self._bypass_far_result = (float(fill[i:].mean()), float(adverse[i:].mean()))
+        if near_ok.any():
+            j = int(len(near_ok) - 1 - np.argmax(near_ok[::-1]))
+            self._bypass_near_bps = float(BYPASS_GRID_BPS[j])
+            self._bypass_near_result = (float(fill[:j + 1].mean()), float(adverse[:j + 1].mean()))
+
+        return self._bypass_near_bps, self._bypass_far_bps
 
     def save(self, path: str) -> None:
         """Save both models to a single file with joblib."""
         if not self._trained:
             raise RuntimeError("Model not trained. Nothing to save.")
         joblib.dump(
-            {"fill_model": self._fill_model, "adverse_model": self._adverse_model},
+            {
+                "fill_model": self._fill_model,
+                "adverse_model": self._adverse_model,
+                "bypass": {
+                    "near_bps": self._bypass_near_bps,
+                    "far_bps": self._bypass_far_bps,
+                    "near_result": self._bypass_near_result,
+                    "far_result": self._bypass_far_result,
+                },
+            },
             path,
         )
 
     def load(self, path: str) -> None:
-        """Load models from a joblib file."""
+        """Load models (and bypass thresholds, if saved) from a joblib file."""
         data = joblib.load(path)
         self._fill_model = data["fill_model"]
         self._adverse_model = data["adverse_model"]
         self._trained = True
 
+        bypass = data.get("bypass")
+        if bypass:
+            self._bypass_near_bps = bypass["near_bps"]
+            self._bypass_far_bps = bypass["far_bps"]
+            self._bypass_near_result = tuple(bypass["near_result"])
+            self._bypass_far_result = tuple(bypass["far_result"])
+        else:
+            self._bypass_near_bps = None
+            self._bypass_far_bps = None
+
     @property
     def feature_names(self):
         return list(FEATURE_NAMES)
@@ -273,7 +370,7 @@ class FillPredictor:
     @staticmethod
     def _features_to_array(features: Dict[str, float]) -> np.ndarray:
         """Convert feature dict to 2D array in canonical order."""
-        return np.array([[features[name] for name in FEATURE_NAMES]])
+        return np.asarray([[features[name] for name in FEATURE_NAMES]], dtype=FEATURE_DTYPE)
 
 
 def _parse_hour(timestamp: str) -> int:
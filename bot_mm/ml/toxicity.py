@@ -4,7 +4,7 @@ from typing import Optional, List
 import math
 
 
-@dataclass
+@dataclass(slots=True)
 class FillRecord:
     """Record of a fill for toxicity analysis."""
     timestamp: str
@@ -17,6 +17,7 @@ class FillRecord:
     mid_after_5: Optional[float] = None
     mid_after_10: Optional[float] = None
     toxicity_score: float = 0.0  # Computed post-fill
+    _fill_bar: int = 0           # Detector bar count when the fill occurred
 
 
 class ToxicityDetector:
@@ -44,6 +45,22 @@ class ToxicityDetector:
     - toxicity < 0.2 -> tighten spread by 10%
     - Separate tracking for buy-side and sell-side toxicity
     """
+
+    __slots__ = (
+        "_lookback",
+        "_measurement_bars",
+        "_ema_alpha",
+        "_high",
+        "_medium",
+        "_low",
+        "_pending_fills",
+        "_completed_fills",
+        "_buy_toxicity",
+        "_sell_toxicity",
+        "_overall_toxicity",
+        "_bar_count",
+        "_fills_measured",
+    )
     
     def __init__(
         self,
@@ -85,8 +102,8 @@ class ToxicityDetector:
             fill_price=fill_price,
             mid_at_fill=mid_price,
             size=size,
+            _fill_bar=self._bar_count,
         )
-        record._fill_bar = self._bar_count
         self._pending_fills.append(record)
     
     def on_bar(self, mid_price: float, atr: float = 0.0):
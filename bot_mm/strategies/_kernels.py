@@ -0,0 +1,79 @@
+"""
+Strategy Kernels — compiled ring-buffer statistics for the quote loop.
+
+Rolling windows are stored as a fixed float64 ring buffer plus running
+(sum, sum_sq) accumulators per window, so pushing a value and reading a
+window's mean / std are O(1). The functions take plain NumPy arrays and
+scalars so they can be compiled with Numba (nopython, cached to disk);
+without Numba installed they run as ordinary Python with identical results.
+"""
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (bare or parametrized use)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def push_window(buf, idx, count, windows, sums, sumsqs, value):
+    """
+    Push `value` into the ring buffer and update every window's running sums.
+
+    Args:
+        buf: float64 ring buffer; its length is the largest window.
+        idx: Next write slot in buf.
+        count: Values recorded so far (saturates at len(buf)).
+        windows: int64 array of window lengths, each <= len(buf).
+        sums, sumsqs: float64 arrays (one slot per window), updated in place.
+        value: New sample.
+
+    Returns:
+        (idx, count) after the push. Sums are rebuilt exactly from the buffer
+        whenever the ring wraps, bounding floating-point drift.
+    """
+    cap = buf.shape[0]
+    for k in range(windows.shape[0]):
+        w = windows[k]
+        if count >= w:
+            old = buf[(idx - w + cap) % cap]
+            sums[k] -= old
+            sumsqs[k] -= old * old
+        sums[k] += value
+        sumsqs[k] += value * value
+
+    buf[idx] = value
+    idx = (idx + 1) % cap
+    if count < cap:
+        count += 1
+
+    if idx == 0:
+        for k in range(windows.shape[0]):
+            n = min(windows[k], count)
+            s = 0.0
+            sq = 0.0
+            for i in range(cap - n, cap):
+                v = buf[i]
+                s += v
+                sq += v * v
+            sums[k] = s
+            sumsqs[k] = sq
+
+    return idx, count
+
+
+@njit(cache=True)
+def rolling_std(sum_, sumsq, n):
+    """Sample std (ddof=1) from running sums; negative variance clamped to 0."""
+    if n < 2:
+        return 0.0
+    var = (sumsq - sum_ * sum_ / n) / (n - 1)
+    if var < 0.0:
+        var = 0.0
+    return var ** 0.5
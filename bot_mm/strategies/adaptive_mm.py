@@ -3,6 +3,9 @@ Adaptive Market Making Strategy — volatility-aware spread and size management.
 
 Extends BasicMMStrategy with:
 1. Volatility regime detection (LOW / NORMAL / HIGH) using 3 rolling windows
+   (returns kept in a fixed ring buffer with running sum / sum-of-squares per
+   window, so each rolling std is O(1) per tick; kernels in _kernels.py are
+   Numba-compiled when available)
 2. Spread & size adaptation per regime
 3. Fill rate tracking (adverse selection detection)
 4. Inventory decay (age-based spread widening to incentivize mean-reversion)
@@ -11,38 +14,34 @@ Extends BasicMMStrategy with:
 import logging
 import time
 from collections import deque
-from enum import Enum
-from typing import List
+from enum import IntEnum
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
 
 from bot_mm.config import AssetMMConfig
 from bot_mm.core.quoter import Quote
+from bot_mm.core.risk import RiskStatus
 from bot_mm.exchanges.base_mm import BaseMMExchange
+from bot_mm.strategies._kernels import push_window, rolling_std
 from bot_mm.strategies.basic_mm import BasicMMStrategy
 
 logger = logging.getLogger(__name__)
 
 
-class VolRegime(str, Enum):
-    LOW = "low"
-    NORMAL = "normal"
-    HIGH = "high"
+class VolRegime(IntEnum):
+    LOW = 0
+    NORMAL = 1
+    HIGH = 2
 
 
 # Regime detection thresholds
 LOW_VOL_RATIO = 0.7    # short_vol < 0.7 * long_vol → LOW
 HIGH_VOL_RATIO = 1.5   # short_vol > 1.5 * long_vol → HIGH
 
-# Spread/size multipliers per regime
-REGIME_SPREAD_MULT = {
-    VolRegime.LOW: 0.7,
-    VolRegime.NORMAL: 1.0,
-    VolRegime.HIGH: 1.5,
-}
-REGIME_SIZE_MULT = {
-    VolRegime.LOW: 1.3,
-    VolRegime.NORMAL: 1.0,
-    VolRegime.HIGH: 0.6,
-}
+# Spread/size multipliers per regime, indexed by VolRegime (LOW, NORMAL, HIGH)
+REGIME_SPREAD_MULT = (0.7, 1.0, 1.5)
+REGIME_SIZE_MULT = (1.3, 1.0, 0.6)
 
 # Fill rate thresholds
 FILL_RATE_TOO_LOW = 0.20   # < 20% → spreads too wide, tighten
@@ -57,6 +56,54 @@ DEFAULT_INVENTORY_DECAY_CANDLES = 30  # Start widening after this many candles
 INVENTORY_DECAY_MAX_MULT = 1.4        # Max widen multiplier on stale side
 
 
+def _make_adjuster(
+    decay_candles: int,
+    decay_max_mult: float = INVENTORY_DECAY_MAX_MULT,
+    rate_too_low: float = FILL_RATE_TOO_LOW,
+    rate_too_high: float = FILL_RATE_TOO_HIGH,
+    rate_spread_adj: float = FILL_RATE_SPREAD_ADJ,
+    min_fill_cycles: int = 5,
+) -> Callable[[float, int, int, int, int], Tuple[float, float, float]]:
+    """
+    Build the per-cycle spread adjuster with all constants bound at construction.
+
+    The returned function maps (inventory_usd, inventory_unchanged_count,
+    total_fills, total_quotes, fill_cycles) to
+    (fill_rate_mult, buy_decay_mult, sell_decay_mult).
+    """
+    tighten = 1.0 - rate_spread_adj
+    widen_fill = 1.0 + rate_spread_adj
+    decay_span = decay_max_mult - 1.0
+
+    def adjust(
+        inventory_usd: float,
+        unchanged_count: int,
+        total_fills: int,
+        total_quotes: int,
+        fill_cycles: int,
+    ) -> Tuple[float, float, float]:
+        # Fill rate: < low → tighten, > high → widen (needs min_fill_cycles of data)
+        fill_mult = 1.0
+        if fill_cycles >= min_fill_cycles:
+            rate = total_fills / total_quotes if total_quotes else 0.0
+            if rate < rate_too_low:
+                fill_mult = tighten
+            elif rate > rate_too_high:
+                fill_mult = widen_fill
+
+        # Inventory decay: widen the side that adds to a stale position
+        if unchanged_count < decay_candles:
+            return fill_mult, 1.0, 1.0
+        widen = 1.0 + min((unchanged_count - decay_candles) / decay_candles, 1.0) * decay_span
+        if inventory_usd > 0:
+            return fill_mult, widen, 1.0   # Long → widen buys (discourage adding)
+        if inventory_usd < 0:
+            return fill_mult, 1.0, widen   # Short → widen sells (discourage adding)
+        return fill_mult, 1.0, 1.0
+
+    return adjust
+
+
 class AdaptiveMMStrategy(BasicMMStrategy):
     """
     Adaptive market making: adjusts spreads and sizes based on
@@ -78,41 +125,96 @@ class AdaptiveMMStrategy(BasicMMStrategy):
         self.vol_window_short = vol_window_short
         self.vol_window_medium = vol_window_medium
         self.vol_window_long = vol_window_long
-        self._returns: deque = deque(maxlen=vol_window_long)
         self._regime = VolRegime.NORMAL
+        # Window vols from the last detect_regime() call
+        self._short_vol_v: float = 0.0
+        self._medium_vol_v: float = 0.0
+        self._long_vol_v: float = 0.0
+
+        # Ring buffer of the last `vol_window_long` returns plus running
+        # (sum, sum_sq) per tracked window — index 0/1/2 = short/medium/long
+        self._returns = np.zeros(vol_window_long, dtype=np.float64)
+        self._ret_idx: int = 0     # next write slot
+        self._ret_count: int = 0   # returns recorded so far (saturates at ring size)
+        self._vol_windows = np.array(
+            [min(w, vol_window_long)
+             for w in (vol_window_short, vol_window_medium, vol_window_long)],
+            dtype=np.int64,
+        )
+        self._win_sum = np.zeros(3, dtype=np.float64)
+        self._win_sumsq = np.zeros(3, dtype=np.float64)
 
         # Fill rate tracking (rolling window of cycles)
         self._fill_events: deque = deque(maxlen=FILL_TRACK_WINDOW)
         self._quotes_placed_count: deque = deque(maxlen=FILL_TRACK_WINDOW)
+        self._total_fills: int = 0    # running sum of _fill_events
+        self._total_quotes: int = 0   # running sum of _quotes_placed_count
 
         # Inventory decay — track when inventory last changed direction
         self._inventory_decay_candles = inventory_decay_candles
         self._inventory_unchanged_count: int = 0
         self._last_inventory_sign: int = 0  # -1, 0, +1
 
+        # Fill-rate + inventory-decay multipliers with thresholds pre-bound
+        self._compute_adjustments = _make_adjuster(inventory_decay_candles)
+
+        # Last non-CRITICAL quote set and the inputs it was built from
+        self._quote_cache_key: Optional[tuple] = None
+        self._cached_filtered: List[Quote] = []
+
     # ── Volatility regime ───────────────────────────────────
 
     def _record_return(self, mid_price: float):
-        """Record a price return for regime detection."""
-        if self._last_mid is not None and self._last_mid > 0:
-            ret = (mid_price - self._last_mid) / self._last_mid
-            self._returns.append(ret)
+        """Record a price return for regime detection (O(1), see _kernels.push_window)."""
+        if self._last_mid is None or self._last_mid <= 0:
+            return
+
+        ret = (mid_price - self._last_mid) / self._last_mid
+        self._ret_idx, self._ret_count = push_window(
+            self._returns, self._ret_idx, self._ret_count,
+            self._vol_windows, self._win_sum, self._win_sumsq, ret,
+        )
+
+    def _recent_segments(self, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Last n recorded returns as two ring-buffer views (no copy), oldest first."""
+        idx = self._ret_idx
+        if n <= idx:
+            return self._returns[idx - n:idx], self._returns[:0]
+        return self._returns[idx - n:], self._returns[:idx]
 
     def _calc_rolling_vol(self, window: int) -> float:
         """Standard deviation of recent returns over the given window."""
-        n = min(window, len(self._returns))
+        n = min(window, self._ret_count)
         if n < 2:
             return 0.0
-        recent = list(self._returns)[-n:]
-        mean = sum(recent) / n
-        var = sum((r - mean) ** 2 for r in recent) / (n - 1)
-        return var ** 0.5
+
+        # Tracked window k covers the last min(w, count) returns
+        for k, w in enumerate(self._vol_windows):
+            if min(w, self._ret_count) == n:
+                return rolling_std(self._win_sum[k], self._win_sumsq[k], n)
+
+        head, tail = self._recent_segments(n)
+        sum_ = float(head.sum() + tail.sum())
+        sumsq = float(np.dot(head, head) + np.dot(tail, tail))
+        return rolling_std(sum_, sumsq, n)
 
     def detect_regime(self) -> VolRegime:
-        """Classify volatility regime using short vs long rolling vol."""
+        """Classify volatility regime using short vs long rolling vol.
+
+        Also caches all three window vols for the short/medium/long_vol
+        properties, so logged values match the regime decision.
+        """
         short_vol = self._calc_rolling_vol(self.vol_window_short)
         long_vol = self._calc_rolling_vol(self.vol_window_long)
-
+        self._short_vol_v = short_vol
+        self._medium_vol_v = self._calc_rolling_vol(self.vol_window_medium)
+        self._long_vol_v = long_vol
+        return self._classify_regime()
+
+    def _classify_regime(self) -> VolRegime:
+        """Set the regime from the cached short/long window vols."""
+        short_vol = self._short_vol_v
+        long_vol = self._long_vol_v
         if long_vol <= 0:
             self._regime = VolRegime.NORMAL
         elif short_vol < LOW_VOL_RATIO * long_vol:
@@ -124,51 +226,85 @@ class AdaptiveMMStrategy(BasicMMStrategy):
 
         return self._regime
 
+    def _update_market_stats(self, mid_price: float) -> VolRegime:
+        """
+        Per-tick fusion of _record_return, _update_volatility and detect_regime.
+
+        The price change is computed once and pushed into both ring buffers
+        (returns and tick ranges); the three window vols are then read
+        straight from the running sums, with no per-window lookup.
+        """
+        last = self._last_mid
+        if last is not None and last > 0:
+            dm = mid_price - last
+            self._ret_idx, self._ret_count = push_window(
+                self._returns, self._ret_idx, self._ret_count,
+                self._vol_windows, self._win_sum, self._win_sumsq, dm / last,
+            )
+            self._range_idx, self._range_count = push_window(
+                self._tick_ranges, self._range_idx, self._range_count,
+                self._range_windows, self._range_sum, self._range_sumsq,
+                abs(dm),
+            )
+
+        if self._range_count >= 3:
+            avg_range = float(self._range_sum[0]) / self._range_count
+            self._volatility_pct = max(avg_range / mid_price, 0.0001)
+
+        count = self._ret_count
+        windows = self._vol_windows
+        sums = self._win_sum
+        sumsqs = self._win_sumsq
+        self._short_vol_v = rolling_std(sums[0], sumsqs[0], min(windows[0], count))
+        self._medium_vol_v = rolling_std(sums[1], sumsqs[1], min(windows[1], count))
+        self._long_vol_v = rolling_std(sums[2], sumsqs[2], min(windows[2], count))
+        return self._classify_regime()
+
     @property
     def regime(self) -> VolRegime:
         return self._regime
 
     @property
     def short_vol(self) -> float:
-        return self._calc_rolling_vol(self.vol_window_short)
+        return self._short_vol_v
 
     @property
     def medium_vol(self) -> float:
-        return self._calc_rolling_vol(self.vol_window_medium)
+        return self._medium_vol_v
 
     @property
     def long_vol(self) -> float:
-        return self._calc_rolling_vol(self.vol_window_long)
+        return self._long_vol_v
 
     # ── Fill rate tracking ──────────────────────────────────
 
     def record_fills(self, num_fills: int, num_quotes: int):
         """Record fill and quote counts for one cycle."""
+        num_quotes = max(num_quotes, 1)
+        if len(self._fill_events) == FILL_TRACK_WINDOW:
+            # Oldest cycle is about to be evicted by the bounded deques
+            self._total_fills -= self._fill_events[0]
+            self._total_quotes -= self._quotes_placed_count[0]
         self._fill_events.append(num_fills)
-        self._quotes_placed_count.append(max(num_quotes, 1))
+        self._quotes_placed_count.append(num_quotes)
+        self._total_fills += num_fills
+        self._total_quotes += num_quotes
 
     @property
     def fill_rate(self) -> float:
         """Rolling fill rate: total fills / total quotes placed."""
-        total_fills = sum(self._fill_events)
-        total_quotes = sum(self._quotes_placed_count)
-        if total_quotes == 0:
+        if self._total_quotes == 0:
             return 0.0
-        return total_fills / total_quotes
+        return self._total_fills / self._total_quotes
 
     def _fill_rate_spread_adj(self) -> float:
         """
         Spread multiplier based on fill rate.
         < 20% → tighten (mult < 1), > 60% → widen (mult > 1).
         """
-        rate = self.fill_rate
-        if len(self._fill_events) < 5:
-            return 1.0  # Not enough data
-        if rate < FILL_RATE_TOO_LOW:
-            return 1.0 - FILL_RATE_SPREAD_ADJ  # Tighten
-        if rate > FILL_RATE_TOO_HIGH:
-            return 1.0 + FILL_RATE_SPREAD_ADJ  # Widen
-        return 1.0
+        return self._compute_adjustments(
+            0.0, 0, self._total_fills, self._total_quotes, len(self._fill_events),
+        )[0]
 
     # ── Inventory decay ─────────────────────────────────────
 
@@ -179,7 +315,7 @@ class AdaptiveMMStrategy(BasicMMStrategy):
             self._last_inventory_sign = 0
             return
 
-        current_sign = 1 if inventory_usd > 0 else -1
+        current_sign = (inventory_usd > 0) - (inventory_usd < 0)
         if current_sign == self._last_inventory_sign:
             self._inventory_unchanged_count += 1
         else:
@@ -196,23 +332,10 @@ class AdaptiveMMStrategy(BasicMMStrategy):
 
         Returns a spread multiplier for the given side.
         """
-        if self._inventory_unchanged_count < self._inventory_decay_candles:
-            return 1.0
-
-        decay_progress = min(
-            (self._inventory_unchanged_count - self._inventory_decay_candles)
-            / self._inventory_decay_candles,
-            1.0,
+        _, buy_mult, sell_mult = self._compute_adjustments(
+            inventory_usd, self._inventory_unchanged_count, 0, 0, 0,
         )
-        widen = 1.0 + decay_progress * (INVENTORY_DECAY_MAX_MULT - 1.0)
-
-        # Widen the side that adds to inventory (discourage), keep reducing side normal
-        if inventory_usd > 0 and side == "buy":
-            return widen  # Long → widen buys (discourage adding)
-        if inventory_usd < 0 and side == "sell":
-            return widen  # Short → widen sells (discourage adding)
-
-        return 1.0
+        return buy_mult if side == "buy" else sell_mult
 
     # ── Quote adjustment ────────────────────────────────────
 
@@ -226,44 +349,54 @@ class AdaptiveMMStrategy(BasicMMStrategy):
         1. Regime-based spread/size scaling
         2. Fill-rate-based spread correction
         3. Inventory decay per-side widening
+
+        Quotes are updated in place (price, size) and the same list is returned.
         """
-        regime = self._regime
-        regime_spread = REGIME_SPREAD_MULT[regime]
-        regime_size = REGIME_SIZE_MULT[regime]
-        fill_adj = self._fill_rate_spread_adj()
+        buy_mult, sell_mult, size_mult = self._side_multipliers(inventory_usd)
 
-        adjusted = []
         for q in quotes:
-            # Compute target spread offset from mid
+            # Scale offset from mid by regime + fill rate + inventory decay
             if q.side == "buy":
-                raw_offset = mid_price - q.price
+                q.price = mid_price - (mid_price - q.price) * buy_mult
             else:
-                raw_offset = q.price - mid_price
-
-            # Scale offset by regime + fill rate
-            new_offset = raw_offset * regime_spread * fill_adj
+                q.price = mid_price + (q.price - mid_price) * sell_mult
+            q.size *= size_mult
 
-            # Inventory decay per-side
-            decay = self._inventory_decay_mult(q.side, inventory_usd)
-            new_offset *= decay
+        return quotes
 
-            # Rebuild price
-            if q.side == "buy":
-                new_price = mid_price - new_offset
-            else:
-                new_price = mid_price + new_offset
+    def adjust_quote_arrays(
+        self,
+        prices: np.ndarray,
+        sizes: np.ndarray,
+        is_buy: np.ndarray,
+        mid_price: float,
+        inventory_usd: float,
+        multipliers: Optional[Tuple[float, float, float]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized adjust_quotes() over QuoteEngine.calculate_quotes_arrays() output.
 
-            # Scale size by regime
-            new_size = q.size * regime_size
+        Returns new (prices, sizes) arrays; inputs are left untouched.
+        `multipliers` may pass a precomputed _side_multipliers() result.
+        """
+        buy_mult, sell_mult, size_mult = multipliers or self._side_multipliers(inventory_usd)
+        spread_mult = np.where(is_buy, buy_mult, sell_mult)
+        return mid_price + (prices - mid_price) * spread_mult, sizes * size_mult
 
-            adjusted.append(Quote(
-                price=new_price,
-                size=new_size,
-                side=q.side,
-                level=q.level,
-            ))
+    def _side_multipliers(self, inventory_usd: float) -> Tuple[float, float, float]:
+        """
+        Return (buy_spread_mult, sell_spread_mult, size_mult) for this cycle.
 
-        return adjusted
+        Regime, fill-rate and inventory-decay factors depend only on the
+        quote side, so they are combined once per cycle rather than per quote.
+        """
+        regime = self._regime
+        fill_mult, decay_buy, decay_sell = self._compute_adjustments(
+            inventory_usd, self._inventory_unchanged_count,
+            self._total_fills, self._total_quotes, len(self._fill_events),
+        )
+        base_mult = REGIME_SPREAD_MULT[regime] * fill_mult
+        return base_mult * decay_buy, base_mult * decay_sell, REGIME_SIZE_MULT[regime]
 
     # ── Main iteration override ─────────────────────────────
 
@@ -272,48 +405,47 @@ class AdaptiveMMStrategy(BasicMMStrategy):
         self._iteration += 1
 
         # Hot reload params from daily reoptimizer
-        if self._iteration - self._last_params_check >= self._params_check_interval:
-            self._check_param_reload()
-            self._last_params_check = self._iteration
+        self._maybe_reload_params()
 
-        # 1. Get mid price
-        mid_price = await self.exchange.get_mid_price(self.symbol)
+        # 1. Get mid price; last cycle's orders are checked for fills concurrently
+        old_fills = self.order_mgr.total_fills
+        mid_price = await self._fetch_mid_and_fills()
         if mid_price <= 0:
             logger.warning("Invalid mid price: %.2f", mid_price)
             return
 
-        # 2. Record return for regime detection
-        self._record_return(mid_price)
-
-        # 3. Detect large moves
+        # 2. Detect large moves
         if self._last_mid is not None:
-            move_pct = (mid_price - self._last_mid) / self._last_mid * 100
-            if abs(move_pct) > 0.5:
+            # |move| > 0.5% tested without a divide; move_pct only on alarm
+            dm = mid_price - self._last_mid
+            thr = 0.005 * self._last_mid
+            if dm > thr or dm < -thr:
+                move_pct = dm / self._last_mid * 100
                 self.risk.on_large_move(move_pct)
                 logger.warning("Large move detected: %+.2f%%", move_pct)
 
-        # 4. Update volatility (parent's ATR-based)
-        self._update_volatility(mid_price)
-
-        # 5. Detect regime
-        self.detect_regime()
+        # 3-5. Record return, update ATR volatility, detect regime (fused)
+        self._update_market_stats(mid_price)
 
-        # 6. Update unrealized PnL
-        self.inventory.update_unrealized(mid_price)
+        # 6. Update unrealized PnL (unchanged if neither mid nor position moved)
+        if mid_price != self._last_mid or self.inventory.dirty:
+            self.inventory.update_unrealized(mid_price)
 
         # 7. Check risk limits
-        equity = self.config.capital_usd + self.inventory.total_pnl
-        position_usd = abs(self.inventory.state.position_size * mid_price)
+        # Fixed for the rest of the cycle (nothing awaits before the order update)
+        inv = self.inventory
+        position = inv.state.position_size
+        pnl = inv.total_pnl
+        vol = self._volatility_pct
+        max_pos = self.config.risk.max_position_usd
         risk_status = self.risk.check_all(
-            daily_pnl=self.inventory.total_pnl,
-            equity=equity,
-            current_vol=self._volatility_pct,
-            position_usd=position_usd,
-            max_position_usd=self.config.risk.max_position_usd,
+            daily_pnl=pnl,
+            equity=self.config.capital_usd + pnl,
+            current_vol=vol,
+            position_usd=abs(position * mid_price),
+            max_position_usd=max_pos,
         )
 
-        from bot_mm.core.risk import RiskStatus
-
         if risk_status == RiskStatus.HALT:
             if self.order_mgr.num_active > 0:
                 logger.warning("RISK HALT: %s — cancelling orders", self.risk.state.reason)
@@ -321,56 +453,62 @@ class AdaptiveMMStrategy(BasicMMStrategy):
             return
 
         # 8. Update baseline volatility
-        self.risk.update_normal_vol(self._volatility_pct)
-
-        # 9. Generate raw quotes
-        inventory_usd = self.inventory.state.position_size * mid_price
-        quotes = self.quoter.calculate_quotes(
-            mid_price=mid_price,
-            volatility_pct=self._volatility_pct,
-            inventory_usd=inventory_usd,
-            max_position_usd=self.config.risk.max_position_usd,
-        )
+        self.risk.update_normal_vol(vol)
 
-        # 10. Apply adaptive adjustments
-        quotes = self.adjust_quotes(quotes, mid_price, inventory_usd)
+        # 9-12. Build quotes — reused as-is when every input matches last cycle
+        inventory_usd = position * mid_price
+        multipliers = self._side_multipliers(inventory_usd)
+        quote_key = (mid_price, vol, inventory_usd,
+                     multipliers, self._params_version)
 
-        # 11. Track inventory age
-        self._update_inventory_age(inventory_usd)
+        if quote_key == self._quote_cache_key and risk_status != RiskStatus.CRITICAL:
+            filtered = self._cached_filtered
+            self._update_inventory_age(inventory_usd)
+        else:
+            # 9. Generate raw quotes (as arrays — adjusted before any Quote is built)
+            prices, sizes, is_buy, levels = self.quoter.calculate_quotes_arrays(
+                mid_price=mid_price,
+                volatility_pct=vol,
+                inventory_usd=inventory_usd,
+                max_position_usd=max_pos,
+            )
 
-        # 12. Filter paused sides
-        filtered = []
-        for q in quotes:
-            if self.inventory.should_pause_side(q.side, mid_price):
-                continue
-            filtered.append(q)
+            # 10. Apply adaptive adjustments
+            prices, sizes = self.adjust_quote_arrays(
+                prices, sizes, is_buy, mid_price, inventory_usd, multipliers,
+            )
+            quotes = self.quoter.quotes_from_arrays(prices, sizes, is_buy, levels)
+
+            # 11. Track inventory age
+            self._update_inventory_age(inventory_usd)
+
+            # 12. Filter paused sides
+            pause_buy = inv.should_pause_side("buy", mid_price)
+            pause_sell = inv.should_pause_side("sell", mid_price)
+            if pause_buy or pause_sell:
+                filtered = [q for q in quotes
+                            if not (pause_buy if q.side == "buy" else pause_sell)]
+            else:
+                filtered = quotes
+
+            # Emergency widening below mutates quotes, so CRITICAL sets aren't cached
+            if risk_status == RiskStatus.CRITICAL:
+                self._quote_cache_key = None
+            else:
+                self._quote_cache_key = quote_key
+                self._cached_filtered = filtered
 
         # 13. Emergency spread widening
         if risk_status == RiskStatus.CRITICAL:
+            k = self.config.risk.emergency_spread_mult * 1e-4
+            buy_factor = 1.0 - k
+            sell_factor = 1.0 + k
             for q in filtered:
-                if q.side == "buy":
-                    q.price *= (1 - self.config.risk.emergency_spread_mult * 0.0001)
-                else:
-                    q.price *= (1 + self.config.risk.emergency_spread_mult * 0.0001)
+                q.price *= buy_factor if q.side == "buy" else sell_factor
 
-        # 14. Track fills vs quotes for fill rate
-        old_fills = self.order_mgr.total_fills
+        # 14. Update orders, track fills (booked in step 1) vs quotes for fill rate
         await self.order_mgr.update_quotes(filtered)
-
-        # Detect fills via per-order tracking (supports partial fills)
-        fills = await self.order_mgr.check_partial_fills(
-            mid_price, maker_fee=self.config.maker_fee
-        )
-        for side, price, size in fills:
-            realized = self.inventory.on_fill(side, price, size,
-                                              price * size * self.config.maker_fee)
-            if self._toxicity is not None:
-                self._toxicity.on_fill(side, price, price, size)
-            logger.info(
-                "FILL %s | %s %.6f @ %.2f | realized=$%.2f | pos=%.6f | net_pnl=$%.2f",
-                self.symbol, side.upper(), size, price,
-                realized, self.inventory.state.position_size, self.inventory.net_pnl,
-            )
+        self._maybe_reconcile()
 
         new_fills = self.order_mgr.total_fills - old_fills
         self.record_fills(new_fills, len(filtered))
@@ -383,12 +521,14 @@ class AdaptiveMMStrategy(BasicMMStrategy):
 
     def _log_adaptive_status(self, mid_price: float):
         """Log status with adaptive strategy details."""
-        uptime = time.time() - self._start_time
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        uptime = time.monotonic() - self._start_mono
         logger.info(
             "ADAPTIVE %s | mid=%.2f | regime=%s | vol_s=%.6f vol_l=%.6f | "
             "fill_rate=%.1f%% | inv_age=%d | pos=%.6f ($%.2f) | "
             "pnl=$%.2f | uptime=%.0fs",
-            self.symbol, mid_price, self._regime.value,
+            self.symbol, mid_price, self._regime.name.lower(),
             self.short_vol, self.long_vol,
             self.fill_rate * 100, self._inventory_unchanged_count,
             self.inventory.state.position_size,
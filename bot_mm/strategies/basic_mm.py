@@ -8,28 +8,77 @@ Loop (every ~1s):
 4. Check risk limits
 5. Update orders on exchange
 6. Track fills and inventory
+
+Hot reload: live_params.json is watched with watchdog (inotify) when it is
+installed, so the loop only checks a flag; otherwise its mtime is polled
+every _params_check_interval iterations.
 """
 
 import asyncio
 import json
 import logging
+import os
 import time
-from collections import deque
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
+
 from bot_mm.config import AssetMMConfig
 from bot_mm.core.inventory import InventoryManager
 from bot_mm.core.order_manager import OrderManager
 from bot_mm.core.quoter import QuoteEngine
 from bot_mm.core.risk import RiskManager, RiskStatus
+from bot_mm.core.signals import DirectionalBias
 from bot_mm.exchanges.base_mm import BaseMMExchange
+from bot_mm.ml.toxicity import ToxicityDetector
+from bot_mm.strategies._kernels import push_window
+from bot_mm.utils.logger import LazyStr
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
 
 logger = logging.getLogger(__name__)
 
 # Rolling window for volatility estimation
 VOL_WINDOW = 20
 
+# Session summary logged on shutdown (%-style args, see _log_summary)
+_SUMMARY_TEMPLATE = (
+    "\n╔══════════════════════════════════════════╗\n"
+    "║  SESSION SUMMARY — %s\n"
+    "╠══════════════════════════════════════════╣\n"
+    "║  Duration:    %.0f seconds\n"
+    "║  Iterations:  %d\n"
+    "║  Fills:       %d buys, %d sells\n"
+    "║  Round trips: %d\n"
+    "║  Volume:      $%.2f\n"
+    "║  Realized:    $%.4f\n"
+    "║  Fees:        $%.4f\n"
+    "║  Net PnL:     $%.4f\n"
+    "║  Final pos:   %.6f\n"
+    "║  %s\n"
+    "╚══════════════════════════════════════════╝"
+)
+
+
+class _ParamsFileHandler(FileSystemEventHandler):
+    """Marks the strategy's params dirty when live_params.json changes on disk."""
+
+    def __init__(self, strategy: "BasicMMStrategy"):
+        super().__init__()
+        self._strategy = strategy
+        self._name = strategy._live_params_file.name
+
+    def on_any_event(self, event):
+        paths = (event.src_path, getattr(event, "dest_path", ""))
+        if any(Path(os.fsdecode(p)).name == self._name for p in paths if p):
+            self._strategy._params_dirty = True
+
 
 class BasicMMStrategy:
     """
@@ -39,6 +88,22 @@ class BasicMMStrategy:
     for position tracking, and RiskManager for circuit breakers.
     """
 
+    # Subclasses that don't declare __slots__ (AdaptiveMMStrategy) keep a
+    # __dict__ for their own state; these attributes stay slot-backed.
+    __slots__ = (
+        "exchange", "config", "symbol",
+        "quoter", "inventory", "risk", "order_mgr",
+        "_tick_ranges", "_range_idx", "_range_count",
+        "_range_windows", "_range_sum", "_range_sumsq",
+        "_last_mid", "_volatility_pct",
+        "_quote_inputs", "_cached_quotes",
+        "_reconcile_every", "_reconcile_task",
+        "_running", "_iteration", "_start_mono",
+        "_bias", "_current_bias", "_hour_bucket", "_toxicity",
+        "_live_params_file", "_last_params_mtime", "_params_check_interval",
+        "_last_params_check", "_params_version", "_params_observer", "_params_dirty",
+    )
+
     def __init__(
         self,
         exchange: BaseMMExchange,
@@ -66,26 +131,39 @@ class BasicMMStrategy:
             on_fill=self._handle_fill,
         )
 
-        # Volatility estimation (rolling high-low range as ATR proxy)
-        self._price_highs: deque = deque(maxlen=VOL_WINDOW)
-        self._price_lows: deque = deque(maxlen=VOL_WINDOW)
+        # Volatility estimation (rolling high-low range as ATR proxy):
+        # ring buffer of per-tick ranges with a running sum
+        self._tick_ranges = np.zeros(VOL_WINDOW, dtype=np.float64)
+        self._range_idx: int = 0
+        self._range_count: int = 0
+        self._range_windows = np.array([VOL_WINDOW], dtype=np.int64)
+        self._range_sum = np.zeros(1, dtype=np.float64)
+        self._range_sumsq = np.zeros(1, dtype=np.float64)
         self._last_mid: Optional[float] = None
         self._volatility_pct: float = 0.001  # Default 0.1%
 
+        # Position reconciliation against the exchange (fills are booked
+        # from OrderManager callbacks; this only catches drift)
+        self._reconcile_every: int = 60  # iterations
+        self._reconcile_task: Optional[asyncio.Task] = None
+
+        # Last plain (unadjusted) quote set and the inputs it was built from
+        self._quote_inputs: Optional[tuple] = None
+        self._cached_quotes: list = []
+
         # State
         self._running = False
         self._iteration = 0
-        self._start_time: float = 0.0
+        self._start_mono: float = 0.0  # time.monotonic() at start(); uptime base
 
         # Directional bias (Kalman+QQE)
         self._bias = None
         self._current_bias: float = 0.0
-        self._last_hour: Optional[int] = None
+        self._hour_bucket: int = int(time.time()) // 3600  # hours since epoch (UTC)
 
         # Toxicity detector
         self._toxicity = None
         if getattr(config, 'use_toxicity', False):
-            from bot_mm.ml.toxicity import ToxicityDetector
             self._toxicity = ToxicityDetector()
 
         # Hot reload: check live_params.json periodically
@@ -93,9 +171,11 @@ class BasicMMStrategy:
         self._last_params_mtime: float = 0.0
         self._params_check_interval: int = 3600  # check every hour (in iterations)
         self._last_params_check: int = 0
+        self._params_version: int = 0  # bumped on every applied hot reload
+        self._params_observer = None    # watchdog Observer while running
+        self._params_dirty: bool = True  # set by the observer on file change
 
         if config.bias.enabled:
-            from bot_mm.core.signals import DirectionalBias
             self._bias = DirectionalBias(
                 kalman_process_noise=config.bias.kalman_process_noise,
                 kalman_measurement_noise=config.bias.kalman_measurement_noise,
@@ -109,7 +189,7 @@ class BasicMMStrategy:
     async def start(self):
         """Main loop — runs until stop() is called."""
         self._running = True
-        self._start_time = time.time()
+        self._start_mono = time.monotonic()
         interval_s = self.config.quote.quote_refresh_ms / 1000.0
 
         logger.info(
@@ -118,20 +198,29 @@ class BasicMMStrategy:
             self.config.quote.order_size_usd, interval_s,
         )
 
+        self._start_params_watch()
+        # Ticks are scheduled on a fixed grid (next_tick += interval) so cycle
+        # jitter doesn't accumulate. A short overrun keeps the grid (the next
+        # cycle just starts at once); falling a full interval behind resyncs.
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
         try:
             while self._running:
-                cycle_start = time.monotonic()
                 try:
                     await self.run_iteration()
                 except Exception:
                     logger.exception("Iteration %d failed", self._iteration)
                     self.risk.on_api_error()
 
-                elapsed = time.monotonic() - cycle_start
-                sleep_time = max(0, interval_s - elapsed)
-                if sleep_time > 0:
-                    await asyncio.sleep(sleep_time)
+                next_tick += interval_s
+                now = loop.time()
+                delay = next_tick - now
+                if delay < -interval_s:
+                    next_tick = now + interval_s  # skip missed ticks
+                    delay = interval_s
+                await asyncio.sleep(max(0.0, delay))
         finally:
+            self._stop_params_watch()
             await self._shutdown()
 
     async def stop(self):
@@ -142,6 +231,14 @@ class BasicMMStrategy:
     async def _shutdown(self):
         """Cancel all orders and log final stats."""
         logger.info("Shutting down — cancelling all orders for %s", self.symbol)
+        # Stop any background position check before orders are torn down
+        task, self._reconcile_task = self._reconcile_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
         await self.order_mgr.cancel_all()
         self._log_summary()
 
@@ -150,20 +247,21 @@ class BasicMMStrategy:
         self._iteration += 1
 
         # Hot reload params from daily reoptimizer
-        if self._iteration - self._last_params_check >= self._params_check_interval:
-            self._check_param_reload()
-            self._last_params_check = self._iteration
+        self._maybe_reload_params()
 
-        # 1. Get mid price
-        mid_price = await self.exchange.get_mid_price(self.symbol)
+        # 1. Get mid price; last cycle's orders are checked for fills concurrently
+        mid_price = await self._fetch_mid_and_fills()
         if mid_price <= 0:
             logger.warning("Invalid mid price: %.2f", mid_price)
             return
 
         # 2. Detect large moves
         if self._last_mid is not None:
-            move_pct = (mid_price - self._last_mid) / self._last_mid * 100
-            if abs(move_pct) > 0.5:
+            # |move| > 0.5% tested without a divide; move_pct only on alarm
+            dm = mid_price - self._last_mid
+            thr = 0.005 * self._last_mid
+            if dm > thr or dm < -thr:
+                move_pct = dm / self._last_mid * 100
                 self.risk.on_large_move(move_pct)
                 logger.warning("Large move detected: %+.2f%%", move_pct)
 
@@ -174,14 +272,18 @@ class BasicMMStrategy:
         self.inventory.update_unrealized(mid_price)
 
         # 5. Check risk limits
-        equity = self.config.capital_usd + self.inventory.total_pnl
-        position_usd = abs(self.inventory.state.position_size * mid_price)
+        # Fixed for the rest of the cycle (nothing awaits before the order update)
+        inv = self.inventory
+        position = inv.state.position_size
+        pnl = inv.total_pnl
+        vol = self._volatility_pct
+        max_pos = self.config.risk.max_position_usd
         risk_status = self.risk.check_all(
-            daily_pnl=self.inventory.total_pnl,
-            equity=equity,
-            current_vol=self._volatility_pct,
-            position_usd=position_usd,
-            max_position_usd=self.config.risk.max_position_usd,
+            daily_pnl=pnl,
+            equity=self.config.capital_usd + pnl,
+            current_vol=vol,
+            position_usd=abs(position * mid_price),
+            max_position_usd=max_pos,
         )
 
         if risk_status == RiskStatus.HALT:
@@ -191,78 +293,69 @@ class BasicMMStrategy:
             return
 
         # 6. Update baseline volatility
-        self.risk.update_normal_vol(self._volatility_pct)
-
-        # 6b. Update directional bias on hourly boundary
-        if self._bias is not None:
-            import datetime
-            current_hour = datetime.datetime.utcnow().hour
-            if self._last_hour is not None and current_hour != self._last_hour:
-                result = self._bias.update(mid_price)
-                if result is not None:
-                    self._current_bias = result.bias
-                # Update toxicity on hourly bar
+        self.risk.update_normal_vol(vol)
+
+        # 6b. Hourly bar: update directional bias and toxicity
+        if self._bias is not None or self._toxicity is not None:
+            new_bucket = int(time.time()) // 3600
+            if new_bucket != self._hour_bucket:
+                if self._bias is not None:
+                    result = self._bias.update(mid_price)
+                    if result is not None:
+                        self._current_bias = result.bias
                 if self._toxicity is not None:
                     self._toxicity.on_bar(mid_price)
-            self._last_hour = current_hour
-        elif self._toxicity is not None:
-            import datetime
-            current_hour = datetime.datetime.utcnow().hour
-            if self._last_hour is not None and current_hour != self._last_hour:
-                self._toxicity.on_bar(mid_price)
-            self._last_hour = current_hour
-
-        # 7. Generate quotes
-        inventory_usd = self.inventory.state.position_size * mid_price
-        quotes = self.quoter.calculate_quotes(
-            mid_price=mid_price,
-            volatility_pct=self._volatility_pct,
-            inventory_usd=inventory_usd,
-            max_position_usd=self.config.risk.max_position_usd,
-            directional_bias=self._current_bias,
-        )
+                self._hour_bucket = new_bucket
+
+        # 7. Generate quotes — last cycle's set is reused while the inputs stay
+        # within tolerance of those it was built from (plain quotes only;
+        # toxicity/emergency-adjusted sets are rebuilt every cycle)
+        inventory_usd = position * mid_price
+        pause_buy = inv.should_pause_side("buy", mid_price)
+        pause_sell = inv.should_pause_side("sell", mid_price)
+        toxic = self._toxicity is not None and self._toxicity.fills_measured > 10
+        critical = risk_status == RiskStatus.CRITICAL
+        inputs = (mid_price, vol, inventory_usd, self._current_bias,
+                  pause_buy, pause_sell, self._params_version)
+
+        if not (toxic or critical) and self._quotes_reusable(inputs):
+            logger.debug("Quote inputs unchanged for %s, reusing quotes", self.symbol)
+            filtered = self._cached_quotes
+        else:
+            # 8. Paused sides are not generated at all
+            prices, sizes, is_buy, levels = self.quoter.calculate_quotes_arrays(
+                mid_price=mid_price,
+                volatility_pct=vol,
+                inventory_usd=inventory_usd,
+                max_position_usd=max_pos,
+                directional_bias=self._current_bias,
+                skip_buy=pause_buy,
+                skip_sell=pause_sell,
+            )
 
-        # 8. Filter out sides that should be paused
-        filtered = []
-        for q in quotes:
-            if self.inventory.should_pause_side(q.side, mid_price):
-                continue
-            filtered.append(q)
-
-        # 8b. Toxicity-based spread adjustment
-        if self._toxicity is not None and self._toxicity.fills_measured > 10:
-            buy_mult, sell_mult = self._toxicity.get_side_multipliers()
-            for q in filtered:
-                if q.side == "buy":
-                    q.price = mid_price - (mid_price - q.price) * buy_mult
-                else:
-                    q.price = mid_price + (q.price - mid_price) * sell_mult
-
-        # 9. Widen spread if risk is elevated
-        if risk_status == RiskStatus.CRITICAL:
-            for q in filtered:
-                if q.side == "buy":
-                    q.price *= (1 - self.config.risk.emergency_spread_mult * 0.0001)
-                else:
-                    q.price *= (1 + self.config.risk.emergency_spread_mult * 0.0001)
+            # 8b-9. Toxicity-based spread adjustment, then emergency widening if
+            # risk is elevated — applied to the whole ladder before Quotes are built
+            if toxic or critical:
+                buy_mult, sell_mult = (
+                    self._toxicity.get_side_multipliers() if toxic else (1.0, 1.0)
+                )
+                k = self.config.risk.emergency_spread_mult * 1e-4 if critical else 0.0
+                spread_mult = np.where(is_buy, buy_mult, sell_mult)
+                price_factor = np.where(is_buy, 1.0 - k, 1.0 + k)
+                prices = (mid_price + (prices - mid_price) * spread_mult) * price_factor
+
+            filtered = self.quoter.quotes_from_arrays(prices, sizes, is_buy, levels)
+            if toxic or critical:
+                self._quote_inputs = None
+            else:
+                self._quote_inputs = inputs
+                self._cached_quotes = filtered
 
         # 10. Update orders on exchange
         await self.order_mgr.update_quotes(filtered)
 
-        # 11. Detect fills via per-order tracking (supports partial fills)
-        fills = await self.order_mgr.check_partial_fills(
-            mid_price, maker_fee=self.config.maker_fee
-        )
-        for side, price, size in fills:
-            realized = self.inventory.on_fill(side, price, size,
-                                              price * size * self.config.maker_fee)
-            if self._toxicity is not None:
-                self._toxicity.on_fill(side, price, price, size)
-            logger.info(
-                "FILL %s | %s %.6f @ %.2f | realized=$%.2f | pos=%.6f | net_pnl=$%.2f",
-                self.symbol, side.upper(), size, price,
-                realized, self.inventory.state.position_size, self.inventory.net_pnl,
-            )
+        # 11. Occasional position reconcile (fills were booked in step 1)
+        self._maybe_reconcile()
 
         # Periodic logging
         if self._iteration % 60 == 0:
@@ -270,6 +363,74 @@ class BasicMMStrategy:
 
         self._last_mid = mid_price
 
+    def _quotes_reusable(self, inputs: tuple) -> bool:
+        """True if `inputs` match those of the cached quote set within tolerance."""
+        last = self._quote_inputs
+        if last is None:
+            return False
+        mid, vol, inv_usd, bias, pause_buy, pause_sell, version = inputs
+        l_mid, l_vol, l_inv, l_bias, l_pause_buy, l_pause_sell, l_version = last
+        return (
+            version == l_version
+            and pause_buy == l_pause_buy and pause_sell == l_pause_sell
+            and abs(mid - l_mid) < mid * 1e-6
+            and abs(vol - l_vol) < 1e-7
+            and abs(inv_usd - l_inv) < 0.01
+            and abs(bias - l_bias) < 1e-4
+        )
+
+    async def _fetch_mid_and_fills(self) -> float:
+        """
+        Fetch the mid price while checking active orders for fills.
+
+        The two REST calls are independent, so they run concurrently. Fill
+        detection happens before this cycle places any orders, so the open-
+        orders snapshot covers exactly the orders being checked; fills are
+        booked via _handle_fill. Bounded by one refresh interval.
+        """
+        mid_price, _ = await asyncio.wait_for(
+            asyncio.gather(
+                self.exchange.get_mid_price(self.symbol),
+                self.order_mgr.check_partial_fills(
+                    self._last_mid or 0.0, maker_fee=self.config.maker_fee
+                ),
+            ),
+            timeout=self.config.quote.quote_refresh_ms / 1000.0,
+        )
+        return mid_price
+
+    def _start_params_watch(self):
+        """Watch live_params.json for changes (no-op without watchdog or data dir)."""
+        watch_dir = self._live_params_file.parent
+        if Observer is None or not watch_dir.is_dir():
+            return
+        try:
+            observer = Observer()
+            observer.schedule(_ParamsFileHandler(self), str(watch_dir), recursive=False)
+            observer.daemon = True
+            observer.start()
+        except Exception:
+            logger.warning("Params watcher unavailable, polling mtime instead", exc_info=True)
+            return
+        self._params_observer = observer
+        self._params_dirty = True
+
+    def _stop_params_watch(self):
+        """Stop the live_params.json watcher, if running."""
+        if self._params_observer is not None:
+            self._params_observer.stop()
+            self._params_observer = None
+
+    def _maybe_reload_params(self):
+        """Reload params on a watcher event, or every _params_check_interval iterations."""
+        if self._params_observer is not None:
+            if self._params_dirty:
+                self._params_dirty = False
+                self._check_param_reload()
+        elif self._iteration - self._last_params_check >= self._params_check_interval:
+            self._check_param_reload()
+            self._last_params_check = self._iteration
+
     def _check_param_reload(self):
         """Check if live_params.json has been updated and apply new params."""
         try:
@@ -309,6 +470,7 @@ class BasicMMStrategy:
                 self.quoter.params.vol_multiplier = new["vol_multiplier"]
 
             self._last_params_mtime = mtime
+            self._params_version += 1
             logger.info(
                 "HOT RELOAD %s | spread=%.1f->%.1f | skew=%.2f->%.2f | size=$%.0f->$%.0f",
                 self.symbol, old_spread, self.config.quote.base_spread_bps,
@@ -324,36 +486,74 @@ class BasicMMStrategy:
 
         Uses the spread between recent price extremes as a fraction
         of mid price. With only mid prices available, we approximate
-        high/low using price movement between ticks.
+        high/low using price movement between ticks. The window mean is
+        kept as a running sum over a ring buffer, so each tick is O(1).
         """
         if self._last_mid is not None:
-            tick_high = max(mid_price, self._last_mid)
-            tick_low = min(mid_price, self._last_mid)
-            self._price_highs.append(tick_high)
-            self._price_lows.append(tick_low)
+            self._range_idx, self._range_count = push_window(
+                self._tick_ranges, self._range_idx, self._range_count,
+                self._range_windows, self._range_sum, self._range_sumsq,
+                abs(mid_price - self._last_mid),
+            )
 
-        if len(self._price_highs) >= 3:
+        if self._range_count >= 3:
             # Average true range proxy: mean(high - low) / mid
-            ranges = [h - l for h, l in zip(self._price_highs, self._price_lows)]
-            avg_range = sum(ranges) / len(ranges)
+            avg_range = float(self._range_sum[0]) / self._range_count
             self._volatility_pct = max(avg_range / mid_price, 0.0001)
 
     def _handle_fill(self, oid: str, side: str, price: float, size: float, fee: float):
-        """Callback from OrderManager on fill events."""
-        logger.debug("OrderManager fill: oid=%s %s %.6f @ %.2f", oid, side, size, price)
+        """Callback from OrderManager on fill events: book inventory and toxicity."""
+        realized = self.inventory.on_fill(side, price, size, fee)
+        if self._toxicity is not None:
+            self._toxicity.on_fill(side, price, price, size)
+        logger.info(
+            "FILL %s | %s %.6f @ %.2f | realized=$%.2f | pos=%.6f | net_pnl=$%.2f",
+            self.symbol, side.upper(), size, price,
+            realized, self.inventory.state.position_size, self.inventory.net_pnl,
+        )
+
+    def _maybe_reconcile(self):
+        """Every _reconcile_every iterations, check the exchange position in the background."""
+        if self._iteration % self._reconcile_every:
+            return
+        if self._reconcile_task is not None and not self._reconcile_task.done():
+            return
+        self._reconcile_task = asyncio.create_task(self._reconcile_position())
+
+    async def _reconcile_position(self):
+        """Correct local inventory if it has drifted from the exchange position."""
+        fills_before = self.order_mgr.total_fills
+        try:
+            pos = await self.exchange.get_position(self.symbol)
+        except Exception:
+            logger.warning("Position reconcile failed for %s", self.symbol, exc_info=True)
+            return
+        if self.order_mgr.total_fills != fills_before:
+            return  # a fill landed while the request was in flight; retry next round
+
+        size = float(pos.get("size", 0.0))
+        exch_pos = -size if pos.get("side") == "short" else size
+        local_pos = self.inventory.state.position_size
+        if abs(exch_pos - local_pos) <= max(1e-9, 1e-6 * abs(exch_pos)):
+            return
+
+        logger.warning(
+            "POSITION DRIFT %s | local=%.6f exchange=%.6f — resyncing",
+            self.symbol, local_pos, exch_pos,
+        )
+        self.inventory.state.position_size = exch_pos
+        if exch_pos == 0.0:
+            self.inventory.state.avg_entry_price = 0.0
+        elif pos.get("entry_price"):
+            self.inventory.state.avg_entry_price = float(pos["entry_price"])
+        self.inventory.dirty = True
 
     def _log_status(self, mid_price: float):
         """Log periodic status update."""
-        uptime = time.time() - self._start_time
-        bias_str = ""
-        if self._bias is not None:
-            r = self._bias.last_result
-            regime = r.regime.name if r else "WARMUP"
-            bias_str = f" | bias={self._current_bias:+.3f} ({regime})"
-        tox_str = ""
-        if self._toxicity is not None and self._toxicity.fills_measured > 0:
-            s = self._toxicity.summary()
-            tox_str = f" | tox={s['avg_toxicity']:.3f} ({s['fills_measured']} fills)"
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        uptime = time.monotonic() - self._start_mono
+        # String-valued parts are built only if a handler formats the record
         logger.info(
             "STATUS %s | mid=%.2f | vol=%.4f%% | pos=%.6f ($%.2f) | "
             "pnl=$%.2f (realized=$%.2f) | %s%s%s | uptime=%.0fs",
@@ -361,28 +561,31 @@ class BasicMMStrategy:
             self.inventory.state.position_size,
             abs(self.inventory.state.position_size * mid_price),
             self.inventory.total_pnl, self.inventory.net_pnl,
-            self.order_mgr.stats_str, bias_str, tox_str, uptime,
+            LazyStr(lambda: self.order_mgr.stats_str),
+            LazyStr(self._bias_status), LazyStr(self._toxicity_status), uptime,
         )
 
+    def _bias_status(self) -> str:
+        """Status-line fragment for the directional bias ('' if disabled)."""
+        if self._bias is None:
+            return ""
+        r = self._bias.last_result
+        regime = r.regime.name if r else "WARMUP"
+        return f" | bias={self._current_bias:+.3f} ({regime})"
+
+    def _toxicity_status(self) -> str:
+        """Status-line fragment for fill toxicity ('' until fills are measured)."""
+        if self._toxicity is None or self._toxicity.fills_measured <= 0:
+            return ""
+        s = self._toxicity.summary()
+        return f" | tox={s['avg_toxicity']:.3f} ({s['fills_measured']} fills)"
+
     def _log_summary(self):
         """Log final session summary."""
-        uptime = time.time() - self._start_time
+        uptime = time.monotonic() - self._start_mono
         s = self.inventory.state
         logger.info(
-            "\n╔══════════════════════════════════════════╗\n"
-            "║  SESSION SUMMARY — %s\n"
-            "╠══════════════════════════════════════════╣\n"
-            "║  Duration:    %.0f seconds\n"
-            "║  Iterations:  %d\n"
-            "║  Fills:       %d buys, %d sells\n"
-            "║  Round trips: %d\n"
-            "║  Volume:      $%.2f\n"
-            "║  Realized:    $%.4f\n"
-            "║  Fees:        $%.4f\n"
-            "║  Net PnL:     $%.4f\n"
-            "║  Final pos:   %.6f\n"
-            "║  %s\n"
-            "╚══════════════════════════════════════════╝",
+            _SUMMARY_TEMPLATE,
             self.symbol, uptime, self._iteration,
             s.num_buys, s.num_sells, s.round_trips,
             s.volume_traded_usd, s.realized_pnl, s.total_fees,
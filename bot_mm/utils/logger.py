@@ -1,13 +1,29 @@
-"""Structured logging for BotMM market making bot."""
+"""Structured logging for BotMM market making bot.
 
+Records are handed to a QueueHandler; a QueueListener thread owns the
+console and file handlers, so disk/stdout writes never block the asyncio
+loop that emitted the record. The message itself (%-interpolation,
+including LazyStr arguments) is still built on the caller thread by
+QueueHandler.prepare(); only the handlers' formatters and I/O run on the
+listener thread.
+"""
+
+import atexit
 import logging
 import os
+import queue
+import re
 import sys
 from datetime import datetime
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 
 LOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "logs")
 LOG_FILE = os.path.join(LOG_DIR, "botmm.log")
 
+# Background writers started by queue_handler(), stopped (and drained) at exit
+_listeners: list = []
+
 # ANSI colors for console
 _COLORS = {
     "RESET": "\033[0m",
@@ -19,6 +35,38 @@ _COLORS = {
 }
 
 
+class LazyStr:
+    """Log argument whose text is built only if the record is formatted.
+
+    Usage: logger.info("... %s", LazyStr(lambda: expensive_summary()))
+    """
+
+    __slots__ = ("_build",)
+
+    def __init__(self, build):
+        self._build = build
+
+    def __str__(self) -> str:
+        return self._build()
+
+
+@lru_cache(maxsize=4)
+def _timestamp(second: int) -> str:
+    """Local-time stamp for a whole epoch second (records in a burst share it)."""
+    return datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _keyword_patterns(msg_colors: dict) -> tuple:
+    """One case-insensitive regex per color, in first-keyword priority order."""
+    groups: dict = {}
+    for kw, color in msg_colors.items():
+        groups.setdefault(color, []).append(re.escape(kw))
+    return tuple(
+        (re.compile("|".join(kws), re.IGNORECASE), color)
+        for color, kws in groups.items()
+    )
+
+
 class _ColorFormatter(logging.Formatter):
     """Console formatter with color based on message content and level."""
 
@@ -42,17 +90,17 @@ class _ColorFormatter(logging.Formatter):
         "skew": _COLORS["YELLOW"],
         "cancel": _COLORS["YELLOW"],
     }
+    _KW_PATTERNS = _keyword_patterns(_MSG_COLORS)
 
     def format(self, record: logging.LogRecord) -> str:
-        ts = datetime.fromtimestamp(record.created).strftime("%Y-%m-%d %H:%M:%S")
-        base = f"[{ts}] [{record.levelname:<7}] [{record.name}] {record.getMessage()}"
+        msg = record.getMessage()
+        base = f"[{_timestamp(int(record.created))}] [{record.levelname:<7}] [{record.name}] {msg}"
 
         # Pick color: level-based first, then keyword-based
         color = self._LEVEL_COLORS.get(record.levelno, "")
         if not color:
-            msg_lower = record.getMessage().lower()
-            for kw, c in self._MSG_COLORS.items():
-                if kw in msg_lower:
+            for pattern, c in self._KW_PATTERNS:
+                if pattern.search(msg):
                     color = c
                     break
 
@@ -65,7 +113,7 @@ class _FileFormatter(logging.Formatter):
     """Plain text formatter for log files."""
 
     def format(self, record: logging.LogRecord) -> str:
-        ts = datetime.fromtimestamp(record.created).strftime("%Y-%m-%d %H:%M:%S")
+        ts = _timestamp(int(record.created))
         return f"[{ts}] [{record.levelname:<7}] [{record.name}] {record.getMessage()}"
 
 
@@ -91,13 +139,35 @@ def setup_logger(name: str = "botmm", level: int = logging.INFO) -> logging.Logg
     ch = logging.StreamHandler(sys.stdout)
     ch.setLevel(level)
     ch.setFormatter(_ColorFormatter())
-    logger.addHandler(ch)
 
-    # File handler
+    # File handler (opened on first record)
     os.makedirs(LOG_DIR, exist_ok=True)
-    fh = logging.FileHandler(LOG_FILE, encoding="utf-8")
+    fh = logging.FileHandler(LOG_FILE, encoding="utf-8", delay=True)
     fh.setLevel(level)
     fh.setFormatter(_FileFormatter())
-    logger.addHandler(fh)
+
+    logger.addHandler(queue_handler(ch, fh))
 
     return logger
+
+
+def queue_handler(*handlers: logging.Handler) -> QueueHandler:
+    """Put *handlers* behind a QueueListener thread.
+
+    The returned QueueHandler builds the message on the caller thread and
+    enqueues it; the listener thread applies each handler's formatter and
+    writes. Listeners are stopped and drained at exit.
+    """
+    q: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(q, *handlers, respect_handler_level=True)
+    listener.start()
+    if not _listeners:
+        atexit.register(_stop_listeners)
+    _listeners.append(listener)
+    return QueueHandler(q)
+
+
+def _stop_listeners() -> None:
+    """Flush queued records and stop all listener threads."""
+    while _listeners:
+        _listeners.pop().stop()
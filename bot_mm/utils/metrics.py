@@ -8,10 +8,8 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Dict
 
-import numpy as np
 
-
-@dataclass
+@dataclass(slots=True)
 class _DailyBucket:
     """Single day's metrics."""
     pnl: float = 0.0
@@ -21,7 +19,7 @@ class _DailyBucket:
     date: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricsTracker:
     """Tracks MM bot PnL, fills, spread capture, and inventory usage."""
 
@@ -38,8 +36,9 @@ class MetricsTracker:
     _spread_sum: float = field(default=0.0, repr=False)
     _spread_count: int = field(default=0, repr=False)
 
-    # Inventory utilization samples
-    _inv_samples: list = field(default_factory=list, repr=False)
+    # Inventory utilization (running mean over samples)
+    _inv_sum: float = field(default=0.0, repr=False)
+    _inv_count: int = field(default=0, repr=False)
     max_position_usd: float = 500.0
 
     # Daily tracking
@@ -91,7 +90,8 @@ class MetricsTracker:
         """Record an inventory utilization sample."""
         if self.max_position_usd > 0:
             util = min(abs(position_usd) / self.max_position_usd, 1.0)
-            self._inv_samples.append(util)
+            self._inv_sum += util
+            self._inv_count += 1
 
     # --- Aggregated properties ---
 
@@ -110,9 +110,7 @@ class MetricsTracker:
     @property
     def inventory_utilization(self) -> float:
         """Average inventory utilization as fraction 0-1."""
-        if not self._inv_samples:
-            return 0.0
-        return float(np.mean(self._inv_samples))
+        return self._inv_sum / self._inv_count if self._inv_count else 0.0
 
     @property
     def uptime_hours(self) -> float:
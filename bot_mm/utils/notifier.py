@@ -5,21 +5,111 @@ Sends recording stats, daily reports, and alerts to Discord webhook.
 """
 
 import asyncio
+import functools
+import json
 import logging
 import os
 import time
-import requests
+from collections import deque
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
-from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+if TYPE_CHECKING:
+    import aiohttp
+
+def _json_default(obj: Any) -> Any:
+    """Stdlib JSON fallback: NumPy scalars as numbers, anything else as str."""
+    item = getattr(obj, "item", None)
+    return item() if callable(item) else str(obj)
+
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        """Serialize a webhook payload straight to UTF-8 JSON bytes.
+
+        NumPy scalars pass through natively; anything else orjson rejects
+        goes through the stdlib encoder instead.
+        """
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            return json.dumps(obj, default=_json_default).encode()
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        """Serialize a webhook payload to UTF-8 JSON bytes (stdlib fallback)."""
+        return json.dumps(obj, default=_json_default).encode()
 
 logger = logging.getLogger(__name__)
 
-_executor = ThreadPoolExecutor(max_workers=2)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Shared keep-alive session: one TLS handshake per connection, not per message
+_session: Optional["aiohttp.ClientSession"] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None  # loop _session is bound to
 
 # Rate limit: suppress duplicate error notifications within this window
 _ERROR_RATE_LIMIT_SECONDS = 300  # 5 minutes
 
+# Identical errors (first 200 chars) are sent at most once per this window
+_ERROR_DEDUP_SECONDS = 600  # 10 minutes
+_ERROR_DEDUP_SIZE = 64
+
+# 429 handling: retry after Discord's Retry-After, capped
+_MAX_429_RETRIES = 3
+_MAX_RETRY_AFTER_SECONDS = 60.0
+
+# Disk usage is re-walked at most this often per directory
+_DIR_SIZE_TTL_SECONDS = 30
+
+
+def _ratelimit(category: str, rate: float, burst: int):
+    """Token-bucket limit for a notification category.
+
+    Each category refills at `rate` tokens/second (event-loop clock) up to
+    `burst`; a call made with an empty bucket is dropped and returns False.
+    The steady rates of all categories together stay under Discord's
+    30 requests/minute webhook cap.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            if not self._take_token(category, rate, burst):
+                logger.debug("%s notification suppressed (rate limit)", category)
+                return False
+            return await func(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+async def _get_session() -> "aiohttp.ClientSession":
+    """Return the shared webhook session, creating it on first use.
+
+    A session is bound to the event loop it was created on, so a new one is
+    opened if the previous session is closed or belongs to another loop.
+    aiohttp is imported here so unconfigured runs never pay for it.
+    """
+    global _session, _session_loop
+    import aiohttp
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=10),
+            connector=aiohttp.TCPConnector(limit=4),
+        )
+        _session_loop = loop
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared webhook session (call once on shutdown)."""
+    global _session, _session_loop
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    _session_loop = None
+
 
 class MMDiscordNotifier:
     """Discord webhook notifier for Market Making Bot."""
@@ -30,10 +120,23 @@ class MMDiscordNotifier:
     COLOR_BLUE = 0x0099FF
     COLOR_PURPLE = 0x9B59B6
 
+    # Embeds queued within this window are coalesced into one webhook POST
+    _BATCH_WINDOW = 0.25  # seconds
+    _BATCH_MAX = 10  # Discord's per-message embed cap
+    _BATCH_CHARS = 6000  # Discord's per-message embed text budget
+
     def __init__(self, webhook_url: str, bot_name: str = "BotMM"):
         self.webhook_url = webhook_url
         self.bot_name = bot_name
         self._last_error_sent: float = 0.0
+        self._recent_errors: deque = deque()  # (hash, sent_at), oldest first
+        self._recent_error_hashes: set = set()
+        self._buckets: Dict[str, tuple] = {}  # category -> (tokens, last_refill)
+        self._dir_size_cache: Dict[str, tuple] = {}  # path -> (monotonic, text)
+        self._footer_default = {"text": bot_name}
+        self._ts_cache: tuple = (float("-inf"), "")  # (monotonic, ISO string)
+        self._queue: Optional[asyncio.Queue] = None
+        self._drain_task: Optional[asyncio.Task] = None
 
     @property
     def is_configured(self) -> bool:
@@ -42,30 +145,128 @@ class MMDiscordNotifier:
             self.webhook_url and self.webhook_url.startswith("https://discord")
         )
 
-    def _send_sync(self, payload: Dict[str, Any]) -> bool:
-        """Synchronous POST to Discord webhook (runs in thread pool)."""
-        try:
-            response = requests.post(
-                self.webhook_url, json=payload, timeout=10
-            )
-            if response.status_code in (200, 204):
-                return True
-            logger.warning(
-                "Discord webhook failed: status=%s body=%s",
-                response.status_code,
-                response.text[:200],
-            )
+    async def send_raw(self, payload: Dict[str, Any]) -> bool:
+        """Send raw payload to Discord over the shared keep-alive session.
+
+        A 429 response is retried after Discord's Retry-After delay, up to
+        _MAX_429_RETRIES times.
+        """
+        if not self.is_configured:
             return False
+        try:
+            data = _dumps(payload)
+            session = await _get_session()
+            for attempt in range(_MAX_429_RETRIES + 1):
+                async with session.post(
+                    self.webhook_url, data=data, headers=_JSON_HEADERS
+                ) as response:
+                    if response.status in (200, 204):
+                        return True
+                    if response.status != 429 or attempt == _MAX_429_RETRIES:
+                        body = await response.text()
+                        logger.warning(
+                            "Discord webhook failed: status=%s body=%s",
+                            response.status,
+                            body[:200],
+                        )
+                        return False
+                    retry_after = min(
+                        float(response.headers.get("Retry-After", 1)),
+                        _MAX_RETRY_AFTER_SECONDS,
+                    )
+                logger.warning(
+                    "Discord webhook rate limited, retrying in %.1fs", retry_after
+                )
+                await asyncio.sleep(retry_after)
         except Exception as e:
             logger.error("Failed to send Discord notification: %s", e)
+        return False
+
+    def _take_token(self, category: str, rate: float, burst: int) -> bool:
+        """Refill the category's bucket and consume one token if available."""
+        now = asyncio.get_running_loop().time()
+        tokens, last = self._buckets.get(category, (float(burst), now))
+        tokens = min(float(burst), tokens + (now - last) * rate)
+        if tokens < 1.0:
+            self._buckets[category] = (tokens, now)
             return False
+        self._buckets[category] = (tokens - 1.0, now)
+        return True
 
-    async def send_raw(self, payload: Dict[str, Any]) -> bool:
-        """Send raw payload to Discord."""
+    async def _enqueue(self, embed: Dict[str, Any]) -> bool:
+        """Queue an embed for the batching task; resolves to the POST result."""
         if not self.is_configured:
             return False
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(_executor, self._send_sync, payload)
+        loop = asyncio.get_running_loop()
+        if self._drain_task is None or self._drain_task.done():
+            self._queue = asyncio.Queue()
+            self._drain_task = loop.create_task(self._drain(self._queue))
+        future = loop.create_future()
+        await self._queue.put((embed, future))
+        return await future
+
+    async def _drain(self, queue: asyncio.Queue) -> None:
+        """Coalesce queued embeds into batched webhook POSTs, in order.
+
+        If the task dies (an unexpected error or cancellation), every embed
+        it took or left queued resolves to False before the error propagates,
+        so no sender is left waiting.
+        """
+        loop = asyncio.get_running_loop()
+        carry = None
+        batch: list = []
+        try:
+            while True:
+                item = carry if carry is not None else await queue.get()
+                carry = None
+                batch = [item]
+                size = len(str(item[0]))
+                deadline = loop.time() + self._BATCH_WINDOW
+                while len(batch) < self._BATCH_MAX:
+                    try:
+                        item = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        remaining = deadline - loop.time()
+                        if remaining <= 0:
+                            break
+                        try:
+                            item = await asyncio.wait_for(queue.get(), remaining)
+                        except asyncio.TimeoutError:
+                            break
+                    # len(str(embed)) over-counts the visible text, so this is safe
+                    item_size = len(str(item[0]))
+                    if size + item_size > self._BATCH_CHARS:
+                        carry = item
+                        break
+                    batch.append(item)
+                    size += item_size
+
+                ok = await self.send_raw({"embeds": [embed for embed, _ in batch]})
+                for _, future in batch:
+                    if not future.done():
+                        future.set_result(ok)
+                batch = []
+        except BaseException:
+            pending = batch + ([carry] if carry is not None else [])
+            while not queue.empty():
+                pending.append(queue.get_nowait())
+            for _, future in pending:
+                if not future.done():
+                    future.set_result(False)
+            raise
+
+    async def close(self) -> None:
+        """Stop the batching task (call on shutdown, before close_session)."""
+        task, self._drain_task = self._drain_task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            logger.exception("Discord batching task failed")
 
     # ------------------------------------------------------------------
     # Helpers
@@ -79,15 +280,22 @@ class MMDiscordNotifier:
         description: str = "",
         footer_extra: str = "",
     ) -> Dict[str, Any]:
-        footer_text = (
-            f"{self.bot_name} | {footer_extra}" if footer_extra else self.bot_name
+        footer = (
+            {"text": f"{self.bot_name} | {footer_extra}"}
+            if footer_extra else self._footer_default
         )
+        # Discord renders the timestamp to the second; reuse it within 1 s
+        now = time.monotonic()
+        cached_at, timestamp = self._ts_cache
+        if now - cached_at > 1.0:
+            timestamp = datetime.now(timezone.utc).isoformat()
+            self._ts_cache = (now, timestamp)
         embed: Dict[str, Any] = {
             "title": title,
             "color": color,
             "fields": fields,
-            "footer": {"text": footer_text},
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "footer": footer,
+            "timestamp": timestamp,
         }
         if description:
             embed["description"] = description
@@ -96,37 +304,49 @@ class MMDiscordNotifier:
     @staticmethod
     def _fmt_uptime(seconds: float) -> str:
         """Format seconds into human-readable Xh Ym."""
-        h = int(seconds // 3600)
-        m = int((seconds % 3600) // 60)
-        return f"{h}h {m}m"
+        h, rem = divmod(int(seconds), 3600)
+        return f"{h}h {rem // 60}m"
 
     @staticmethod
     def _fmt_number(n) -> str:
-        """Format number with comma separators."""
-        if isinstance(n, float):
-            return f"{n:,.2f}"
-        return f"{n:,}"
+        """Format number with comma separators (floats to 2 decimals)."""
+        return format(n, ",.2f") if type(n) is float else format(n, ",")
+
+    def _dir_size_mb(self, path: str) -> str:
+        """Calculate directory size in MB (cached for _DIR_SIZE_TTL_SECONDS)."""
+        now = time.monotonic()
+        cached = self._dir_size_cache.get(path)
+        if cached is not None and now - cached[0] < _DIR_SIZE_TTL_SECONDS:
+            return cached[1]
 
-    @staticmethod
-    def _dir_size_mb(path: str) -> str:
-        """Calculate directory size in MB."""
         total = 0
+        stack = [path]
         try:
-            for dirpath, _dirnames, filenames in os.walk(path):
-                for f in filenames:
-                    fp = os.path.join(dirpath, f)
-                    try:
-                        total += os.path.getsize(fp)
-                    except OSError:
-                        pass
+            # DirEntry carries the type from readdir, so only files get stat'ed
+            while stack:
+                current = stack.pop()
+                try:
+                    with os.scandir(current) as it:
+                        for entry in it:
+                            if entry.is_file(follow_symlinks=False):
+                                total += entry.stat(follow_symlinks=False).st_size
+                            elif entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                except OSError:
+                    if current is path:
+                        raise
         except OSError:
-            return "N/A"
-        return f"{total / (1024 * 1024):.1f} MB"
+            result = "N/A"
+        else:
+            result = f"{total / (1024 * 1024):.1f} MB"
+        self._dir_size_cache[path] = (now, result)
+        return result
 
     # ------------------------------------------------------------------
     # L2 Recorder notifications
     # ------------------------------------------------------------------
 
+    @_ratelimit("recorder", rate=1 / 60, burst=3)
     async def send_recorder_started(
         self, symbols: list, output_dir: str
     ) -> bool:
@@ -147,8 +367,9 @@ class MMDiscordNotifier:
                 },
             ],
         )
-        return await self.send_raw({"embeds": [embed]})
+        return await self._enqueue(embed)
 
+    @_ratelimit("stats", rate=1 / 30, burst=3)
     async def send_recorder_stats(self, stats: dict) -> bool:
         """Periodic recording stats notification."""
         uptime = self._fmt_uptime(stats.get("uptime_seconds", 0))
@@ -168,8 +389,9 @@ class MMDiscordNotifier:
                 {"name": "Disk Usage", "value": disk, "inline": True},
             ],
         )
-        return await self.send_raw({"embeds": [embed]})
+        return await self._enqueue(embed)
 
+    @_ratelimit("recorder", rate=1 / 60, burst=3)
     async def send_recorder_stopped(
         self, stats: dict, reason: str = "Manual"
     ) -> bool:
@@ -188,31 +410,43 @@ class MMDiscordNotifier:
                 {"name": "Trades", "value": trades, "inline": True},
             ],
         )
-        return await self.send_raw({"embeds": [embed]})
+        return await self._enqueue(embed)
 
     async def send_recorder_error(
         self, error: str, context: str = ""
     ) -> bool:
         """Recording error notification (rate-limited)."""
-        now = time.monotonic()
+        now = asyncio.get_running_loop().time()
+        recent, hashes = self._recent_errors, self._recent_error_hashes
+        while recent and (
+            now - recent[0][1] > _ERROR_DEDUP_SECONDS
+            or len(recent) >= _ERROR_DEDUP_SIZE
+        ):
+            hashes.discard(recent.popleft()[0])
+        key = hash(error[:200])
+        if key in hashes:
+            logger.debug("Error notification suppressed (duplicate)")
+            return False
         if now - self._last_error_sent < _ERROR_RATE_LIMIT_SECONDS:
             logger.debug("Error notification suppressed (rate limit)")
             return False
         self._last_error_sent = now
+        recent.append((key, now))
+        hashes.add(key)
 
         embed = self._embed(
             title="❌ Recorder Error",
             color=self.COLOR_RED,
             description=f"```{error}```",
             fields=[],
-            footer_extra=context,
         )
         if context:
             embed["fields"].append(
                 {"name": "Context", "value": context, "inline": False}
             )
-        return await self.send_raw({"embeds": [embed]})
+        return await self._enqueue(embed)
 
+    @_ratelimit("reconnect", rate=1 / 30, burst=3)
     async def send_recorder_reconnect(
         self, attempt: int, max_attempts: int, error: str
     ) -> bool:
@@ -229,12 +463,13 @@ class MMDiscordNotifier:
                 {"name": "Error", "value": f"```{error}```", "inline": False},
             ],
         )
-        return await self.send_raw({"embeds": [embed]})
+        return await self._enqueue(embed)
 
     # ------------------------------------------------------------------
     # General MM Bot notifications
     # ------------------------------------------------------------------
 
+    @_ratelimit("lifecycle", rate=1 / 60, burst=5)
     async def send_startup(
         self, symbols: list, exchange: str, config: dict
     ) -> bool:
@@ -258,8 +493,9 @@ class MMDiscordNotifier:
                 },
             ],
         )
-        return await self.send_raw({"embeds": [embed]})
+        return await self._enqueue(embed)
 
+    @_ratelimit("lifecycle", rate=1 / 60, burst=5)
     async def send_shutdown(
         self, reason: str, metrics: dict = None
     ) -> bool:
@@ -274,8 +510,9 @@ class MMDiscordNotifier:
             color=self.COLOR_RED,
             fields=fields,
         )
-        return await self.send_raw({"embeds": [embed]})
+        return await self._enqueue(embed)
 
+    @_ratelimit("report", rate=1 / 60, burst=3)
     async def send_daily_report(self, metrics: dict) -> bool:
         """Daily P&L report."""
         pnl = metrics.get("pnl", 0.0)
@@ -312,8 +549,9 @@ class MMDiscordNotifier:
                 },
             ],
         )
-        return await self.send_raw({"embeds": [embed]})
+        return await self._enqueue(embed)
 
+    @_ratelimit("alert", rate=1 / 10, burst=5)
     async def send_alert(
         self, title: str, message: str, level: str = "warning"
     ) -> bool:
@@ -331,4 +569,4 @@ class MMDiscordNotifier:
             description=message,
             fields=[],
         )
-        return await self.send_raw({"embeds": [embed]})
+        return await self._enqueue(embed)
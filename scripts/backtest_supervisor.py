@@ -18,17 +18,29 @@ import sys
 import os
 import math
 import argparse
+import functools
+import hashlib
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
 from pathlib import Path
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from backtest.mm_backtester import MMBacktester, load_candles_csv, Candle
 from bot_mm.config import QuoteParams
+from bot_mm.strategies._kernels import njit
+
+# Phase-1 daily PnL cache (one .npy per symbol/days/capital/data/params/code)
+CACHE_DIR = project_root / ".cache" / "supervisor"
+# Everything run_asset_backtest executes; any source edit invalidates the cache
+SOURCE_DIRS = (project_root / "backtest", project_root / "bot_mm")
 
 # Asset profiles (optimal params from optimizer)
 ASSETS = {
@@ -40,8 +52,93 @@ ASSETS = {
 }
 
 
-def run_asset_backtest(symbol: str, days: int, capital: float) -> List[float]:
-    """Run backtest and return daily PnL list (scaled to $1K base)."""
+# Struct-of-arrays view of ASSETS for index-based loops (row i = SYMBOLS[i])
+SYMBOLS = list(ASSETS.keys())
+COMPOUND = np.array([ASSETS[s]["compound"] for s in SYMBOLS], dtype=bool)
+COMPOUND_F = COMPOUND.astype(np.float64)  # 1.0 compound, 0.0 fixed
+
+SQRT365 = math.sqrt(365)  # daily → annualised Sharpe
+
+def _load_candles_columnar(path: str, days: int) -> Optional[List[Candle]]:
+    """Columnar load_candles_csv for numeric (Unix millis) cache files.
+
+    Parses the OHLCV columns with one np.loadtxt, trims to the last
+    days * 24 rows and only then builds Candle objects, so history outside
+    the backtest period is never materialised. Returns None when the file
+    does not fit that layout; the caller then falls back to load_candles_csv.
+    """
+    with open(path) as f:
+        header = f.readline().strip().split(",")
+    cols = {name: i for i, name in enumerate(header)}
+    ts_col = cols.get("timestamp", cols.get("open_time"))
+    usecols = [ts_col] + [cols.get(c) for c in ("open", "high", "low", "close", "volume")]
+    if None in usecols[:5]:
+        return None
+    has_volume = usecols[5] is not None
+    if not has_volume:
+        usecols.pop()
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")  # header-only file
+            arr = np.loadtxt(path, delimiter=",", skiprows=1, usecols=usecols,
+                             dtype=np.float64, ndmin=2)
+    except ValueError:
+        return None
+    if days > 0:
+        arr = arr[-days * 24:]  # 1h candles
+    ts = arr[:, 0]
+    if not np.all(ts == np.floor(ts)):
+        return None
+    stamps = np.datetime_as_string(ts.astype(np.int64).astype("datetime64[ms]"), unit="s")
+    volume = arr[:, 5] if has_volume else np.zeros(len(arr))
+    return [
+        Candle(t.replace("T", " "), o, h, l, c, v)
+        for t, o, h, l, c, v in zip(
+            stamps.tolist(), *arr[:, 1:5].T.tolist(), volume.tolist()
+        )
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def _load_candles(path: str, days: int) -> Tuple[Candle, ...]:
+    """load_candles_csv, parsed once per (path, days) per process."""
+    candles = _load_candles_columnar(path, days)
+    if candles is None:
+        candles = load_candles_csv(path, days)
+    return tuple(candles)
+
+
+def _source_digest() -> str:
+    """sha1 over the path and contents of every .py file under SOURCE_DIRS."""
+    h = hashlib.sha1()
+    for root in SOURCE_DIRS:
+        for path in sorted(root.rglob("*.py")):
+            h.update(str(path.relative_to(root.parent)).encode())
+            h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def _cache_path(symbol: str, days: int, capital: float, csv: Path) -> Path:
+    """Cache file for a backtest; changes whenever its inputs could change."""
+    st = csv.stat()
+    key = repr((
+        symbol, days, capital, st.st_mtime_ns, st.st_size,
+        sorted(ASSETS[symbol].items()),
+        _source_digest(),
+    ))
+    digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+    return CACHE_DIR / f"{symbol}_{days}d_{digest}.npy"
+
+
+def run_asset_backtest(
+    symbol: str, days: int, capital: float, use_cache: bool = True
+) -> List[float]:
+    """Run backtest and return daily PnL list (scaled to $1K base).
+
+    Results are cached on disk under CACHE_DIR, keyed on the inputs (CSV
+    mtime/size, asset params, backtest/ and bot_mm/ sources), so repeat runs
+    with a different --capital or --window skip the backtest entirely.
+    """
     p = ASSETS[symbol]
 
     # Find data
@@ -56,7 +153,11 @@ def run_asset_backtest(symbol: str, days: int, capital: float) -> List[float]:
         print(f"  {symbol}: no data found, skipping")
         return []
 
-    candles = load_candles_csv(str(csv), days)
+    cache_file = _cache_path(symbol, days, capital, csv)
+    if use_cache and cache_file.exists():
+        return np.load(cache_file).tolist()
+
+    candles = list(_load_candles(str(csv), days))
 
     # Scale size proportionally to capital (base is $1K)
     scale = capital / 1000.0
@@ -82,25 +183,53 @@ def run_asset_backtest(symbol: str, days: int, capital: float) -> List[float]:
     )
 
     result = bt.run(candles, symbol)
+    if use_cache:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        np.save(cache_file, np.asarray(result.daily_pnls, dtype=np.float64))
     return result.daily_pnls
 
 
-def compute_score(daily_pnls: List[float]) -> Dict[str, float]:
-    """Compute scoring metrics from daily PnL window."""
+def running_max_window(x: np.ndarray, D: int) -> np.ndarray:
+    """Trailing max of x over the last D points (inclusive), in O(len(x)).
+
+    Keeps a monotonic deque of indices whose values decrease front to back,
+    so the front is always the max of the current window.
+    """
+    out = np.empty(len(x))
+    dq = deque()
+    for i, v in enumerate(x):
+        while dq and x[dq[-1]] <= v:
+            dq.pop()
+        dq.append(i)
+        if dq[0] < i - D + 1:
+            dq.popleft()
+        out[i] = x[dq[0]]
+    return out
+
+
+def compute_score(daily_pnls: List[float], dd_lookback: int = 0) -> Dict[str, float]:
+    """Compute scoring metrics from daily PnL window.
+
+    `dd_lookback` > 0 measures drawdown from the peak of the last
+    `dd_lookback` days instead of the peak of the whole window.
+    """
     if len(daily_pnls) < 3:
         return {"sharpe": 0, "return": 0, "dd": 1.0, "consistency": 0, "score": 0}
 
     arr = np.array(daily_pnls)
     mean = np.mean(arr)
     std = np.std(arr)
-    sharpe = (mean / std * math.sqrt(365)) if std > 0 else 0
+    sharpe = (mean / std * SQRT365) if std > 0 else 0
 
     total_return = np.sum(arr)
     consistency = np.sum(arr > 0) / len(arr)
 
     # Max drawdown in window
     cumsum = np.cumsum(arr)
-    peak = np.maximum.accumulate(cumsum)
+    if dd_lookback > 0:
+        peak = running_max_window(cumsum, dd_lookback)
+    else:
+        peak = np.maximum.accumulate(cumsum)
     dd = np.max(peak - cumsum) if len(cumsum) > 0 else 0
 
     return {
@@ -111,16 +240,89 @@ def compute_score(daily_pnls: List[float]) -> Dict[str, float]:
     }
 
 
+def _window_sums(x: np.ndarray, window: int) -> np.ndarray:
+    """Sums of every `window`-long run along the last axis (prefix-sum differences)."""
+    c = np.cumsum(x, axis=-1)
+    c = np.concatenate((np.zeros(c.shape[:-1] + (1,)), c), axis=-1)
+    return c[..., window:] - c[..., :-window]
+
+
+def rolling_window_metrics(
+    pnl: np.ndarray, window: int, dd_lookback: int = 0
+) -> Dict[str, np.ndarray]:
+    """Scale-free compute_score metrics for every trailing window.
+
+    `pnl` has shape (n_assets, n_days); column j of each result scores days
+    j .. j+window-1. Sharpe and consistency do not change when a window is
+    multiplied by a positive factor k, while return and drawdown scale by k,
+    so the base-$1K arrays are reused for every day's allocation.
+    `dd_lookback` has the same meaning as in compute_score.
+
+    Mean, std, return and consistency come from running sums (S1, S2, count
+    of positive days), O(n_days) per asset instead of O(n_days * window).
+    """
+    ret = _window_sums(pnl, window)
+    mean = ret / window
+    # Centre each row so S2/w - mean^2 does not cancel catastrophically
+    shift = pnl.mean(axis=-1, keepdims=True)
+    centred = _window_sums(pnl - shift, window) / window
+    var = _window_sums((pnl - shift) ** 2, window) / window - centred ** 2
+    # Constant windows leave a rounding-level residual where np.std gives 0
+    tol = 1e-12 * np.maximum(mean ** 2, shift ** 2)
+    std = np.sqrt(np.where(var > tol, var, 0.0))
+    sharpe = np.divide(mean, std, out=np.zeros_like(mean), where=std > 0) * SQRT365
+
+    # Max drawdown of every window in one pass along the last axis
+    windows = sliding_window_view(pnl, window, axis=-1)
+    cumsum = np.cumsum(windows, axis=-1)
+    if 0 < dd_lookback < window:
+        flat = cumsum.reshape(-1, window)
+        peak = np.array([running_max_window(row, dd_lookback) for row in flat])
+        peak = peak.reshape(cumsum.shape)
+    else:
+        peak = np.maximum.accumulate(cumsum, axis=-1)
+    dd = (peak - cumsum).max(axis=-1)
+
+    return {
+        "sharpe": sharpe,
+        "return": ret,
+        "dd": dd,
+        "consistency": _window_sums((pnl > 0).astype(np.float64), window) / window,
+    }
+
+
+@njit(cache=True)
+def equity_curve_and_mdd(daily: np.ndarray, start: float) -> Tuple[np.ndarray, float]:
+    """Equity curve (start + cumsum) and its max drawdown in one pass.
+
+    The running peak starts at the first curve point, matching
+    np.maximum.accumulate over the curve.
+    """
+    n = daily.shape[0]
+    curve = np.empty(n)
+    equity = start
+    peak = -np.inf
+    mdd = 0.0
+    for i in range(n):
+        equity += daily[i]
+        curve[i] = equity
+        if equity > peak:
+            peak = equity
+        elif peak - equity > mdd:
+            mdd = peak - equity
+    return curve, mdd
+
+
 def rank_normalize(values: List[float]) -> List[float]:
     """Rank-based normalization to [0, 1]. Best = 1.0, worst = 0.0."""
     n = len(values)
     if n <= 1:
         return [0.5] * n
-    ranked = sorted(range(n), key=lambda i: values[i])
-    result = [0.0] * n
-    for rank, idx in enumerate(ranked):
-        result[idx] = rank / (n - 1)
-    return result
+    # Stable argsort keeps tied values in input order, like sorted()
+    order = np.argsort(np.asarray(values, dtype=np.float64), kind="stable")
+    ranks = np.empty(n, dtype=np.float64)
+    ranks[order] = np.arange(n) / (n - 1)
+    return ranks.tolist()
 
 
 def compute_scores_ranked(metrics_list: List[Dict]) -> List[float]:
@@ -132,98 +334,173 @@ def compute_scores_ranked(metrics_list: List[Dict]) -> List[float]:
     - Consistency > 70% = good, < 30% = bad
     - DD < 5% of return = good, > 50% = bad
     """
-    scores = []
-    for m in metrics_list:
-        # Sharpe: clamp to [0, 1] based on [-2, 15] range
-        s = max(0, min(1, (m["sharpe"] + 2) / 17))
-
-        # Return: sigmoid-like, positive = good
-        r = max(0, min(1, 0.5 + m["return"] / (abs(m["return"]) + 100) * 0.5)) if True else 0.5
-
-        # Drawdown: lower is better, normalize by return magnitude
-        ref = max(abs(m["return"]), 10)
-        d = max(0, min(1, 1 - m["dd"] / ref))
-
-        # Consistency: direct [0, 1]
-        c = m["consistency"]
-
-        score = 0.40 * s + 0.30 * r + 0.20 * d + 0.10 * c
-        scores.append(score)
+    if not metrics_list:
+        return []
+    metrics = np.array(
+        [[m["sharpe"], m["return"], m["dd"], m["consistency"]] for m in metrics_list],
+        dtype=np.float64,
+    )
+    return score_matrix(metrics).tolist()
 
-    return scores
 
+def score_matrix(metrics: np.ndarray) -> np.ndarray:
+    """Vectorised compute_scores_ranked.
 
-def apply_allocation(
-    allocations: Dict[str, float],
-    scores: Dict[str, float],
+    `metrics` has shape (n_assets, 4) with columns [sharpe, return, dd,
+    consistency]; returns the (n_assets,) composite scores.
+    """
+    sharpe, ret, dd, consistency = metrics.T
+    # Sharpe: clamp to [0, 1] based on [-2, 15] range
+    s = np.clip((sharpe + 2) / 17, 0, 1)
+    # Return: sigmoid-like, positive = good
+    r = np.clip(0.5 + ret / (np.abs(ret) + 100) * 0.5, 0, 1)
+    # Drawdown: lower is better, normalize by return magnitude
+    d = np.clip(1 - dd / np.maximum(np.abs(ret), 10), 0, 1)
+    # Consistency: direct [0, 1]
+    return 0.40 * s + 0.30 * r + 0.20 * d + 0.10 * consistency
+
+
+# Score buckets: PAUSE < 0.10 <= PUNISH < 0.30 <= HOLD <= 0.70 < REWARD
+SCORE_THRESHOLDS = np.array([0.10, 0.30, 0.70])
+PAUSE, PUNISH, HOLD, REWARD = range(4)
+
+
+@njit(cache=True)
+def score_buckets(scores: np.ndarray) -> np.ndarray:
+    """Map scores to PAUSE..REWARD bucket indices with one searchsorted."""
+    bucket = np.searchsorted(SCORE_THRESHOLDS, scores, side="right")
+    # The upper bound is inclusive: exactly 0.70 is still HOLD
+    bucket[scores == SCORE_THRESHOLDS[2]] = HOLD
+    return bucket
+
+
+@njit(cache=True)
+def apply_allocation_nb(
+    alloc: np.ndarray,
+    scores: np.ndarray,
     total_capital: float,
     min_capital: float = 5000.0,
     max_pct: float = 0.35,
     max_daily_change: float = 0.05,
     mean_revert: float = 0.01,
-) -> Dict[str, float]:
-    """Apply reward/punishment rules. Returns new allocations.
-
-    V3_CONSERVATIVE tuning (Feb 2026): gentle punishment, 45d window,
-    1% daily mean-revert to base_alloc. Beats aggressive V0 by +9% PnL.
-    """
-    new_alloc = dict(allocations)
+) -> np.ndarray:
+    """Array kernel behind apply_allocation (index i = asset i)."""
+    n = alloc.shape[0]
+    new_alloc = alloc.copy()
     pool = 0.0  # capital freed from punished bots
-    base_alloc = total_capital / len(allocations)
-
-    symbols = list(allocations.keys())
+    base_alloc = total_capital / n
+    max_allowed = total_capital * max_pct
+    bucket = score_buckets(scores)
 
     # Phase 1: Punish low scorers, free up capital
-    for sym in symbols:
-        score = scores.get(sym, 0.5)
-        current = new_alloc[sym]
-
-        if score < 0.10:  # PAUSE — very conservative threshold
+    for i in range(n):
+        current = new_alloc[i]
+        if bucket[i] == PAUSE:  # very conservative threshold
             change = min(current * 0.10, current - min_capital)
             change = min(change, current * max_daily_change * 2)
             if change > 0:
-                new_alloc[sym] = max(min_capital, current - change)
+                new_alloc[i] = max(min_capital, current - change)
                 pool += change
-        elif score < 0.30:  # PUNISH — gentle 3% cut
-            change = current * 0.03
-            change = min(change, current * max_daily_change)
+        elif bucket[i] == PUNISH:  # gentle 3% cut
+            change = min(current * 0.03, current * max_daily_change)
             if current - change >= min_capital:
-                new_alloc[sym] = current - change
+                new_alloc[i] = current - change
                 pool += change
 
     # Phase 1.5: Mean-revert toward base_alloc (prevents extreme drift)
     if mean_revert > 0:
-        for sym in symbols:
-            diff = base_alloc - new_alloc[sym]
-            new_alloc[sym] += diff * mean_revert
+        for i in range(n):
+            new_alloc[i] += (base_alloc - new_alloc[i]) * mean_revert
 
     # Phase 2: Reward high scorers with freed capital
-    rewarded = [s for s in symbols if scores.get(s, 0.5) > 0.7]
-    if rewarded and pool > 0:
-        share = pool / len(rewarded)
-        for sym in rewarded:
-            current = new_alloc[sym]
-            max_allowed = total_capital * max_pct
-            add = min(share, max_allowed - current, current * max_daily_change)
-            if add > 0:
-                new_alloc[sym] += add
-                pool -= add
+    n_rewarded = np.sum(bucket == REWARD)
+    if n_rewarded > 0 and pool > 0:
+        share = pool / n_rewarded
+        for i in range(n):
+            if bucket[i] == REWARD:
+                current = new_alloc[i]
+                add = min(share, max_allowed - current, current * max_daily_change)
+                if add > 0:
+                    new_alloc[i] += add
+                    pool -= add
 
     # Phase 3: Distribute remaining pool equally among HOLD bots
     if pool > 1.0:
-        hold_bots = [s for s in symbols if 0.30 <= scores.get(s, 0.5) <= 0.7]
-        if hold_bots:
-            share = pool / len(hold_bots)
-            for sym in hold_bots:
-                current = new_alloc[sym]
-                max_allowed = total_capital * max_pct
-                add = min(share, max_allowed - current)
-                if add > 0:
-                    new_alloc[sym] += add
+        n_hold = np.sum(bucket == HOLD)
+        if n_hold > 0:
+            share = pool / n_hold
+            for i in range(n):
+                if bucket[i] == HOLD:
+                    add = min(share, max_allowed - new_alloc[i])
+                    if add > 0:
+                        new_alloc[i] += add
 
     return new_alloc
 
 
+def apply_allocation(
+    allocations: Dict[str, float],
+    scores: Dict[str, float],
+    total_capital: float,
+    min_capital: float = 5000.0,
+    max_pct: float = 0.35,
+    max_daily_change: float = 0.05,
+    mean_revert: float = 0.01,
+) -> Dict[str, float]:
+    """Apply reward/punishment rules. Returns new allocations.
+
+    V3_CONSERVATIVE tuning (Feb 2026): gentle punishment, 45d window,
+    1% daily mean-revert to base_alloc. Beats aggressive V0 by +9% PnL.
+    Bots missing from `scores` are treated as HOLD (0.5).
+    """
+    symbols = list(allocations.keys())
+    new_alloc = apply_allocation_nb(
+        np.array([allocations[s] for s in symbols], dtype=np.float64),
+        np.array([scores.get(s, 0.5) for s in symbols], dtype=np.float64),
+        float(total_capital), float(min_capital), float(max_pct),
+        float(max_daily_change), float(mean_revert),
+    )
+    return dict(zip(symbols, new_alloc.tolist()))
+
+
+# Risk multiplier columns, and per-bucket targets / bounds in that order
+RISK_PARAMS = ("size_mult", "spread_mult", "max_pos_mult", "max_loss_mult")
+RISK_TARGETS = np.array([
+    [0.40, 1.50, 0.40, 0.40],  # pause
+    [0.70, 1.30, 0.70, 0.70],  # punish
+    [1.00, 1.00, 1.00, 1.00],  # hold
+    [1.10, 0.90, 1.10, 1.00],  # reward
+])
+RISK_LO = np.array([0.30, 0.80, 0.30, 0.30])
+RISK_HI = np.array([1.20, 1.50, 1.20, 1.00])
+
+
+@njit(cache=True)
+def compute_risk_adjustments_nb(
+    scores: np.ndarray, current: np.ndarray, max_risk_change: float = 0.10
+) -> np.ndarray:
+    """Array kernel behind compute_risk_adjustments.
+
+    `current` is (n_assets, 4) in RISK_PARAMS order; NaN entries have no
+    previous value and jump straight to the target.
+    """
+    n = scores.shape[0]
+    out = np.empty((n, 4))
+    # Risk treats exactly 0.70 as REWARD, unlike score_buckets
+    bucket = np.searchsorted(SCORE_THRESHOLDS, scores, side="right")
+    for i in range(n):
+        for c in range(4):
+            tgt = RISK_TARGETS[bucket[i], c]
+            cur = current[i, c]
+            if np.isnan(cur):
+                val = tgt
+            else:
+                # Smooth transition: blend current → target with rate limit
+                val = cur + max(-max_risk_change, min(max_risk_change, tgt - cur))
+            out[i, c] = max(RISK_LO[c], min(RISK_HI[c], val))
+    return out
+
+
 def compute_risk_adjustments(
     scores: Dict[str, float],
     current_risk: Dict[str, Dict[str, float]] = None,
@@ -239,48 +516,23 @@ def compute_risk_adjustments(
 
     Risk adjusts FASTER than capital — immediate response to bad performance.
     """
-    targets = {
-        "reward":  {"size_mult": 1.10, "spread_mult": 0.90, "max_pos_mult": 1.10, "max_loss_mult": 1.00},
-        "hold":    {"size_mult": 1.00, "spread_mult": 1.00, "max_pos_mult": 1.00, "max_loss_mult": 1.00},
-        "punish":  {"size_mult": 0.70, "spread_mult": 1.30, "max_pos_mult": 0.70, "max_loss_mult": 0.70},
-        "pause":   {"size_mult": 0.40, "spread_mult": 1.50, "max_pos_mult": 0.40, "max_loss_mult": 0.40},
-    }
-
-    BOUNDS = {
-        "size_mult":    (0.30, 1.20),
-        "spread_mult":  (0.80, 1.50),
-        "max_pos_mult": (0.30, 1.20),
-        "max_loss_mult":(0.30, 1.00),
+    symbols = list(scores.keys())
+    current = np.full((len(symbols), 4), np.nan)
+    if current_risk:
+        for i, sym in enumerate(symbols):
+            prev = current_risk.get(sym, {})
+            for c, param in enumerate(RISK_PARAMS):
+                if param in prev:
+                    current[i, c] = prev[param]
+    out = compute_risk_adjustments_nb(
+        np.array([scores[s] for s in symbols], dtype=np.float64),
+        current, float(max_risk_change),
+    )
+    return {
+        sym: dict(zip(RISK_PARAMS, row))
+        for sym, row in zip(symbols, out.tolist())
     }
 
-    result = {}
-    for sym, score in scores.items():
-        if score >= 0.7:
-            target = targets["reward"]
-        elif score >= 0.30:
-            target = targets["hold"]
-        elif score >= 0.10:
-            target = targets["punish"]
-        else:
-            target = targets["pause"]
-
-        adj = {}
-        for param, tgt in target.items():
-            lo, hi = BOUNDS[param]
-            # Smooth transition: blend current → target with rate limit
-            if current_risk and sym in current_risk and param in current_risk[sym]:
-                cur = current_risk[sym][param]
-                delta = tgt - cur
-                delta = max(-max_risk_change, min(max_risk_change, delta))
-                val = cur + delta
-            else:
-                val = tgt
-            adj[param] = max(lo, min(hi, val))
-
-        result[sym] = adj
-
-    return result
-
 
 def main():
     parser = argparse.ArgumentParser(description="Meta-Supervisor Backtest Simulation")
@@ -288,10 +540,18 @@ def main():
     parser.add_argument("--days", type=int, default=365, help="Backtest period")
     parser.add_argument("--window", type=int, default=45, help="Scoring window (days)")
     parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-run Phase-1 backtests instead of using .cache/supervisor")
+    parser.add_argument("--dd-lookback", type=int, default=0,
+                        help="Drawdown peak lookback in days (0 = whole scoring window)")
     args = parser.parse_args()
+    if args.window < 3:
+        parser.error("--window must be at least 3 days")
+    if args.dd_lookback < 0:
+        parser.error("--dd-lookback must be non-negative")
 
     np.random.seed(args.seed)
-    symbols = list(ASSETS.keys())
+    symbols = SYMBOLS
     n_assets = len(symbols)
     base_alloc = args.capital / n_assets
 
@@ -306,13 +566,19 @@ def main():
     print()
 
     # Step 1: Run backtests at $1K base to get daily PnL ratios
-    print("  Phase 1: Running backtests (base capital)...")
-    daily_pnls = {}
-    for sym in symbols:
-        print(f"    {sym}...", end=" ", flush=True)
-        dpnl = run_asset_backtest(sym, args.days, 1000.0)
-        daily_pnls[sym] = dpnl
-        print(f"{len(dpnl)} days, total ${sum(dpnl):,.0f}")
+    print("  Phase 1: Running backtests (base capital)...", flush=True)
+    # Assets are independent: one process per symbol
+    with ProcessPoolExecutor(max_workers=min(n_assets, os.cpu_count() or 1)) as ex:
+        results = ex.map(
+            run_asset_backtest,
+            symbols,
+            [args.days] * n_assets,
+            [1000.0] * n_assets,
+            [not args.no_cache] * n_assets,
+        )
+        daily_pnls = dict(zip(symbols, results))
+    for sym, dpnl in daily_pnls.items():
+        print(f"    {sym}... {len(dpnl)} days, total ${sum(dpnl):,.0f}")
 
     # Trim all series to shortest (so all assets cover same period)
     min_days = min(len(v) for v in daily_pnls.values())
@@ -325,162 +591,143 @@ def main():
             daily_pnls[sym] = daily_pnls[sym][-min_days:]
     max_days = min_days
 
+    # (n_assets, max_days) base-$1K PnL matrix; row order follows `symbols`
+    pnl_mat = np.array([daily_pnls[sym] for sym in symbols], dtype=np.float64)
+
     # Step 2: Simulate EQUAL allocation (with compound for BTC/ETH)
     print("\n  Phase 2: Simulating EQUAL allocation...")
-    equal_daily = []
-    # Track per-asset compound equity (starts at base_alloc)
-    eq_equity = {sym: base_alloc for sym in symbols}
-    for day in range(max_days):
-        day_total = 0.0
-        for sym in symbols:
-            # PnL scales by current equity (compound) or fixed alloc
-            effective = eq_equity[sym]
-            day_pnl = daily_pnls[sym][day] * (effective / 1000.0)
-            day_total += day_pnl
-            # Compound: reinvest PnL into equity for BTC/ETH
-            if ASSETS[sym]["compound"]:
-                eq_equity[sym] += day_pnl
-        equal_daily.append(day_total)
-
-    equal_total = sum(equal_daily)
-    equal_equity_curve = [args.capital + sum(equal_daily[:i+1]) for i in range(len(equal_daily))]
-    equal_peak = np.maximum.accumulate(equal_equity_curve)
-    equal_dd = max(equal_peak - np.array(equal_equity_curve))
-    equal_sharpe = np.mean(equal_daily) / np.std(equal_daily) * math.sqrt(365) if np.std(equal_daily) > 0 else 0
+    # Fixed assets earn on base_alloc every day. Compound assets reinvest:
+    # eq[t] = eq[t-1] * (1 + pnl[t] / 1000), i.e. a cumulative product.
+    eq_asset_daily = pnl_mat * (base_alloc / 1000.0)
+    comp_curves = base_alloc * np.cumprod(1.0 + pnl_mat[COMPOUND] / 1000.0, axis=1)
+    eq_asset_daily[COMPOUND] = np.diff(comp_curves, axis=1, prepend=base_alloc)
+    equal_daily = eq_asset_daily.sum(axis=0)
+
+    equal_total = equal_daily.sum()
+    _, equal_dd = equity_curve_and_mdd(equal_daily, float(args.capital))
+    equal_std = equal_daily.std()
+    equal_sharpe = equal_daily.mean() / equal_std * SQRT365 if equal_std > 0 else 0
 
     # Step 3: Simulate ADAPTIVE supervisor
     # Supervisor controls BASE allocation only. Compound assets reinvest PnL on top.
     print("  Phase 3: Simulating ADAPTIVE supervisor...")
-    allocations = {sym: base_alloc for sym in symbols}  # supervisor-controlled base
+    allocations = np.full(n_assets, base_alloc)  # supervisor-controlled base
     # Compound equity tracks cumulative PnL per asset (on top of base)
-    compound_pnl = {sym: 0.0 for sym in symbols}
-    risk_adj = {sym: {"size_mult": 1.0, "spread_mult": 1.0, "max_pos_mult": 1.0, "max_loss_mult": 1.0} for sym in symbols}
-    adaptive_daily = []
-    alloc_history = {sym: [base_alloc] for sym in symbols}
-    action_log = {sym: [] for sym in symbols}
+    # Stays 0 for fixed assets (masked by COMPOUND_F), so effective capital
+    # is always allocations + compound_pnl
+    compound_pnl = np.zeros(n_assets)
+    risk_adj = np.ones((n_assets, len(RISK_PARAMS)))  # columns: RISK_PARAMS
+    adaptive_daily = np.empty(max_days)
+    # Realised per-asset ADAPTIVE PnL (same layout as pnl_mat)
+    adaptive_asset_daily = np.empty((n_assets, max_days))
+    if max_days >= args.window:
+        # windows[i, j] = asset i, days j .. j+window-1 (view, no copy)
+        windows = sliding_window_view(pnl_mat, args.window, axis=1)
+        win_metrics = rolling_window_metrics(pnl_mat, args.window, args.dd_lookback)
+    # Row 0 = starting allocation, row day+1 = allocation after that day
+    alloc_history = np.empty((max_days + 1, n_assets))
+    alloc_history[0] = base_alloc
 
     for day in range(max_days):
-        day_total = 0.0
-        for sym in symbols:
-            # Effective capital = supervisor base + compound PnL (if compound asset)
-            if ASSETS[sym]["compound"]:
-                effective = allocations[sym] + compound_pnl[sym]
-            else:
-                effective = allocations[sym]
-            scale = effective / 1000.0
-            risk_effect = risk_adj[sym]["size_mult"] * (2.0 - risk_adj[sym]["spread_mult"])
-            day_pnl = daily_pnls[sym][day] * scale * risk_effect
-            day_total += day_pnl
-            # Compound: accumulate PnL
-            if ASSETS[sym]["compound"]:
-                compound_pnl[sym] += day_pnl
-        adaptive_daily.append(day_total)
+        # Effective capital = supervisor base + compound PnL
+        effective = allocations + compound_pnl
+        risk_effect = risk_adj[:, 0] * (2.0 - risk_adj[:, 1])
+        day_pnl = pnl_mat[:, day] * (effective / 1000.0) * risk_effect
+        adaptive_asset_daily[:, day] = day_pnl
+        adaptive_daily[day] = day_pnl.sum()
+        # Compound: accumulate PnL
+        compound_pnl += COMPOUND_F * day_pnl
 
         # After scoring window, rebalance base allocations daily
         if day >= args.window:
-            metrics = {}
-            scores_dict = {}
-            for sym in symbols:
-                window_pnl = []
-                for d in range(day - args.window + 1, day + 1):
-                    if ASSETS[sym]["compound"]:
-                        eff = allocations[sym] + compound_pnl[sym]
-                    else:
-                        eff = allocations[sym]
-                    scale = eff / 1000.0
-                    r_eff = risk_adj[sym]["size_mult"] * (2.0 - risk_adj[sym]["spread_mult"])
-                    window_pnl.append(daily_pnls[sym][d] * scale * r_eff)
-                metrics[sym] = compute_score(window_pnl)
-
-            metrics_list = [metrics[sym] for sym in symbols]
-            scores_list = compute_scores_ranked(metrics_list)
-            for i, sym in enumerate(symbols):
-                scores_dict[sym] = scores_list[i]
+            j = day - args.window + 1
+            # Every day of the window is scored at today's capital and risk
+            k = (allocations + compound_pnl) / 1000.0 * risk_effect
+            metrics = np.column_stack((
+                win_metrics["sharpe"][:, j],
+                win_metrics["return"][:, j] * k,
+                win_metrics["dd"][:, j] * k,
+                win_metrics["consistency"][:, j],
+            ))
+            for i in np.flatnonzero(k <= 0):
+                # Sign flip: metrics are not scale-free, score directly
+                m = compute_score(list(windows[i, j] * k[i]), args.dd_lookback)
+                metrics[i] = (m["sharpe"], m["return"], m["dd"], m["consistency"])
+            scores = score_matrix(metrics)
 
             # Supervisor adjusts BASE allocation only (not compound equity)
-            new_alloc = apply_allocation(
-                allocations, scores_dict, args.capital
-            )
-            allocations = new_alloc
-
-            risk_adj = compute_risk_adjustments(scores_dict, risk_adj)
+            allocations = apply_allocation_nb(allocations, scores, float(args.capital))
+            risk_adj = compute_risk_adjustments_nb(scores, risk_adj)
 
-        for sym in symbols:
-            alloc_history[sym].append(allocations[sym])
+        alloc_history[day + 1] = allocations
 
-    adaptive_total = sum(adaptive_daily)
-    adaptive_equity = [args.capital + sum(adaptive_daily[:i+1]) for i in range(len(adaptive_daily))]
-    adaptive_peak = np.maximum.accumulate(adaptive_equity)
-    adaptive_dd = max(adaptive_peak - np.array(adaptive_equity))
-    adaptive_sharpe = np.mean(adaptive_daily) / np.std(adaptive_daily) * math.sqrt(365) if np.std(adaptive_daily) > 0 else 0
+    adaptive_total = adaptive_daily.sum()
+    _, adaptive_dd = equity_curve_and_mdd(adaptive_daily, float(args.capital))
+    adaptive_std = adaptive_daily.std()
+    adaptive_sharpe = adaptive_daily.mean() / adaptive_std * SQRT365 if adaptive_std > 0 else 0
 
     # Step 4: Print results
+    out = []  # report lines, written in one call at the end
     improvement = (adaptive_total - equal_total) / abs(equal_total) * 100 if equal_total != 0 else 0
 
-    print(f"\n{'=' * 70}")
-    print(f"  RESULTS — {max_days} days")
-    print(f"{'=' * 70}")
-    print()
-    print(f"  {'Metric':<30} {'EQUAL':>15} {'ADAPTIVE':>15} {'Delta':>10}")
-    print(f"  {'-'*70}")
-    print(f"  {'Net PnL':<30} {'$'+format(equal_total,',.0f'):>15} {'$'+format(adaptive_total,',.0f'):>15} {improvement:>+9.1f}%")
-    print(f"  {'Return':<30} {equal_total/args.capital*100:>14.1f}% {adaptive_total/args.capital*100:>14.1f}%")
-    print(f"  {'Sharpe':<30} {equal_sharpe:>15.1f} {adaptive_sharpe:>15.1f}")
-    print(f"  {'Max Drawdown':<30} {'$'+format(equal_dd,',.0f'):>15} {'$'+format(adaptive_dd,',.0f'):>15}")
-    print(f"  {'Final Equity':<30} {'$'+format(args.capital+equal_total,',.0f'):>15} {'$'+format(args.capital+adaptive_total,',.0f'):>15}")
+    out.append(f"\n{'=' * 70}")
+    out.append(f"  RESULTS — {max_days} days")
+    out.append(f"{'=' * 70}")
+    out.append("")
+    out.append(f"  {'Metric':<30} {'EQUAL':>15} {'ADAPTIVE':>15} {'Delta':>10}")
+    out.append(f"  {'-'*70}")
+    out.append(f"  {'Net PnL':<30} {'$'+format(equal_total,',.0f'):>15} {'$'+format(adaptive_total,',.0f'):>15} {improvement:>+9.1f}%")
+    out.append(f"  {'Return':<30} {equal_total/args.capital*100:>14.1f}% {adaptive_total/args.capital*100:>14.1f}%")
+    out.append(f"  {'Sharpe':<30} {equal_sharpe:>15.1f} {adaptive_sharpe:>15.1f}")
+    out.append(f"  {'Max Drawdown':<30} {'$'+format(equal_dd,',.0f'):>15} {'$'+format(adaptive_dd,',.0f'):>15}")
+    out.append(f"  {'Final Equity':<30} {'$'+format(args.capital+equal_total,',.0f'):>15} {'$'+format(args.capital+adaptive_total,',.0f'):>15}")
 
     # Profitable days
-    eq_pos = sum(1 for d in equal_daily if d > 0)
-    ad_pos = sum(1 for d in adaptive_daily if d > 0)
-    print(f"  {'Profitable Days':<30} {eq_pos}/{max_days} ({eq_pos/max_days*100:.0f}%){' ':>3} {ad_pos}/{max_days} ({ad_pos/max_days*100:.0f}%)")
+    eq_pos = int((equal_daily > 0).sum())
+    ad_pos = int((adaptive_daily > 0).sum())
+    out.append(f"  {'Profitable Days':<30} {eq_pos}/{max_days} ({eq_pos/max_days*100:.0f}%){' ':>3} {ad_pos}/{max_days} ({ad_pos/max_days*100:.0f}%)")
 
     # Monthly/Annual
     eq_monthly = equal_total / max_days * 30
     ad_monthly = adaptive_total / max_days * 30
-    print(f"  {'Monthly (avg)':<30} {'$'+format(eq_monthly,',.0f'):>15} {'$'+format(ad_monthly,',.0f'):>15}")
+    out.append(f"  {'Monthly (avg)':<30} {'$'+format(eq_monthly,',.0f'):>15} {'$'+format(ad_monthly,',.0f'):>15}")
 
     # Per-asset final state
-    print(f"\n  FINAL STATE (base=supervisor, compound=accumulated PnL)")
-    print(f"  {'-'*80}")
-    print(f"  {'Asset':<12} {'Base':>10} {'Compound':>10} {'Effective':>10}  {'Size':>5} {'Spread':>6} {'Mode':>8}")
-    print(f"  {'-'*80}")
-    for sym in symbols:
-        final_alloc = alloc_history[sym][-1]
-        cpnl = compound_pnl.get(sym, 0)
-        effective = final_alloc + cpnl if ASSETS[sym]["compound"] else final_alloc
-        ra = risk_adj[sym]
-        mode = "COMPOUND" if ASSETS[sym]["compound"] else "FIXED"
-        print(f"  {sym:<12} ${final_alloc:>8,.0f} ${cpnl:>8,.0f} ${effective:>8,.0f}  {ra['size_mult']:>5.2f} {ra['spread_mult']:>6.2f} {mode:>8}")
+    out.append(f"\n  FINAL STATE (base=supervisor, compound=accumulated PnL)")
+    out.append(f"  {'-'*80}")
+    out.append(f"  {'Asset':<12} {'Base':>10} {'Compound':>10} {'Effective':>10}  {'Size':>5} {'Spread':>6} {'Mode':>8}")
+    out.append(f"  {'-'*80}")
+    for i, sym in enumerate(symbols):
+        final_alloc = alloc_history[-1, i]
+        cpnl = compound_pnl[i]
+        effective = final_alloc + cpnl
+        size_mult, spread_mult = risk_adj[i, 0], risk_adj[i, 1]
+        mode = "COMPOUND" if COMPOUND[i] else "FIXED"
+        out.append(f"  {sym:<12} ${final_alloc:>8,.0f} ${cpnl:>8,.0f} ${effective:>8,.0f}  {size_mult:>5.2f} {spread_mult:>6.2f} {mode:>8}")
 
     # Per-asset PnL comparison (equal uses compound too for BTC/ETH)
-    print(f"\n  PER-ASSET PnL COMPARISON (equal includes compound for BTC/ETH)")
-    print(f"  {'-'*70}")
-    print(f"  {'Asset':<12} {'EQUAL':>12} {'ADAPTIVE':>12} {'Delta':>10} {'Mode':>10}")
-    print(f"  {'-'*70}")
-    total_eq_check = sum(equal_daily)
-    total_ad_check = sum(adaptive_daily)
-    # Reconstruct per-asset PnL from equity tracking
-    # For EQUAL: use eq_equity final - base
-    for sym in symbols:
-        eq_pnl = eq_equity[sym] - base_alloc
-        if ASSETS[sym]["compound"]:
-            ad_pnl = compound_pnl[sym]
-        else:
-            ad_pnl_sum = 0
-            for d in range(max_days):
-                eff = allocations[sym]
-                scale = eff / 1000.0
-                r_eff = risk_adj[sym]["size_mult"] * (2.0 - risk_adj[sym]["spread_mult"])
-                ad_pnl_sum += daily_pnls[sym][d] * scale * r_eff
-            ad_pnl = ad_pnl_sum
+    out.append(f"\n  PER-ASSET PnL COMPARISON (equal includes compound for BTC/ETH)")
+    out.append(f"  {'-'*70}")
+    out.append(f"  {'Asset':<12} {'EQUAL':>12} {'ADAPTIVE':>12} {'Delta':>10} {'Mode':>10}")
+    out.append(f"  {'-'*70}")
+    total_eq_check = equal_total
+    total_ad_check = adaptive_total
+    # Both sides sum realised daily PnL per asset; ADAPTIVE rows reflect
+    # each day's allocation and risk multipliers, not the final ones
+    equal_asset_pnl = eq_asset_daily.sum(axis=1)
+    adaptive_asset_pnl = adaptive_asset_daily.sum(axis=1)
+    for i, sym in enumerate(symbols):
+        eq_pnl = equal_asset_pnl[i]
+        ad_pnl = adaptive_asset_pnl[i]
         delta = (ad_pnl - eq_pnl) / abs(eq_pnl) * 100 if eq_pnl != 0 else 0
-        mode = "COMPOUND" if ASSETS[sym]["compound"] else "FIXED"
-        print(f"  {sym:<12} ${eq_pnl:>10,.0f} ${ad_pnl:>10,.0f} {delta:>+9.1f}% {mode:>10}")
-    print(f"  {'-'*70}")
+        mode = "COMPOUND" if COMPOUND[i] else "FIXED"
+        out.append(f"  {sym:<12} ${eq_pnl:>10,.0f} ${ad_pnl:>10,.0f} {delta:>+9.1f}% {mode:>10}")
+    out.append(f"  {'-'*70}")
     delta_total = (total_ad_check - total_eq_check) / abs(total_eq_check) * 100 if total_eq_check != 0 else 0
-    print(f"  {'TOTAL':<12} ${total_eq_check:>10,.0f} ${total_ad_check:>10,.0f} {delta_total:>+9.1f}%")
+    out.append(f"  {'TOTAL':<12} ${total_eq_check:>10,.0f} ${total_ad_check:>10,.0f} {delta_total:>+9.1f}%")
 
-    print(f"\n{'=' * 70}")
+    out.append(f"\n{'=' * 70}")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
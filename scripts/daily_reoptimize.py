@@ -33,12 +33,14 @@ import sys
 import os
 import json
 import time
+import hashlib
+import functools
 import argparse
 import logging
 from pathlib import Path
 from datetime import datetime, timezone
-from itertools import product
 from multiprocessing import Pool, cpu_count
+from multiprocessing.shared_memory import SharedMemory
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
 
@@ -124,6 +126,7 @@ MAX_DAILY_DRIFT_PCT = 30.0   # Max param change per day (%)
 MIN_IMPROVEMENT_PCT = 5.0    # Only apply if score improves by > 5%
 HISTORY_DIR = project_root / "data" / "reopt_history"
 LIVE_PARAMS_FILE = project_root / "data" / "live_params.json"
+CANDLE_CACHE_DIR = project_root / ".cache" / "candles"
 
 
 @dataclass
@@ -141,22 +144,91 @@ class ReoptResult:
     details: Dict[str, Any]
 
 
-def _run_single_backtest(args):
-    """Worker function for parallel optimizer."""
-    params_dict, candles_data, symbol, capital, max_pos, use_bias, bias_strength = args
+def _candles_to_arrays(candles: List[Candle]) -> Tuple[np.ndarray, np.ndarray]:
+    """Candles as (timestamps, OHLCV): datetime64[s] and (n, 5) float64 arrays.
+
+    Timestamps that are not "YYYY-MM-DD HH:MM:SS" stay a str array.
+    """
+    ts = np.array([c.timestamp for c in candles], dtype=str)
+    try:
+        ts = ts.astype("datetime64[s]")
+    except ValueError:
+        pass
+    ohlcv = np.array(
+        [(c.open, c.high, c.low, c.close, c.volume) for c in candles], dtype=np.float64,
+    ).reshape(-1, 5)
+    return ts, ohlcv
+
+
+def _arrays_to_candles(ts: np.ndarray, ohlcv: np.ndarray) -> List[Candle]:
+    """Inverse of _candles_to_arrays."""
+    stamps = ts.tolist()
+    if np.issubdtype(ts.dtype, np.datetime64):
+        stamps = [t.replace("T", " ") for t in np.datetime_as_string(ts, unit="s").tolist()]
+    return [Candle(t, *row) for t, row in zip(stamps, ohlcv.tolist())]
+
+
+def _cached_candles(path: str, days: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Last `days` of hourly candles from `path` as (ts, ohlcv) arrays.
+
+    The whole CSV is parsed once with load_candles_csv and stored as .npz
+    under CANDLE_CACHE_DIR, one file per CSV path. The CSV's mtime and size
+    are stored alongside the arrays; when they no longer match, the CSV is
+    re-parsed and the same file is overwritten, so daily refreshes do not
+    pile up stale caches.
+    """
+    st = os.stat(path)
+    stamp = np.array([st.st_mtime_ns, st.st_size], dtype=np.int64)
+    digest = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()[:16]
+    cache_file = CANDLE_CACHE_DIR / f"{Path(path).stem}_{digest}.npz"
+
+    cached = None
+    if cache_file.exists():
+        with np.load(cache_file) as npz:
+            if "stamp" in npz.files and np.array_equal(npz["stamp"], stamp):
+                cached = npz["ts"], npz["ohlcv"]
+    if cached is not None:
+        ts, ohlcv = cached
+    else:
+        ts, ohlcv = _candles_to_arrays(load_candles_csv(path, 0))
+        CANDLE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            np.savez(f, ts=ts, ohlcv=ohlcv, stamp=stamp)
+        os.replace(tmp, cache_file)  # atomic: concurrent runs never see a partial file
 
-    candles = [Candle(*c) for c in candles_data]
+    if days > 0:
+        ts, ohlcv = ts[-days * 24:], ohlcv[-days * 24:]  # 1h candles
+    return ts, ohlcv
+
+
+# Read-only per-asset state, set once per worker by _init_worker
+_WORKER_STATE: Dict[str, Any] = {}
 
-    qp = QuoteParams(
-        base_spread_bps=params_dict["base_spread_bps"],
-        vol_multiplier=params_dict.get("vol_multiplier", 1.5),
-        inventory_skew_factor=params_dict["inventory_skew_factor"],
-        order_size_usd=params_dict["order_size_usd"],
-        num_levels=params_dict.get("num_levels", 2),
-    )
 
-    bt = MMBacktester(
-        quote_params=qp,
+def _grid_params(keys: Tuple[str, ...], values: Tuple[tuple, ...], idx) -> Dict[str, Any]:
+    """Params dict for grid point `idx` (one value index per key)."""
+    return {k: v[j] for k, v, j in zip(keys, values, idx)}
+
+
+def _params_key(params: Dict[str, Any]) -> Optional[tuple]:
+    """REOPT_GRID-ordered values of `params`, as the optimizer would run them.
+
+    Missing grid keys take their QuoteParams defaults. Returns None when
+    `params` sets a non-default field the grid never varies, since no
+    grid backtest used that configuration.
+    """
+    defaults = QuoteParams()
+    for k, v in params.items():
+        if k not in REOPT_GRID and v != getattr(defaults, k, None):
+            return None
+    return tuple(params.get(k, getattr(defaults, k)) for k in REOPT_GRID)
+
+
+def _backtester_factory(capital, max_pos, use_bias, bias_strength):
+    """MMBacktester with every setting but quote_params bound for one asset."""
+    return functools.partial(
+        MMBacktester,
         max_position_usd=max_pos,
         max_daily_loss=capital * 0.05,
         capital=capital,
@@ -166,16 +238,63 @@ def _run_single_backtest(args):
         use_auto_tune=True,
     )
 
-    result = bt.run(candles, symbol)
 
-    # Score: PnL × Sharpe bonus × fill bonus × drawdown penalty
+def _init_worker(shm_name, shape, dtype, grid, symbol, capital, max_pos, use_bias, bias_strength):
+    """Pool initializer: receive the asset's candles and fixed settings once.
+
+    Candles are read from the shared-memory table written by optimize_asset
+    (only its name, shape and dtype are pickled) and Candle objects are
+    rebuilt here, once per worker; the backtester only reads them, so every
+    combo in this worker shares the same list.
+    """
+    shm = SharedMemory(name=shm_name)
+    try:
+        table = np.ndarray(shape, dtype, buffer=shm.buf)
+        candles = _arrays_to_candles(table["ts"], table["ohlcv"])
+        del table  # release the buffer before close()
+    finally:
+        shm.close()
+
+    _WORKER_STATE.update(
+        candles=candles,
+        grid=grid,
+        symbol=symbol,
+        capital=capital,
+        bt_factory=_backtester_factory(capital, max_pos, use_bias, bias_strength),
+    )
+
+
+def score_result(result, capital: float) -> float:
+    """Score: PnL × Sharpe bonus × fill bonus × drawdown penalty."""
     sharpe_bonus = max(0.5, min(2.0, result.sharpe_ratio / 10.0))
     fill_bonus = min(1.5, result.total_fills / max(1, result.days) / 20.0)
     dd_penalty = max(0.3, 1.0 - result.max_drawdown / capital)
+    return result.net_pnl * sharpe_bonus * max(0.5, fill_bonus) * dd_penalty
 
-    score = result.net_pnl * sharpe_bonus * max(0.5, fill_bonus) * dd_penalty
 
-    return params_dict, {
+def _run_single_backtest(task):
+    """Worker function for parallel optimizer (see _init_worker for state).
+
+    `task` is a grid index tuple (one value index per REOPT_GRID key); it
+    comes back with the result so optimize_asset can collect results in
+    any order.
+    """
+    state = _WORKER_STATE
+    symbol, capital = state["symbol"], state["capital"]
+    params_dict = _grid_params(*state["grid"], task)
+
+    qp = QuoteParams(
+        base_spread_bps=params_dict["base_spread_bps"],
+        vol_multiplier=params_dict.get("vol_multiplier", 1.5),
+        inventory_skew_factor=params_dict["inventory_skew_factor"],
+        order_size_usd=params_dict["order_size_usd"],
+        num_levels=params_dict.get("num_levels", 2),
+    )
+
+    result = state["bt_factory"](quote_params=qp).run(state["candles"], symbol)
+    score = score_result(result, capital)
+
+    return task, {
         "net_pnl": round(result.net_pnl, 2),
         "sharpe": round(result.sharpe_ratio, 2),
         "fills": result.total_fills,
@@ -191,42 +310,65 @@ def optimize_asset(
     use_bias: bool = False,
     bias_strength: float = 0.0,
     workers: int = 8,
-) -> Tuple[Dict, Dict, float]:
-    """Run grid search optimizer for a single asset. Returns (best_params, details, score)."""
-    # Build param combos
-    keys = list(REOPT_GRID.keys())
-    values = list(REOPT_GRID.values())
-    combos = [dict(zip(keys, v)) for v in product(*values)]
-
-    # Serialize candles for multiprocessing
-    candles_data = [(c.timestamp, c.open, c.high, c.low, c.close, c.volume) for c in candles]
-
-    tasks = [
-        (combo, candles_data, symbol, capital, max_pos, use_bias, bias_strength)
-        for combo in combos
-    ]
-
-    logger.info(f"  {symbol}: testing {len(combos)} combinations with {workers} workers...")
-
-    with Pool(workers) as pool:
-        if HAS_TQDM:
-            results = list(tqdm(
-                pool.imap_unordered(_run_single_backtest, tasks),
-                total=len(tasks),
-                desc=f"  {symbol}",
-                ncols=80,
-            ))
-        else:
-            results = pool.map(_run_single_backtest, tasks)
-
-    # Sort by score descending
-    results.sort(key=lambda x: x[2], reverse=True)
-
-    if not results or results[0][2] <= 0:
-        return {}, {}, 0.0
-
-    best_params, best_details, best_score = results[0]
-    return best_params, best_details, best_score
+) -> Tuple[Dict, Dict, float, Dict[tuple, float]]:
+    """Run grid search optimizer for a single asset.
+
+    Returns (best_params, details, score, all_scores), where all_scores maps
+    every combo's _params_key to its score.
+    """
+    # Param grid: tasks are index tuples into these value lists
+    keys = tuple(REOPT_GRID)
+    values = tuple(tuple(v) for v in REOPT_GRID.values())
+    shape = tuple(len(v) for v in values)
+    n_combos = int(np.prod(shape))
+
+    # Serialize candles for multiprocessing: one shared-memory table that
+    # every worker attaches to
+    ts, ohlcv = _candles_to_arrays(candles)
+    table = np.empty(len(ts), dtype=[("ts", ts.dtype), ("ohlcv", np.float64, (5,))])
+    table["ts"] = ts
+    table["ohlcv"] = ohlcv
+
+    logger.info(f"  {symbol}: testing {n_combos} combinations with {workers} workers...")
+
+    # Candles and the grid travel once per worker via the initializer;
+    # tasks carry only the grid index
+    scores = np.full(n_combos, -np.inf)
+    details: List[Optional[Dict]] = [None] * n_combos
+    chunksize = max(1, n_combos // (workers * 4))
+    shm = SharedMemory(create=True, size=max(1, table.nbytes))
+    try:
+        np.ndarray(table.shape, table.dtype, buffer=shm.buf)[:] = table
+        with Pool(
+            workers,
+            initializer=_init_worker,
+            initargs=(shm.name, table.shape, table.dtype, (keys, values),
+                      symbol, capital, max_pos, use_bias, bias_strength),
+        ) as pool:
+            it = pool.imap_unordered(_run_single_backtest, np.ndindex(shape), chunksize=chunksize)
+            if HAS_TQDM:
+                it = tqdm(it, total=n_combos, desc=f"  {symbol}", ncols=80)
+            for idx, combo_details, score in it:
+                i = np.ravel_multi_index(idx, shape)
+                scores[i] = score
+                details[i] = combo_details
+    finally:
+        shm.close()
+        shm.unlink()
+
+    all_scores = {
+        tuple(v[j] for v, j in zip(values, idx)): float(scores[i])
+        for i, idx in enumerate(np.ndindex(shape))
+    }
+    if not n_combos:
+        return {}, {}, 0.0, all_scores
+    # argmax returns the first maximum, so ties go to the earliest grid combo
+    best = int(np.argmax(scores))
+    if scores[best] <= 0:
+        return {}, {}, 0.0, all_scores
+
+    best_params = _grid_params(keys, values, np.unravel_index(best, shape))
+    return best_params, details[best], float(scores[best]), all_scores
 
 
 def load_live_params() -> Dict[str, Dict]:
@@ -278,20 +420,21 @@ def check_drift(old_params: Dict, new_params: Dict) -> Tuple[bool, float, str]:
 
 
 def save_history(result: ReoptResult):
-    """Append result to daily history log."""
+    """Append result to the daily history log (one JSON object per line)."""
     date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    history_file = HISTORY_DIR / f"reopt_{date_str}.json"
+    history_file = HISTORY_DIR / f"reopt_{date_str}.ndjson"
     HISTORY_DIR.mkdir(parents=True, exist_ok=True)
 
-    history = []
-    if history_file.exists():
-        with open(history_file) as f:
-            history = json.load(f)
+    with open(history_file, "a") as f:
+        f.write(json.dumps(asdict(result), default=str) + "\n")
 
-    history.append(asdict(result))
 
-    with open(history_file, "w") as f:
-        json.dump(history, f, indent=2, default=str)
+def load_history(path) -> List[Dict[str, Any]]:
+    """Read a history file: NDJSON, or a legacy reopt_*.json array."""
+    with open(path) as f:
+        if Path(path).suffix == ".json":
+            return json.load(f)
+        return [json.loads(line) for line in f if line.strip()]
 
 
 def find_data_file(symbol: str, data_dir: Optional[str] = None) -> Optional[str]:
@@ -353,7 +496,7 @@ def run_reoptimization(
             continue
 
         # Load candles
-        candles = load_candles_csv(csv_file, days)
+        candles = _arrays_to_candles(*_cached_candles(csv_file, days))
         print(f"  {symbol}: loaded {len(candles)} candles from {csv_file}")
 
         # Current params (from live_params or profile defaults)
@@ -361,7 +504,7 @@ def run_reoptimization(
 
         # Run optimizer
         t0 = time.time()
-        new_params, details, new_score = optimize_asset(
+        new_params, details, new_score, all_scores = optimize_asset(
             symbol, candles, capital, max_pos, use_bias, bias_strength, workers,
         )
         elapsed = time.time() - t0
@@ -376,23 +519,15 @@ def run_reoptimization(
             ))
             continue
 
-        # Calculate old score (backtest with current params)
-        old_qp = QuoteParams(**{**QuoteParams().__dict__, **old_params})
-        old_bt = MMBacktester(
-            quote_params=old_qp,
-            max_position_usd=max_pos,
-            max_daily_loss=capital * 0.05,
-            capital=capital,
-            use_bias=use_bias,
-            bias_strength=bias_strength,
-            use_toxicity=True,
-            use_auto_tune=True,
-        )
-        old_result = old_bt.run(candles, symbol)
-        old_sharpe_b = max(0.5, min(2.0, old_result.sharpe_ratio / 10.0))
-        old_fill_b = min(1.5, old_result.total_fills / max(1, old_result.days) / 20.0)
-        old_dd_p = max(0.3, 1.0 - old_result.max_drawdown / capital)
-        old_score = old_result.net_pnl * old_sharpe_b * max(0.5, old_fill_b) * old_dd_p
+        # Calculate old score: reuse the grid run if the current params are
+        # a grid point, else backtest them
+        old_score = all_scores.get(_params_key(old_params))
+        if old_score is None:
+            old_qp = QuoteParams(**old_params)  # unset fields keep their defaults
+            old_bt = _backtester_factory(capital, max_pos, use_bias, bias_strength)(
+                quote_params=old_qp,
+            )
+            old_score = score_result(old_bt.run(candles, symbol), capital)
 
         # Improvement check
         improvement = ((new_score - old_score) / abs(old_score) * 100) if old_score != 0 else 100.0
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Detailed 365d backtest — full stats per asset with fees, volume, fills."""
-import sys, math
+import sys, math, os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import numpy as np
 
@@ -35,13 +36,16 @@ def run_full(sym, capital):
 
 
 def main():
-    results = {}
-    print("Running per-asset backtests at $12,500 capital...\n")
-    for sym in symbols:
-        print(f"  {sym}...", end=" ", flush=True)
-        r = run_full(sym, BASE_ALLOC)
-        results[sym] = r
-        print(f"done ({r.days}d, {r.total_fills} fills)")
+    print("Running per-asset backtests at $12,500 capital...\n", flush=True)
+    # Assets are independent: one process per symbol. MM_SEQUENTIAL=1 runs
+    # them in-process instead (debuggers, profilers).
+    if os.getenv("MM_SEQUENTIAL") == "1":
+        results = {sym: run_full(sym, BASE_ALLOC) for sym in symbols}
+    else:
+        with ProcessPoolExecutor(max_workers=min(len(symbols), os.cpu_count() or 1)) as ex:
+            results = dict(zip(symbols, ex.map(run_full, symbols, [BASE_ALLOC] * len(symbols))))
+    for sym, r in results.items():
+        print(f"  {sym}... done ({r.days}d, {r.total_fills} fills)")
 
     # Volume calc: fills * avg_size
     # Fee calc from result
@@ -1,5 +1,6 @@
 """Compare backtest results with rebate vs real cost fees."""
 import sys
+from multiprocessing import Pool, cpu_count
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from backtest.mm_backtester import MMBacktester, load_candles_csv
@@ -12,34 +13,63 @@ assets = {
     "SOLUSDT": {"spread": 1.5, "skew": 0.5, "size": 150, "bias": False, "bias_str": 0.0},
     "XRPUSDT": {"spread": 1.5, "skew": 0.5, "size": 150, "bias": True, "bias_str": 0.2},
 }
+fees = [("REBATE -0.015%", -0.00015), ("COST +0.015%", 0.00015), ("ZERO 0%", 0.0)]
 
 capital = 12500
 scale = capital / 1000.0
 
-for fee_label, maker_fee in [("REBATE -0.015%", -0.00015), ("COST +0.015%", 0.00015), ("ZERO 0%", 0.0)]:
-    print(f"=== {fee_label} ===")
-    total_pnl = 0
-    total_fees = 0
-    total_gross = 0
-    for sym, p in assets.items():
-        candles = load_candles_csv(str(data_dir / f"{sym}_1h.csv"), 225)
-        qp = QuoteParams(
-            base_spread_bps=p["spread"], vol_multiplier=1.5,
-            inventory_skew_factor=p["skew"], order_size_usd=p["size"] * scale, num_levels=2
-        )
-        bt = MMBacktester(
-            quote_params=qp, maker_fee=maker_fee, taker_fee=0.00045,
-            max_position_usd=capital * 0.5, max_daily_loss=capital * 0.05,
-            capital=capital, use_bias=p["bias"], bias_strength=p["bias_str"],
-            use_toxicity=True, use_auto_tune=True
-        )
-        r = bt.run(candles, sym)
-        short = sym.replace("USDT", "")
-        print(f"  {short}: Net=${r.net_pnl:>8,.0f}  Gross=${r.gross_pnl:>8,.0f}  Fees=${r.total_fees:>8,.0f}  Fills={r.total_fills}")
-        total_pnl += r.net_pnl
-        total_fees += r.total_fees
-        total_gross += r.gross_pnl
-    print(f"  ---")
-    print(f"  TOTAL: Net=${total_pnl:>8,.0f}  Gross=${total_gross:>8,.0f}  Fees=${total_fees:>8,.0f}")
-    print(f"  Return on $50K: {total_pnl/50000*100:.1f}%")
-    print()
+# Per-worker candles, parsed once in main() and handed over by _init_worker
+_candles_by_sym = {}
+
+
+def _init_worker(candles_by_sym):
+    """Pool initializer: receive every symbol's candles once."""
+    _candles_by_sym.update(candles_by_sym)
+
+
+def _run_fee_task(task):
+    """Backtest one (fee scenario, symbol) pair and return its summary row."""
+    fee_label, maker_fee, sym, p = task
+    candles = _candles_by_sym[sym]
+    qp = QuoteParams(
+        base_spread_bps=p["spread"], vol_multiplier=1.5,
+        inventory_skew_factor=p["skew"], order_size_usd=p["size"] * scale, num_levels=2
+    )
+    bt = MMBacktester(
+        quote_params=qp, maker_fee=maker_fee, taker_fee=0.00045,
+        max_position_usd=capital * 0.5, max_daily_loss=capital * 0.05,
+        capital=capital, use_bias=p["bias"], bias_strength=p["bias_str"],
+        use_toxicity=True, use_auto_tune=True
+    )
+    r = bt.run(candles, sym)
+    return fee_label, sym, r.net_pnl, r.gross_pnl, r.total_fees, r.total_fills
+
+
+def main():
+    # Every (fee scenario, symbol) backtest is independent: run them all in one pool
+    tasks = [(fee_label, maker_fee, sym, p) for fee_label, maker_fee in fees for sym, p in assets.items()]
+    # Parse each CSV once; the fee scenarios share the same candles
+    candles_by_sym = {sym: load_candles_csv(str(data_dir / f"{sym}_1h.csv"), 225) for sym in assets}
+    with Pool(min(len(tasks), cpu_count()), initializer=_init_worker, initargs=(candles_by_sym,)) as pool:
+        rows = {(row[0], row[1]): row[2:] for row in pool.imap_unordered(_run_fee_task, tasks)}
+
+    for fee_label, _ in fees:
+        print(f"=== {fee_label} ===")
+        total_pnl = 0
+        total_fees = 0
+        total_gross = 0
+        for sym in assets:
+            net, gross, paid, fills = rows[(fee_label, sym)]
+            short = sym.replace("USDT", "")
+            print(f"  {short}: Net=${net:>8,.0f}  Gross=${gross:>8,.0f}  Fees=${paid:>8,.0f}  Fills={fills}")
+            total_pnl += net
+            total_fees += paid
+            total_gross += gross
+        print(f"  ---")
+        print(f"  TOTAL: Net=${total_pnl:>8,.0f}  Gross=${total_gross:>8,.0f}  Fees=${total_fees:>8,.0f}")
+        print(f"  Return on $50K: {total_pnl/50000*100:.1f}%")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,7 @@
 """Tests for AdaptiveMMStrategy — regime detection, spread adjustment, fill rate, inventory decay."""
 
+import asyncio
+
 import pytest
 from collections import deque
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -21,6 +23,22 @@ from bot_mm.strategies.adaptive_mm import (
 )
 
 
+def run_async(test):
+    """Run an async test method on its own event loop.
+
+    Unlike pytest-asyncio, this never clears the thread's current loop, so
+    later tests that call asyncio.get_event_loop() still work.
+    """
+    def wrapper(*args, **kwargs):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(test(*args, **kwargs))
+        finally:
+            loop.close()
+    wrapper.__doc__ = test.__doc__
+    return wrapper
+
+
 def make_config(**overrides) -> AssetMMConfig:
     quote_kw = overrides.pop("quote", {})
     risk_kw = overrides.pop("risk", {})
@@ -119,6 +137,54 @@ class TestRegimeDetection:
         regime = s.detect_regime()
         assert regime == VolRegime.HIGH
 
+    def test_vol_properties_cached_by_detect_regime(self):
+        """short/medium/long_vol report the values the last regime call used."""
+        s = make_strategy(vol_short=5, vol_long=50)
+        _feed_prices(s, [50000 + (i % 3) * 10 for i in range(30)])
+        assert s.short_vol == 0.0
+
+        s.detect_regime()
+        assert s.short_vol == pytest.approx(s._calc_rolling_vol(5))
+        assert s.medium_vol == pytest.approx(s._calc_rolling_vol(20))
+        assert s.long_vol == pytest.approx(s._calc_rolling_vol(50))
+
+    def test_fused_market_stats_match_separate_updates(self):
+        """_update_market_stats == _record_return + _update_volatility + detect_regime."""
+        import random
+        random.seed(11)
+        fused = make_strategy(vol_short=5, vol_long=50)
+        split = make_strategy(vol_short=5, vol_long=50)
+        price = 50000.0
+        for i in range(120):
+            price += random.gauss(0, 30 if i < 90 else 150)
+            fused._update_market_stats(price)
+            fused._last_mid = price
+
+            split._record_return(price)
+            split._update_volatility(price)
+            split.detect_regime()
+            split._last_mid = price
+
+            assert fused.regime == split.regime
+            assert fused._volatility_pct == pytest.approx(split._volatility_pct, rel=1e-12)
+            assert fused.short_vol == pytest.approx(split.short_vol, rel=1e-12)
+            assert fused.medium_vol == pytest.approx(split.medium_vol, rel=1e-12)
+            assert fused.long_vol == pytest.approx(split.long_vol, rel=1e-12)
+
+    def test_incremental_vol_matches_stdev(self):
+        """Running-sum rolling std equals a from-scratch stdev, across ring wraps."""
+        import random
+        import statistics
+        random.seed(7)
+        s = make_strategy(vol_short=5, vol_medium=20, vol_long=50)
+        prices = [50000 + random.gauss(0, 50) for _ in range(180)]
+        _feed_prices(s, prices)
+
+        returns = [(b - a) / a for a, b in zip(prices, prices[1:])]
+        for window in (5, 20, 50, 7, 40):  # 7, 40: untracked; 40 spans the wrap
+            expected = statistics.stdev(returns[-window:])
+            assert s._calc_rolling_vol(window) == pytest.approx(expected, rel=1e-9)
+
 
 # ═══════════════════════════════════════════════════════════════
 # 2. Spread adjustment per regime
@@ -141,7 +207,7 @@ class TestSpreadAdjustment:
         s._regime = VolRegime.NORMAL
         mid = 50000.0
         quotes = self._make_quotes(mid)
-        adjusted = s.adjust_quotes(quotes, mid, inventory_usd=0.0)
+        adjusted = s.adjust_quotes(self._make_quotes(mid), mid, inventory_usd=0.0)
 
         for orig, adj in zip(quotes, adjusted):
             assert adj.price == pytest.approx(orig.price, rel=1e-9)
@@ -153,7 +219,7 @@ class TestSpreadAdjustment:
         s._regime = VolRegime.LOW
         mid = 50000.0
         quotes = self._make_quotes(mid)
-        adjusted = s.adjust_quotes(quotes, mid, inventory_usd=0.0)
+        adjusted = s.adjust_quotes(self._make_quotes(mid), mid, inventory_usd=0.0)
 
         bid_orig = quotes[0].price
         bid_adj = adjusted[0].price
@@ -177,7 +243,7 @@ class TestSpreadAdjustment:
         s._regime = VolRegime.HIGH
         mid = 50000.0
         quotes = self._make_quotes(mid)
-        adjusted = s.adjust_quotes(quotes, mid, inventory_usd=0.0)
+        adjusted = s.adjust_quotes(self._make_quotes(mid), mid, inventory_usd=0.0)
 
         bid_orig = quotes[0].price
         bid_adj = adjusted[0].price
@@ -200,19 +266,28 @@ class TestSpreadAdjustment:
         s = make_strategy()
         mid = 50000.0
         offset = 10.0  # 2 bps
-        quotes = [
-            Quote(price=mid - offset, size=0.01, side="buy", level=0),
-            Quote(price=mid + offset, size=0.01, side="sell", level=0),
-        ]
-
         for regime in VolRegime:
             s._regime = regime
+            quotes = [
+                Quote(price=mid - offset, size=0.01, side="buy", level=0),
+                Quote(price=mid + offset, size=0.01, side="sell", level=0),
+            ]
             adjusted = s.adjust_quotes(quotes, mid, inventory_usd=0.0)
             expected_bid = mid - offset * REGIME_SPREAD_MULT[regime]
             expected_ask = mid + offset * REGIME_SPREAD_MULT[regime]
             assert adjusted[0].price == pytest.approx(expected_bid, rel=1e-9), f"Failed for {regime}"
             assert adjusted[1].price == pytest.approx(expected_ask, rel=1e-9), f"Failed for {regime}"
 
+    def test_adjust_quotes_in_place(self):
+        """adjust_quotes updates the given Quote objects rather than copying them."""
+        s = make_strategy()
+        s._regime = VolRegime.HIGH
+        quotes = self._make_quotes()
+        originals = list(quotes)
+        adjusted = s.adjust_quotes(quotes, 50000.0, inventory_usd=0.0)
+        assert adjusted is quotes
+        assert all(a is b for a, b in zip(adjusted, originals))
+
 
 # ═══════════════════════════════════════════════════════════════
 # 3. Fill rate tracking
@@ -423,3 +498,410 @@ class TestAdjustQuotesIntegration:
         buy_offset = mid - adjusted[0].price
         sell_offset = adjusted[1].price - mid
         assert buy_offset > sell_offset  # Buy widened more due to decay
+
+    def test_array_path_matches_quote_path(self):
+        """adjust_quote_arrays applies the same multipliers as adjust_quotes."""
+        s = make_strategy(decay_candles=5)
+        s._regime = VolRegime.HIGH
+        for _ in range(10):
+            s.record_fills(num_fills=8, num_quotes=10)
+        for _ in range(15):
+            s._update_inventory_age(500.0)
+
+        mid = 50000.0
+        prices, sizes, is_buy, levels = s.quoter.calculate_quotes_arrays(
+            mid, 0.002, 500.0, 1000.0,
+        )
+        expected = s.adjust_quotes(
+            s.quoter.quotes_from_arrays(prices, sizes, is_buy, levels), mid, 500.0,
+        )
+        new_prices, new_sizes = s.adjust_quote_arrays(prices, sizes, is_buy, mid, 500.0)
+
+        assert list(new_prices) == pytest.approx([q.price for q in expected], rel=1e-12)
+        assert list(new_sizes) == pytest.approx([q.size for q in expected], rel=1e-12)
+
+
+# ═══════════════════════════════════════════════════════════════
+# 6. run_iteration — quote reuse when inputs are unchanged
+# ═══════════════════════════════════════════════════════════════
+
+
+class TestQuoteReuse:
+
+    @run_async
+    async def test_flat_mid_reuses_quotes(self):
+        """Identical inputs on consecutive cycles skip quote generation."""
+        s = make_strategy()
+        s.order_mgr.update_quotes = AsyncMock()
+        s.order_mgr.check_partial_fills = AsyncMock(return_value=[])
+        calc = MagicMock(wraps=s.quoter.calculate_quotes_arrays)
+        s.quoter.calculate_quotes_arrays = calc
+
+        for _ in range(40):
+            await s.run_iteration()
+
+        assert s._iteration == 40
+        assert calc.call_count < 40
+        last_sent = s.order_mgr.update_quotes.call_args[0][0]
+        assert last_sent is s._cached_filtered
+        assert len(last_sent) == 2 * s.config.quote.num_levels
+
+    @run_async
+    async def test_fill_invalidates_reuse(self):
+        """A position change rebuilds quotes even at the same mid."""
+        s = make_strategy()
+        s.order_mgr.update_quotes = AsyncMock()
+        s.order_mgr.check_partial_fills = AsyncMock(return_value=[])
+        for _ in range(40):
+            await s.run_iteration()
+        cached = s._cached_filtered
+
+        s.inventory.on_fill("buy", 50000.0, 0.001)
+        await s.run_iteration()
+        assert s._cached_filtered is not cached
+
+
+class TestBasicQuoteAdjustment:
+
+    @run_async
+    async def test_toxicity_and_emergency_compose(self):
+        """Fused pass == toxicity widening followed by emergency widening."""
+        from bot_mm.core.risk import RiskStatus
+        from bot_mm.strategies.basic_mm import BasicMMStrategy
+
+        base = make_strategy()
+        s = BasicMMStrategy(base.exchange, base.config)
+        s.order_mgr.update_quotes = AsyncMock()
+        s.order_mgr.check_partial_fills = AsyncMock(return_value=[])
+        s.risk.check_all = MagicMock(return_value=RiskStatus.CRITICAL)
+        s._toxicity = MagicMock(fills_measured=20)
+        s._toxicity.get_side_multipliers.return_value = (2.0, 1.5)
+
+        raw = []
+        orig_calc = s.quoter.calculate_quotes_arrays
+
+        def calc(**kwargs):
+            prices, sizes, is_buy, levels = orig_calc(**kwargs)
+            raw.extend(("buy" if b else "sell", p) for p, b in zip(prices, is_buy))
+            return prices, sizes, is_buy, levels
+
+        s.quoter.calculate_quotes_arrays = calc
+        await s.run_iteration()
+
+        mid = 50000.0
+        k = s.config.risk.emergency_spread_mult * 1e-4
+        sent = s.order_mgr.update_quotes.call_args[0][0]
+        assert len(sent) == len(raw)
+        for q, (side, p) in zip(sent, raw):
+            if side == "buy":
+                expected = (mid - (mid - p) * 2.0) * (1 - k)
+            else:
+                expected = (mid + (p - mid) * 1.5) * (1 + k)
+            assert q.price == pytest.approx(expected, rel=1e-12)
+
+
+    @run_async
+    async def test_paused_side_not_quoted(self):
+        from bot_mm.strategies.basic_mm import BasicMMStrategy
+
+        base = make_strategy()
+        s = BasicMMStrategy(base.exchange, base.config)
+        s.order_mgr.update_quotes = AsyncMock()
+        s.inventory.on_fill("buy", 50000.0, s.config.risk.max_position_usd * 0.9 / 50000.0)
+        await s.run_iteration()
+
+        sent = s.order_mgr.update_quotes.call_args[0][0]
+        assert sent and all(q.side == "sell" for q in sent)
+
+
+    def test_basic_strategy_is_slotted(self):
+        from bot_mm.strategies.basic_mm import BasicMMStrategy
+
+        base = make_strategy()
+        s = BasicMMStrategy(base.exchange, base.config)
+        assert not hasattr(s, "__dict__")
+        with pytest.raises(AttributeError):
+            s._volatilty_pct = 0.01  # typo'd attribute
+
+
+class TestBasicQuoteReuse:
+
+    def _basic(self):
+        from bot_mm.strategies.basic_mm import BasicMMStrategy
+
+        base = make_strategy()
+        s = BasicMMStrategy(base.exchange, base.config)
+        s.order_mgr.update_quotes = AsyncMock()
+        s.quoter.calculate_quotes_arrays = MagicMock(wraps=s.quoter.calculate_quotes_arrays)
+        return s
+
+    @run_async
+    async def test_unchanged_inputs_skip_quote_generation(self):
+        s = self._basic()
+        for _ in range(5):
+            await s.run_iteration()
+        # Sub-tolerance mid wiggle (0.5e-6 relative) still reuses
+        s.exchange.get_mid_price = AsyncMock(return_value=50000.02)
+        await s.run_iteration()
+
+        calls = s.quoter.calculate_quotes_arrays.call_count
+        assert calls < 6
+        assert s.order_mgr.update_quotes.await_count == 6
+        assert s.order_mgr.update_quotes.call_args[0][0] is s._cached_quotes
+
+    @run_async
+    async def test_material_change_rebuilds(self):
+        s = self._basic()
+        for _ in range(5):
+            await s.run_iteration()
+        calls = s.quoter.calculate_quotes_arrays.call_count
+
+        s.exchange.get_mid_price = AsyncMock(return_value=50100.0)
+        await s.run_iteration()
+        assert s.quoter.calculate_quotes_arrays.call_count == calls + 1
+
+    @run_async
+    async def test_critical_quotes_not_cached(self):
+        from bot_mm.core.risk import RiskStatus
+
+        s = self._basic()
+        s.risk.check_all = MagicMock(return_value=RiskStatus.CRITICAL)
+        for _ in range(3):
+            await s.run_iteration()
+        assert s.quoter.calculate_quotes_arrays.call_count == 3
+        assert s._quote_inputs is None
+
+
+class TestFillBooking:
+
+    @run_async
+    async def test_detected_fill_booked_via_callback(self):
+        """A fill found by check_partial_fills updates inventory through _handle_fill."""
+        from bot_mm.core.order_manager import ManagedOrder
+
+        s = make_strategy()
+        q = Quote(price=49990.0, size=0.002, side="buy", level=0)
+        s.order_mgr.active_orders["b1"] = ManagedOrder(
+            oid="b1", symbol="BTCUSDT", side="buy", price=q.price, size=q.size, quote=q)
+        s.exchange.get_open_orders = AsyncMock(return_value=[])  # order gone → filled
+
+        await s.order_mgr.check_partial_fills(50000.0, maker_fee=s.config.maker_fee)
+        assert s.inventory.state.position_size == pytest.approx(0.002)
+        assert s.inventory.state.num_buys == 1
+        assert s.inventory.state.total_fees == pytest.approx(
+            49990.0 * 0.002 * s.config.maker_fee)
+
+    @run_async
+    async def test_fills_checked_alongside_mid_before_quoting(self):
+        """run_iteration books last cycle's fills before computing new quotes."""
+        from bot_mm.core.order_manager import ManagedOrder
+
+        s = make_strategy()
+        q = Quote(price=49990.0, size=0.002, side="buy", level=0)
+        s.order_mgr.active_orders["b1"] = ManagedOrder(
+            oid="b1", symbol="BTCUSDT", side="buy", price=q.price, size=q.size, quote=q)
+        s.exchange.get_open_orders = AsyncMock(return_value=[])
+        seen = {}
+        orig = s.quoter.calculate_quotes_arrays
+
+        def calc(**kwargs):
+            seen["inventory_usd"] = kwargs["inventory_usd"]
+            return orig(**kwargs)
+
+        s.quoter.calculate_quotes_arrays = calc
+        await s.run_iteration()
+
+        s.exchange.get_open_orders.assert_awaited_once()
+        assert seen["inventory_usd"] == pytest.approx(0.002 * 50000.0)
+        assert s._fill_events[-1] == 1
+
+    @run_async
+    async def test_reconcile_resyncs_drifted_position(self):
+        s = make_strategy()
+        s.inventory.on_fill("buy", 50000.0, 0.002)
+        s.exchange.get_position = AsyncMock(
+            return_value={"size": 0.001, "side": "long", "entry_price": 49900.0})
+
+        await s._reconcile_position()
+        assert s.inventory.state.position_size == pytest.approx(0.001)
+        assert s.inventory.state.avg_entry_price == 49900.0
+
+    @run_async
+    async def test_reconcile_skips_when_fill_lands_in_flight(self):
+        s = make_strategy()
+
+        async def position_with_fill(symbol):
+            s.order_mgr.total_fills += 1
+            return {"size": 0.5, "side": "short"}
+
+        s.exchange.get_position = position_with_fill
+        await s._reconcile_position()
+        assert s.inventory.state.position_size == 0.0
+
+    @run_async
+    async def test_reconcile_scheduled_every_n_iterations(self):
+        s = make_strategy()
+        s._reconcile_every = 3
+        for _ in range(3):
+            await s.run_iteration()
+        assert s._reconcile_task is not None
+        await s._reconcile_task
+        s.exchange.get_position.assert_awaited_once()
+
+    @run_async
+    async def test_shutdown_cancels_reconcile_before_cancel_all(self):
+        s = make_strategy()
+        started = asyncio.Event()
+
+        async def slow_position(symbol):
+            started.set()
+            await asyncio.sleep(60)
+
+        s.exchange.get_position = slow_position
+        s._iteration = s._reconcile_every
+        s._maybe_reconcile()
+        task = s._reconcile_task
+        await started.wait()
+
+        seen = []
+        s.order_mgr.cancel_all = AsyncMock(side_effect=lambda: seen.append(task.done()))
+        await s._shutdown()
+        assert seen == [True]
+        assert task.cancelled()
+        assert s._reconcile_task is None
+
+
+# ═══════════════════════════════════════════════════════════════
+# 7. Hot reload of live_params.json
+# ═══════════════════════════════════════════════════════════════
+
+
+class TestParamsReload:
+
+    def _write_params(self, path, spread):
+        import json
+        path.write_text(json.dumps({"BTCUSDT": {"base_spread_bps": spread}}))
+
+    def test_watcher_triggers_reload(self, tmp_path):
+        """With watchdog, a file change flips the flag and the next cycle reloads."""
+        pytest.importorskip("watchdog")
+        from watchdog.events import FileModifiedEvent
+        from bot_mm.strategies import basic_mm
+
+        s = make_strategy()
+        s._live_params_file = tmp_path / "live_params.json"
+        self._write_params(s._live_params_file, 3.0)
+        with patch.object(basic_mm, "Observer") as observer_cls:
+            s._start_params_watch()
+        assert s._params_observer is observer_cls.return_value
+        handler = observer_cls.return_value.schedule.call_args[0][0]
+
+        s._maybe_reload_params()
+        assert s.config.quote.base_spread_bps == 3.0
+        assert s._params_dirty is False
+
+        handler.on_any_event(FileModifiedEvent(str(tmp_path / "other.json")))
+        assert s._params_dirty is False
+
+        self._write_params(s._live_params_file, 4.5)
+        handler.on_any_event(FileModifiedEvent(str(s._live_params_file)))
+        assert s._params_dirty
+        s._maybe_reload_params()
+        assert s.quoter.params.base_spread_bps == 4.5
+
+        s._stop_params_watch()
+        observer_cls.return_value.stop.assert_called_once()
+
+    def test_polling_fallback_without_watcher(self, tmp_path):
+        """Without an observer, params are checked every _params_check_interval cycles."""
+        s = make_strategy()
+        s._live_params_file = tmp_path / "live_params.json"
+        self._write_params(s._live_params_file, 3.5)
+        s._params_check_interval = 10
+
+        s._iteration = 5
+        s._maybe_reload_params()
+        assert s.config.quote.base_spread_bps != 3.5
+        s._iteration = 10
+        s._maybe_reload_params()
+        assert s.config.quote.base_spread_bps == 3.5
+
+
+# ═══════════════════════════════════════════════════════════════
+# 8. Main loop scheduling
+# ═══════════════════════════════════════════════════════════════
+
+
+class TestLoopScheduling:
+
+    @run_async
+    async def test_ticks_follow_fixed_grid(self):
+        """Sleeps target start + k*interval; with the clock frozen by the mocked
+        sleep, the k-th delay is the remaining distance to tick k."""
+        s = make_strategy()
+        interval_s = s.config.quote.quote_refresh_ms / 1000.0
+        calls = 0
+
+        async def fake_iteration():
+            nonlocal calls
+            calls += 1
+            if calls == 3:
+                await s.stop()
+
+        s.run_iteration = fake_iteration
+        s._shutdown = AsyncMock()
+        with patch("bot_mm.strategies.basic_mm.asyncio.sleep", new=AsyncMock()) as sleep:
+            await s.start()
+
+        assert calls == 3
+        assert sleep.await_count == 3
+        for k, call in enumerate(sleep.await_args_list, start=1):
+            delay = call.args[0]
+            assert (k - 1) * interval_s < delay <= k * interval_s
+        s._shutdown.assert_awaited_once()
+
+    @run_async
+    async def test_long_overrun_resyncs_grid(self):
+        """A cycle more than one interval late resyncs instead of bursting."""
+        import asyncio
+
+        s = make_strategy()
+        interval_s = s.config.quote.quote_refresh_ms / 1000.0
+        loop = asyncio.get_running_loop()
+        clock = [loop.time()]
+        calls = 0
+
+        async def slow_iteration():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                clock[0] += 3 * interval_s  # stall
+            if calls == 2:
+                await s.stop()
+
+        s.run_iteration = slow_iteration
+        s._shutdown = AsyncMock()
+        with patch.object(loop, "time", lambda: clock[0]), \
+                patch("bot_mm.strategies.basic_mm.asyncio.sleep", new=AsyncMock()) as sleep:
+            await s.start()
+
+        assert sleep.await_args_list[0].args[0] == pytest.approx(interval_s)
+
+
+class TestStatusLogging:
+
+    def test_status_skipped_when_info_disabled(self):
+        """Status args (and toxicity summary) aren't built when INFO is off."""
+        from bot_mm.strategies import adaptive_mm
+
+        s = make_strategy()
+        s._toxicity = MagicMock(fills_measured=5)
+        with patch.object(adaptive_mm.logger, "isEnabledFor", return_value=False), \
+                patch.object(adaptive_mm.logger, "info") as info:
+            s._log_adaptive_status(50000.0)
+        info.assert_not_called()
+
+        from bot_mm.strategies import basic_mm
+        with patch.object(basic_mm.logger, "isEnabledFor", return_value=False):
+            basic_mm.BasicMMStrategy._log_status(s, 50000.0)
+        s._toxicity.summary.assert_not_called()
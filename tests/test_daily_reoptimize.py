@@ -0,0 +1,151 @@
+"""Tests for daily_reoptimize candle transport and helpers."""
+
+import json
+import sys
+from itertools import product
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import daily_reoptimize
+from daily_reoptimize import (
+    REOPT_GRID,
+    Candle,
+    ReoptResult,
+    _arrays_to_candles,
+    _candles_to_arrays,
+    _cached_candles,
+    _grid_params,
+    _params_key,
+    load_candles_csv,
+    load_history,
+    save_history,
+)
+
+
+# ── candle SoA transport ─────────────────────────────────────────────────
+
+class TestCandleArrays:
+    """Candles survive the array round trip used for worker transport."""
+
+    def test_roundtrip(self):
+        candles = [
+            Candle("2024-01-01 00:00:00", 100.0, 101.5, 99.25, 100.75, 12.5),
+            Candle("2024-01-01 01:00:00", 100.75, 102.0, 100.0, 101.0, 0.0),
+        ]
+        ts, ohlcv = _candles_to_arrays(candles)
+        assert ts.dtype == np.dtype("datetime64[s]")
+        assert ohlcv.shape == (2, 5)
+        assert _arrays_to_candles(ts, ohlcv) == candles
+
+    def test_unparsed_timestamps_and_empty(self):
+        odd = [Candle("1700000000000x", 1.0, 2.0, 0.5, 1.5, 3.0)]
+        assert _arrays_to_candles(*_candles_to_arrays(odd)) == odd
+        assert _arrays_to_candles(*_candles_to_arrays([])) == []
+
+
+
+class TestCachedCandles:
+    """On-disk candle cache matches load_candles_csv and skips re-parsing."""
+
+    def _csv(self, tmp_path, n=60):
+        csv = tmp_path / "BTCUSDT_1h.csv"
+        rows = ["timestamp,open,high,low,close,volume"]
+        for k in range(n):
+            rows.append(f"{1700000000000 + k * 3600000},{100 + k},{101 + k},{99 + k},{100.5 + k},{k}")
+        csv.write_text("\n".join(rows) + "\n")
+        return csv
+
+    def test_matches_csv_loader(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(daily_reoptimize, "CANDLE_CACHE_DIR", tmp_path / "cache")
+        csv = self._csv(tmp_path)
+        for days in (0, 1, 2):
+            candles = _arrays_to_candles(*_cached_candles(str(csv), days))
+            assert candles == load_candles_csv(str(csv), days)
+
+    def test_second_load_uses_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(daily_reoptimize, "CANDLE_CACHE_DIR", tmp_path / "cache")
+        csv = self._csv(tmp_path)
+        with patch.object(daily_reoptimize, "load_candles_csv", wraps=load_candles_csv) as load:
+            _cached_candles(str(csv), 1)
+            ts, _ = _cached_candles(str(csv), 2)
+            assert load.call_count == 1
+            assert len(ts) == 48
+            csv.write_text(csv.read_text() + "1700216000000,1,1,1,1,1\n")
+            _cached_candles(str(csv), 1)
+            assert load.call_count == 2
+            ts, _ = _cached_candles(str(csv), 0)
+            assert load.call_count == 2
+            assert len(ts) == 61
+        # Refreshing the CSV overwrites its cache file instead of adding one
+        assert len(list((tmp_path / "cache").glob("*.npz"))) == 1
+
+
+# ── index-based param grid ───────────────────────────────────────────────
+
+class TestGridParams:
+    """Grid indices map to the same combos, in the same order, as product()."""
+
+    def test_matches_product_order(self):
+        keys = tuple(REOPT_GRID)
+        values = tuple(tuple(v) for v in REOPT_GRID.values())
+        shape = tuple(len(v) for v in values)
+        expected = [dict(zip(keys, v)) for v in product(*values)]
+        got = [_grid_params(keys, values, idx) for idx in np.ndindex(shape)]
+        assert got == expected
+        flat = [int(np.ravel_multi_index(idx, shape)) for idx in np.ndindex(shape)]
+        assert flat == list(range(len(expected)))
+
+    def test_values_stay_python_types(self):
+        keys = tuple(REOPT_GRID)
+        values = tuple(tuple(v) for v in REOPT_GRID.values())
+        shape = tuple(len(v) for v in values)
+        params = _grid_params(keys, values, np.unravel_index(5, shape))
+        assert all(type(v) in (int, float) for v in params.values())
+
+
+class TestParamsKey:
+    """Live params map onto grid keys the way the old-score backtest runs them."""
+
+    def test_profile_params_fill_quoteparams_defaults(self):
+        # vol_multiplier missing → QuoteParams default 1.5
+        key = _params_key({
+            "base_spread_bps": 2.0, "inventory_skew_factor": 0.3,
+            "order_size_usd": 150, "num_levels": 2,
+        })
+        assert key == (2.0, 1.5, 0.3, 150, 2)
+
+    def test_off_grid_field_is_a_miss(self):
+        assert _params_key({"base_spread_bps": 2.0, "max_spread_bps": 30.0}) is None
+        # Off-grid field at its default value is still a hit
+        assert _params_key({"base_spread_bps": 2.0, "max_spread_bps": 20.0}) is not None
+
+
+# ── history log ──────────────────────────────────────────────────────────
+
+class TestHistory:
+    """History is appended as NDJSON; legacy JSON arrays still load."""
+
+    def _result(self, symbol):
+        return ReoptResult(
+            symbol=symbol, timestamp="2026-01-01T00:00:00", old_params={},
+            new_params={"base_spread_bps": 1.5}, old_score=1.0, new_score=2.0,
+            improvement_pct=100.0, applied=False, reason="dry run", details={},
+        )
+
+    def test_append_and_load(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(daily_reoptimize, "HISTORY_DIR", tmp_path)
+        save_history(self._result("BTCUSDT"))
+        save_history(self._result("ETHUSDT"))
+        (path,) = tmp_path.glob("reopt_*.ndjson")
+        assert len(path.read_text().splitlines()) == 2
+        assert [r["symbol"] for r in load_history(path)] == ["BTCUSDT", "ETHUSDT"]
+
+    def test_legacy_json_array(self, tmp_path):
+        path = tmp_path / "reopt_2026-01-01.json"
+        path.write_text(json.dumps([{"symbol": "SOLUSDT"}], indent=2))
+        assert load_history(path) == [{"symbol": "SOLUSDT"}]
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 import numpy as np
 import pytest
 
-from bot_mm.ml.fill_predictor import FillPredictor, FEATURE_NAMES
+from bot_mm.ml.fill_predictor import FillPredictor, FEATURE_NAMES, FEATURE_DTYPE
 from bot_mm.ml.data_generator import FillDataGenerator
 
 
@@ -135,6 +135,13 @@ class TestFeatureExtraction:
         features = _make_features(predictor, quote_side="sell")
         assert features["side_is_buy"] == 0.0
 
+    def test_features_to_array_float32(self):
+        """Single-quote feature vector uses the shared float32 dtype."""
+        predictor = FillPredictor()
+        x = predictor._features_to_array(_make_features(predictor))
+        assert x.shape == (1, len(FEATURE_NAMES))
+        assert x.dtype == FEATURE_DTYPE
+
 
 class TestPrediction:
     def test_untrained_raises(self):
@@ -189,6 +196,48 @@ class TestPrediction:
         assert predictor.is_trained is True
 
 
+class TestDistanceBypass:
+    @staticmethod
+    def _train_separable() -> FillPredictor:
+        """Fill label depends only on distance, so far quotes pin to ~0."""
+        rng = np.random.RandomState(7)
+        X = rng.randn(1000, len(FEATURE_NAMES))
+        X[:, 0] = rng.uniform(0, 30, 1000)
+        y_fill = (X[:, 0] < 10).astype(int)
+        y_adverse = (y_fill & (rng.random(1000) < 0.3)).astype(int)
+        predictor = FillPredictor()
+        predictor.train(X, y_fill, y_adverse)
+        return predictor
+
+    def test_far_quote_skips_models(self):
+        """Beyond the calibrated far threshold predict() never touches the models."""
+        predictor = self._train_separable()
+        assert predictor._bypass_far_bps is not None
+        expected = predictor.predict(_make_features(predictor, quote_price=50000 * (1 - 50 / 10000)))
+
+        predictor._fill_model = None
+        predictor._adverse_model = None
+        result = predictor.predict(_make_features(predictor, quote_price=50000 * (1 - 50 / 10000)))
+        assert result == expected
+        assert result[0] <= 0.02
+
+    def test_noisy_labels_disable_bypass(self):
+        """With label noise no region is pinned, so the bypass stays off."""
+        predictor = _train_predictor()
+        assert predictor._bypass_far_bps is None
+        assert predictor._bypass_near_bps is None
+
+    def test_thresholds_survive_save_load(self):
+        predictor = self._train_separable()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "bypass_model.joblib")
+            predictor.save(path)
+            loaded = FillPredictor()
+            loaded.load(path)
+        assert loaded._bypass_far_bps == predictor._bypass_far_bps
+        assert loaded._bypass_far_result == predictor._bypass_far_result
+
+
 class TestSaveLoad:
     def test_save_load(self):
         """Save model, load it, predictions match."""
@@ -226,6 +275,7 @@ class TestDataGenerator:
         usable = 100 - max(gen.atr_period, 21)
         expected_samples = usable * 2 * 2  # 2 distances × 2 sides
         assert X.shape == (expected_samples, len(FEATURE_NAMES))
+        assert X.dtype == FEATURE_DTYPE
         assert y_fill.shape == (expected_samples,)
         assert y_adverse.shape == (expected_samples,)
 
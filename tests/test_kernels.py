@@ -0,0 +1,48 @@
+"""Tests for strategy ring-buffer kernels (compiled and pure-Python paths)."""
+
+import statistics
+
+import numpy as np
+import pytest
+
+from bot_mm.strategies import _kernels
+from bot_mm.strategies._kernels import push_window, rolling_std
+
+
+def _py(func):
+    """Underlying Python function (Numba dispatchers expose it as py_func)."""
+    return getattr(func, "py_func", func)
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+def test_push_window_matches_stdev(compiled):
+    push = push_window if compiled else _py(push_window)
+    std = rolling_std if compiled else _py(rolling_std)
+
+    rng = np.random.RandomState(3)
+    values = rng.normal(0, 1e-3, 137).tolist()
+    windows = np.array([5, 20, 50], dtype=np.int64)
+    buf = np.zeros(50)
+    sums = np.zeros(3)
+    sumsqs = np.zeros(3)
+    idx = count = 0
+
+    for i, v in enumerate(values, start=1):
+        idx, count = push(buf, idx, count, windows, sums, sumsqs, v)
+        for k, w in enumerate(windows):
+            n = min(int(w), i)
+            if n >= 2:
+                expected = statistics.stdev(values[i - n:i])
+                assert std(sums[k], sumsqs[k], n) == pytest.approx(expected, rel=1e-9)
+
+    assert count == 50
+    assert idx == 137 % 50
+
+
+def test_rolling_std_clamps_negative_variance():
+    assert rolling_std(1.0, 0.0, 4) == 0.0
+    assert rolling_std(0.0, 0.0, 1) == 0.0
+
+
+def test_numba_flag_is_bool():
+    assert isinstance(_kernels.HAVE_NUMBA, bool)
@@ -1,12 +1,21 @@
 """Tests for MMDiscordNotifier."""
 
 import asyncio
+import json
+import os
+import subprocess
+import sys
 import time
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 
 import pytest
 
-from bot_mm.utils.notifier import MMDiscordNotifier, _ERROR_RATE_LIMIT_SECONDS
+from bot_mm.utils import notifier as notifier_mod
+from bot_mm.utils.notifier import (
+    MMDiscordNotifier,
+    _ERROR_DEDUP_SECONDS,
+    _ERROR_RATE_LIMIT_SECONDS,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -18,11 +27,38 @@ def _run(coro):
     return asyncio.run(coro)
 
 
-def _mock_response(status=204):
+def _mock_response(status=204, headers=None):
     resp = MagicMock()
-    resp.status_code = status
-    resp.text = ""
-    return resp
+    resp.status = status
+    resp.headers = headers or {}
+    resp.text = AsyncMock(return_value="")
+    ctx = MagicMock()
+    ctx.__aenter__ = AsyncMock(return_value=resp)
+    ctx.__aexit__ = AsyncMock(return_value=False)
+    return ctx
+
+
+def _sent(call) -> dict:
+    """Decode the JSON body of a recorded ``session.post`` call."""
+    return json.loads(call[1]["data"])
+
+
+@pytest.fixture(autouse=True)
+def _no_batch_window(monkeypatch):
+    """Flush each queued embed immediately unless a test opts in."""
+    monkeypatch.setattr(MMDiscordNotifier, "_BATCH_WINDOW", 0.0)
+
+
+@pytest.fixture
+def mock_post():
+    """Patch the shared webhook session; yields its ``post`` mock."""
+    session = MagicMock()
+    session.post = MagicMock(return_value=_mock_response(204))
+    with patch(
+        "bot_mm.utils.notifier._get_session",
+        AsyncMock(return_value=session),
+    ):
+        yield session.post
 
 
 VALID_URL = "https://discord.com/api/webhooks/123/abc"
@@ -55,13 +91,48 @@ class TestIsConfigured:
 # ---------------------------------------------------------------------------
 
 class TestSendRaw:
-    @patch("bot_mm.utils.notifier.requests.post", return_value=_mock_response(204))
     def test_success(self, mock_post):
         n = MMDiscordNotifier(VALID_URL)
         payload = {"content": "hello"}
         result = _run(n.send_raw(payload))
         assert result is True
-        mock_post.assert_called_once_with(VALID_URL, json=payload, timeout=10)
+        mock_post.assert_called_once()
+        assert mock_post.call_args[0] == (VALID_URL,)
+        assert _sent(mock_post.call_args) == payload
+        assert mock_post.call_args[1]["headers"]["Content-Type"] == "application/json"
+
+    def test_http_error_returns_false(self, mock_post):
+        mock_post.return_value = _mock_response(500)
+        n = MMDiscordNotifier(VALID_URL)
+        assert _run(n.send_raw({"content": "hello"})) is False
+
+    def test_429_retried_after_retry_after(self, mock_post):
+        mock_post.side_effect = [
+            _mock_response(429, {"Retry-After": "2.5"}),
+            _mock_response(204),
+        ]
+        n = MMDiscordNotifier(VALID_URL)
+        with patch("bot_mm.utils.notifier.asyncio.sleep", AsyncMock()) as sleep:
+            assert _run(n.send_raw({"content": "hi"})) is True
+        sleep.assert_awaited_once_with(2.5)
+        assert mock_post.call_count == 2
+
+    def test_429_gives_up(self, mock_post):
+        mock_post.side_effect = lambda *a, **k: _mock_response(429)
+        n = MMDiscordNotifier(VALID_URL)
+        with patch("bot_mm.utils.notifier.asyncio.sleep", AsyncMock()):
+            assert _run(n.send_raw({"content": "hi"})) is False
+        assert mock_post.call_count == notifier_mod._MAX_429_RETRIES + 1
+
+    def test_numpy_and_unknown_values_serialized(self, mock_post):
+        import numpy as np
+
+        n = MMDiscordNotifier(VALID_URL)
+        payload = {"fills": np.int64(3), "pnl": np.float64(1.5), "when": object}
+        assert _run(n.send_raw(payload)) is True
+        sent = _sent(mock_post.call_args)
+        assert sent["fills"] == 3 and sent["pnl"] == 1.5
+        assert sent["when"] == str(object)
 
     def test_not_configured(self):
         n = MMDiscordNotifier("")
@@ -69,17 +140,140 @@ class TestSendRaw:
         assert result is False
 
 
+class TestSession:
+    def test_reused_within_loop_and_closed(self):
+        async def scenario():
+            first = await notifier_mod._get_session()
+            second = await notifier_mod._get_session()
+            await notifier_mod.close_session()
+            return first, second
+
+        first, second = _run(scenario())
+        assert first is second
+        assert first.closed
+        assert notifier_mod._session is None
+
+    def test_new_loop_gets_new_session(self):
+        async def open_session():
+            return await notifier_mod._get_session()
+
+        first = _run(open_session())
+        second = _run(open_session())
+        assert second is not first
+        _run(notifier_mod.close_session())
+        _run(first.close())
+
+
+    def test_import_does_not_load_aiohttp(self):
+        code = (
+            "import sys, bot_mm.utils.notifier; "
+            "sys.exit('aiohttp' in sys.modules)"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run([sys.executable, "-c", code], cwd=root)
+        assert result.returncode == 0
+
+
+# ---------------------------------------------------------------------------
+# embed construction
+# ---------------------------------------------------------------------------
+
+class TestEmbed:
+    def test_timestamp_cached_within_second(self):
+        n = MMDiscordNotifier(VALID_URL)
+        first = n._embed("a", 0, [])["timestamp"]
+        assert n._embed("b", 0, [])["timestamp"] == first
+
+        n._ts_cache = (n._ts_cache[0] - 2.0, "stale")
+        assert n._embed("c", 0, [])["timestamp"] != "stale"
+
+    def test_footer(self):
+        n = MMDiscordNotifier(VALID_URL, bot_name="Bot")
+        assert n._embed("a", 0, [])["footer"] == {"text": "Bot"}
+        assert n._embed("a", 0, [], footer_extra="x")["footer"] == {"text": "Bot | x"}
+
+
+# ---------------------------------------------------------------------------
+# batching
+# ---------------------------------------------------------------------------
+
+class TestBatching:
+    def test_burst_coalesced_in_order(self, mock_post, monkeypatch):
+        monkeypatch.setattr(MMDiscordNotifier, "_BATCH_WINDOW", 0.05)
+        n = MMDiscordNotifier(VALID_URL)
+
+        async def burst():
+            return await asyncio.gather(
+                n.send_alert("A", "a", level="info"),
+                n.send_recorder_reconnect(1, 5, "boom"),
+                n.send_alert("C", "c", level="error"),
+            )
+
+        assert _run(burst()) == [True, True, True]
+        mock_post.assert_called_once()
+        embeds = _sent(mock_post.call_args)["embeds"]
+        assert [e["title"] for e in embeds] == [
+            "⚠️ A", "🔄 WebSocket Reconnecting", "⚠️ C",
+        ]
+
+    def test_batch_capped_at_ten(self, mock_post, monkeypatch):
+        monkeypatch.setattr(MMDiscordNotifier, "_BATCH_WINDOW", 0.05)
+        n = MMDiscordNotifier(VALID_URL)
+
+        async def burst():
+            return await asyncio.gather(
+                *(n._enqueue(n._embed(f"T{i}", 0, [])) for i in range(12))
+            )
+
+        assert all(_run(burst()))
+        sizes = [len(_sent(c)["embeds"]) for c in mock_post.call_args_list]
+        assert sizes == [10, 2]
+
+    def test_failure_propagates_to_every_sender(self, mock_post):
+        mock_post.return_value = _mock_response(500)
+        n = MMDiscordNotifier(VALID_URL)
+        assert _run(n.send_alert("T", "m")) is False
+
+    def test_send_error_resolves_senders(self, mock_post, monkeypatch):
+        monkeypatch.setattr(MMDiscordNotifier, "_BATCH_WINDOW", 0.05)
+        n = MMDiscordNotifier(VALID_URL)
+
+        async def scenario():
+            with patch.object(n, "send_raw", AsyncMock(side_effect=RuntimeError("boom"))):
+                failed = await asyncio.gather(
+                    n.send_alert("A", "a"), n.send_alert("B", "b", level="info"),
+                )
+            # A fresh drain task takes over for the next embed
+            ok = await n.send_alert("C", "c", level="error")
+            await n.close()
+            return failed, ok
+
+        assert _run(scenario()) == ([False, False], True)
+
+    def test_close_resolves_queued_embeds(self, mock_post, monkeypatch):
+        monkeypatch.setattr(MMDiscordNotifier, "_BATCH_WINDOW", 10.0)
+        n = MMDiscordNotifier(VALID_URL)
+
+        async def scenario():
+            pending = asyncio.ensure_future(n.send_alert("A", "a"))
+            await asyncio.sleep(0.01)
+            await n.close()
+            return await pending
+
+        assert _run(scenario()) is False
+        mock_post.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # recorder_started embed
 # ---------------------------------------------------------------------------
 
 class TestRecorderStarted:
-    @patch("bot_mm.utils.notifier.requests.post", return_value=_mock_response())
     def test_embed_fields(self, mock_post):
         n = MMDiscordNotifier(VALID_URL)
         _run(n.send_recorder_started(["BTCUSDT", "ETHUSDT"], "data/output"))
 
-        payload = mock_post.call_args[1]["json"]
+        payload = _sent(mock_post.call_args)
         embed = payload["embeds"][0]
         assert embed["color"] == MMDiscordNotifier.COLOR_GREEN
         assert "BTCUSDT" in embed["fields"][0]["value"]
@@ -92,7 +286,6 @@ class TestRecorderStarted:
 # ---------------------------------------------------------------------------
 
 class TestRecorderStats:
-    @patch("bot_mm.utils.notifier.requests.post", return_value=_mock_response())
     def test_stats_formatting(self, mock_post):
         n = MMDiscordNotifier(VALID_URL)
         stats = {
@@ -104,7 +297,7 @@ class TestRecorderStats:
         }
         _run(n.send_recorder_stats(stats))
 
-        payload = mock_post.call_args[1]["json"]
+        payload = _sent(mock_post.call_args)
         fields = {f["name"]: f["value"] for f in payload["embeds"][0]["fields"]}
 
         assert fields["Uptime"] == "2h 1m"
@@ -113,12 +306,33 @@ class TestRecorderStats:
         assert fields["Reconnects"] == "3"
 
 
+class TestDirSize:
+    def test_nested_total_and_cache(self, tmp_path):
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "b").mkdir()
+        (tmp_path / "x.bin").write_bytes(b"0" * 1024 * 1024)
+        (tmp_path / "a" / "b" / "y.bin").write_bytes(b"0" * 512 * 1024)
+
+        n = MMDiscordNotifier(VALID_URL)
+        assert n._dir_size_mb(str(tmp_path)) == "1.5 MB"
+
+        # Within the TTL the cached value is returned without re-walking
+        (tmp_path / "z.bin").write_bytes(b"0" * 1024 * 1024)
+        assert n._dir_size_mb(str(tmp_path)) == "1.5 MB"
+
+        n._dir_size_cache[str(tmp_path)] = (float("-inf"), "stale")
+        assert n._dir_size_mb(str(tmp_path)) == "2.5 MB"
+
+    def test_missing_dir(self, tmp_path):
+        n = MMDiscordNotifier(VALID_URL)
+        assert n._dir_size_mb(str(tmp_path / "nope")) == "N/A"
+
+
 # ---------------------------------------------------------------------------
 # daily_report
 # ---------------------------------------------------------------------------
 
 class TestDailyReport:
-    @patch("bot_mm.utils.notifier.requests.post", return_value=_mock_response())
     def test_profit_green(self, mock_post):
         n = MMDiscordNotifier(VALID_URL)
         metrics = {
@@ -131,19 +345,18 @@ class TestDailyReport:
         }
         _run(n.send_daily_report(metrics))
 
-        embed = mock_post.call_args[1]["json"]["embeds"][0]
+        embed = _sent(mock_post.call_args)["embeds"][0]
         assert embed["color"] == MMDiscordNotifier.COLOR_GREEN
         pnl_field = next(f for f in embed["fields"] if f["name"] == "Net PnL")
         assert "+42.50" in pnl_field["value"]
 
-    @patch("bot_mm.utils.notifier.requests.post", return_value=_mock_response())
     def test_loss_red(self, mock_post):
         n = MMDiscordNotifier(VALID_URL)
         metrics = {"pnl": -15.0, "volume": 0, "fills": 0, "round_trips": 0,
                     "avg_spread_bps": 0, "inventory_utilization_pct": 0}
         _run(n.send_daily_report(metrics))
 
-        embed = mock_post.call_args[1]["json"]["embeds"][0]
+        embed = _sent(mock_post.call_args)["embeds"][0]
         assert embed["color"] == MMDiscordNotifier.COLOR_RED
         pnl_field = next(f for f in embed["fields"] if f["name"] == "Net PnL")
         assert "-15.00" in pnl_field["value"]
@@ -154,7 +367,6 @@ class TestDailyReport:
 # ---------------------------------------------------------------------------
 
 class TestErrorRateLimiting:
-    @patch("bot_mm.utils.notifier.requests.post", return_value=_mock_response())
     def test_second_error_suppressed(self, mock_post):
         n = MMDiscordNotifier(VALID_URL)
 
@@ -167,7 +379,6 @@ class TestErrorRateLimiting:
         assert result2 is False
         assert mock_post.call_count == 1  # no additional call
 
-    @patch("bot_mm.utils.notifier.requests.post", return_value=_mock_response())
     def test_error_after_window(self, mock_post):
         n = MMDiscordNotifier(VALID_URL)
 
@@ -180,28 +391,84 @@ class TestErrorRateLimiting:
         assert mock_post.call_count == 2
 
 
+    def test_context_sent_once(self, mock_post):
+        n = MMDiscordNotifier(VALID_URL)
+        _run(n.send_recorder_error("boom", context="BTCUSDT ws"))
+        embed = _sent(mock_post.call_args)["embeds"][0]
+        assert embed["fields"] == [
+            {"name": "Context", "value": "BTCUSDT ws", "inline": False}
+        ]
+        assert embed["footer"]["text"] == n.bot_name
+
+    def test_duplicate_suppressed_after_window(self, mock_post):
+        n = MMDiscordNotifier(VALID_URL)
+        _run(n.send_recorder_error("Traceback: boom"))
+        n._last_error_sent -= _ERROR_RATE_LIMIT_SECONDS + 1
+
+        # Same content is still deduplicated once the time limit has passed
+        assert _run(n.send_recorder_error("Traceback: boom")) is False
+        assert _run(n.send_recorder_error("Traceback: other")) is True
+        assert mock_post.call_count == 2
+
+    def test_duplicate_expires(self, mock_post):
+        n = MMDiscordNotifier(VALID_URL)
+        _run(n.send_recorder_error("boom"))
+        n._last_error_sent -= _ERROR_DEDUP_SECONDS + 1
+        key, sent_at = n._recent_errors[0]
+        n._recent_errors[0] = (key, sent_at - _ERROR_DEDUP_SECONDS - 1)
+
+        assert _run(n.send_recorder_error("boom")) is True
+        assert len(n._recent_errors) == 1
+
+
+# ---------------------------------------------------------------------------
+# per-category token buckets
+# ---------------------------------------------------------------------------
+
+class TestCategoryRateLimit:
+    def test_burst_then_suppressed(self, mock_post):
+        n = MMDiscordNotifier(VALID_URL)
+        results = [_run(n.send_alert("T", "m")) for _ in range(6)]
+        assert results == [True] * 5 + [False]
+        assert mock_post.call_count == 5
+
+    def test_refill_over_time(self, mock_post):
+        n = MMDiscordNotifier(VALID_URL)
+        for _ in range(3):
+            _run(n.send_recorder_stats({"output_dir": ""}))
+        assert _run(n.send_recorder_stats({"output_dir": ""})) is False
+
+        tokens, last = n._buckets["stats"]
+        n._buckets["stats"] = (tokens, last - 30)  # one token's worth at 1/30 s
+        assert _run(n.send_recorder_stats({"output_dir": ""})) is True
+
+    def test_categories_independent(self, mock_post):
+        n = MMDiscordNotifier(VALID_URL)
+        for _ in range(5):
+            _run(n.send_alert("T", "m"))
+        assert _run(n.send_alert("T", "m")) is False
+        assert _run(n.send_recorder_reconnect(1, 5, "x")) is True
+
+
 # ---------------------------------------------------------------------------
 # alert levels
 # ---------------------------------------------------------------------------
 
 class TestAlertLevels:
-    @patch("bot_mm.utils.notifier.requests.post", return_value=_mock_response())
     def test_warning_orange(self, mock_post):
         n = MMDiscordNotifier(VALID_URL)
         _run(n.send_alert("Test", "msg", level="warning"))
-        embed = mock_post.call_args[1]["json"]["embeds"][0]
+        embed = _sent(mock_post.call_args)["embeds"][0]
         assert embed["color"] == MMDiscordNotifier.COLOR_ORANGE
 
-    @patch("bot_mm.utils.notifier.requests.post", return_value=_mock_response())
     def test_error_red(self, mock_post):
         n = MMDiscordNotifier(VALID_URL)
         _run(n.send_alert("Test", "msg", level="error"))
-        embed = mock_post.call_args[1]["json"]["embeds"][0]
+        embed = _sent(mock_post.call_args)["embeds"][0]
         assert embed["color"] == MMDiscordNotifier.COLOR_RED
 
-    @patch("bot_mm.utils.notifier.requests.post", return_value=_mock_response())
     def test_info_blue(self, mock_post):
         n = MMDiscordNotifier(VALID_URL)
         _run(n.send_alert("Test", "msg", level="info"))
-        embed = mock_post.call_args[1]["json"]["embeds"][0]
+        embed = _sent(mock_post.call_args)["embeds"][0]
         assert embed["color"] == MMDiscordNotifier.COLOR_BLUE
@@ -179,3 +179,27 @@ def test_quotes_symmetric_at_zero_inventory():
     ask = [q for q in quotes if q.side == "sell"][0].price
 
     assert mid - bid == pytest.approx(ask - mid, rel=1e-6)
+
+
+def test_quote_arrays_match_quote_objects():
+    """calculate_quotes_arrays returns the same ladder as calculate_quotes."""
+    _, engine = make_engine(num_levels=3, order_size_usd=150.0)
+    args = (50_000.0, 0.002, 120.0, 500.0)
+    kwargs = dict(book_imbalance=0.2, directional_bias=-0.3, maker_fee=0.00015)
+    quotes = engine.calculate_quotes(*args, **kwargs)
+    prices, sizes, is_buy, levels = engine.calculate_quotes_arrays(*args, **kwargs)
+
+    assert engine.quotes_from_arrays(prices, sizes, is_buy, levels) == quotes
+
+
+def test_quote_arrays_one_sided():
+    """skip_sell leaves only bids in the arrays."""
+    _, engine = make_engine(num_levels=2)
+    prices, sizes, is_buy, levels = engine.calculate_quotes_arrays(
+        50_000.0, 0.002, 0.0, 500.0, skip_sell=True,
+    )
+    assert is_buy.all()
+    assert list(levels) == [0, 1]
+    assert list(prices) == [q.price for q in engine.calculate_quotes(
+        50_000.0, 0.002, 0.0, 500.0, skip_sell=True,
+    )]
@@ -3,6 +3,7 @@
 import math
 import sys
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
@@ -10,15 +11,96 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent))
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
+import backtest_supervisor
 from backtest_supervisor import (
     compute_score,
     compute_scores_ranked,
     apply_allocation,
     compute_risk_adjustments,
+    equity_curve_and_mdd,
     rank_normalize,
+    rolling_window_metrics,
+    running_max_window,
+    score_buckets,
+    score_matrix,
 )
 
 
+# ── run_asset_backtest cache ─────────────────────────────────────────────
+
+class TestBacktestCache:
+    """Phase-1 results are cached on disk and invalidated by input changes."""
+
+    def _setup(self, tmp_path, monkeypatch):
+        data = tmp_path / "data" / "cache"
+        data.mkdir(parents=True)
+        csv = data / "BTCUSDT_1h.csv"
+        csv.write_text("timestamp,open,high,low,close,volume\n0,1,1,1,1,1\n")
+        monkeypatch.setattr(backtest_supervisor, "project_root", tmp_path)
+        monkeypatch.setattr(backtest_supervisor, "CACHE_DIR", tmp_path / ".cache")
+        src = tmp_path / "bot_mm"
+        src.mkdir()
+        (src / "quoter.py").write_text("SPREAD = 1\n")
+        monkeypatch.setattr(backtest_supervisor, "SOURCE_DIRS", (src,))
+        bt = MagicMock()
+        bt.return_value.run.return_value.daily_pnls = [1.5, -0.5, 2.0]
+        return csv, bt
+
+    def test_second_run_uses_cache(self, tmp_path, monkeypatch):
+        csv, bt = self._setup(tmp_path, monkeypatch)
+        with patch.object(backtest_supervisor, "MMBacktester", bt):
+            first = backtest_supervisor.run_asset_backtest("BTCUSDT", 1, 1000.0)
+            second = backtest_supervisor.run_asset_backtest("BTCUSDT", 1, 1000.0)
+        assert first == second == [1.5, -0.5, 2.0]
+        assert bt.return_value.run.call_count == 1
+
+    def test_data_change_invalidates(self, tmp_path, monkeypatch):
+        csv, bt = self._setup(tmp_path, monkeypatch)
+        with patch.object(backtest_supervisor, "MMBacktester", bt):
+            backtest_supervisor.run_asset_backtest("BTCUSDT", 1, 1000.0)
+            csv.write_text(csv.read_text() + "3600000,1,1,1,1,1\n")
+            backtest_supervisor.run_asset_backtest("BTCUSDT", 1, 1000.0)
+            backtest_supervisor.run_asset_backtest("BTCUSDT", 1, 1000.0, use_cache=False)
+        assert bt.return_value.run.call_count == 3
+
+    def test_source_change_invalidates(self, tmp_path, monkeypatch):
+        csv, bt = self._setup(tmp_path, monkeypatch)
+        with patch.object(backtest_supervisor, "MMBacktester", bt):
+            backtest_supervisor.run_asset_backtest("BTCUSDT", 1, 1000.0)
+            (tmp_path / "bot_mm" / "quoter.py").write_text("SPREAD = 2\n")
+            backtest_supervisor.run_asset_backtest("BTCUSDT", 1, 1000.0)
+            backtest_supervisor.run_asset_backtest("BTCUSDT", 1, 1000.0)
+        assert bt.return_value.run.call_count == 2
+
+
+class TestLoadCandles:
+    """Columnar candle loader must match load_candles_csv exactly."""
+
+    def test_matches_csv_loader(self, tmp_path):
+        rng = np.random.default_rng(1)
+        csv = tmp_path / "X_1h.csv"
+        rows = ["timestamp,open,high,low,close,volume"]
+        for k in range(100):
+            o, h, l, c = rng.uniform(90000, 110000, 4).round(2)
+            rows.append(f"{1700000000000 + k * 3600000},{o},{h},{l},{c},{rng.uniform(0, 50):.6f}")
+        csv.write_text("\n".join(rows) + "\n")
+        for days in (0, 2, 10):
+            fast = backtest_supervisor._load_candles_columnar(str(csv), days)
+            assert fast == backtest_supervisor.load_candles_csv(str(csv), days)
+        assert len(backtest_supervisor._load_candles_columnar(str(csv), 2)) == 48
+
+    def test_missing_volume_and_fallback(self, tmp_path):
+        csv = tmp_path / "Y_1h.csv"
+        csv.write_text("open_time,open,high,low,close\n0,1,2,0.5,1.5\n")
+        fast = backtest_supervisor._load_candles_columnar(str(csv), 0)
+        assert fast == backtest_supervisor.load_candles_csv(str(csv), 0)
+        assert fast[0].timestamp == "1970-01-01 00:00:00" and fast[0].volume == 0.0
+
+        iso = tmp_path / "Z_1h.csv"
+        iso.write_text("timestamp,open,high,low,close,volume\n2024-01-01,1,1,1,1,1\n")
+        assert backtest_supervisor._load_candles_columnar(str(iso), 0) is None
+
+
 # ── compute_score ────────────────────────────────────────────────────────
 
 class TestComputeScore:
@@ -95,6 +177,76 @@ class TestComputeScore:
         assert m_v["return"] > m_s["return"]
 
 
+# ── rolling_window_metrics ──────────────────────────────────────────────
+
+class TestRollingWindowMetrics:
+    """Vectorised window metrics must match compute_score per window."""
+
+    def test_matches_compute_score(self):
+        rng = np.random.default_rng(7)
+        pnl = rng.normal(0.5, 3.0, size=(3, 60))
+        pnl[1, 10:30] = 2.0  # constant stretch → std=0 windows
+        window = 14
+        windows = np.lib.stride_tricks.sliding_window_view(pnl, window, axis=1)
+        wm = rolling_window_metrics(pnl, window)
+
+        for i in range(pnl.shape[0]):
+            for j in range(windows.shape[1]):
+                ref = compute_score(list(pnl[i, j:j + window]))
+                assert wm["sharpe"][i, j] == pytest.approx(ref["sharpe"], abs=1e-9)
+                assert wm["return"][i, j] == pytest.approx(ref["return"])
+                assert wm["dd"][i, j] == pytest.approx(ref["dd"])
+                assert wm["consistency"][i, j] == ref["consistency"]
+
+    def test_scale_invariance(self):
+        """Positive scaling leaves Sharpe/consistency unchanged, scales return."""
+        rng = np.random.default_rng(3)
+        window = rng.normal(1.0, 2.0, size=20)
+        base = compute_score(list(window))
+        scaled = compute_score(list(window * 7.5))
+        assert scaled["sharpe"] == pytest.approx(base["sharpe"])
+        assert scaled["consistency"] == base["consistency"]
+        assert scaled["return"] == pytest.approx(base["return"] * 7.5)
+        assert scaled["dd"] == pytest.approx(base["dd"] * 7.5)
+
+    def test_dd_lookback_matches_compute_score(self):
+        rng = np.random.default_rng(11)
+        pnl = rng.normal(0.2, 3.0, size=(2, 40))
+        window, lookback = 20, 5
+        windows = np.lib.stride_tricks.sliding_window_view(pnl, window, axis=1)
+        wm = rolling_window_metrics(pnl, window, lookback)
+        full = rolling_window_metrics(pnl, window)
+        assert np.all(wm["dd"] <= full["dd"] + 1e-12)
+        for i in range(pnl.shape[0]):
+            for j in range(windows.shape[1]):
+                ref = compute_score(list(pnl[i, j:j + window]), lookback)
+                assert wm["dd"][i, j] == pytest.approx(ref["dd"])
+
+
+class TestRunningMaxWindow:
+    """Monotonic-deque trailing max."""
+
+    def test_matches_naive(self):
+        x = np.random.default_rng(5).normal(size=50)
+        for D in (1, 3, 7, 50, 80):
+            naive = [x[max(0, i - D + 1):i + 1].max() for i in range(len(x))]
+            np.testing.assert_array_equal(running_max_window(x, D), naive)
+
+    def test_ties_and_monotone(self):
+        np.testing.assert_array_equal(
+            running_max_window(np.array([2.0, 2.0, 1.0, 1.0, 0.0]), 2),
+            [2.0, 2.0, 2.0, 1.0, 1.0],
+        )
+        x = np.arange(6, dtype=float)
+        np.testing.assert_array_equal(running_max_window(x, 3), x)
+
+    def test_lookback_bounds_drawdown(self):
+        # Peak 10 days ago falls out of a 3-day lookback
+        pnl = [10.0, -1.0, -1.0, -1.0, -1.0]
+        assert compute_score(pnl)["dd"] == pytest.approx(4.0)
+        assert compute_score(pnl, dd_lookback=3)["dd"] == pytest.approx(2.0)
+
+
 # ── compute_scores_ranked (absolute scoring) ────────────────────────────
 
 class TestComputeScoresRanked:
@@ -172,6 +324,21 @@ class TestComputeScoresRanked:
         scores = compute_scores_ranked([])
         assert scores == []
 
+    def test_score_matrix_matches_scalar_formula(self):
+        rng = np.random.default_rng(11)
+        m = np.column_stack((
+            rng.uniform(-10, 30, 50),    # sharpe
+            rng.uniform(-200, 200, 50),  # return
+            rng.uniform(0, 150, 50),     # dd
+            rng.uniform(0, 1, 50),       # consistency
+        ))
+        for row, score in zip(m, score_matrix(m)):
+            sh, ret, dd, c = row
+            s_ = max(0, min(1, (sh + 2) / 17))
+            r_ = max(0, min(1, 0.5 + ret / (abs(ret) + 100) * 0.5))
+            d_ = max(0, min(1, 1 - dd / max(abs(ret), 10)))
+            assert score == pytest.approx(0.40 * s_ + 0.30 * r_ + 0.20 * d_ + 0.10 * c)
+
 
 # ── rank_normalize ───────────────────────────────────────────────────────
 
@@ -207,6 +374,17 @@ class TestRankNormalize:
 
 # ── apply_allocation ────────────────────────────────────────────────────
 
+class TestScoreBuckets:
+    """searchsorted bucketing must match the original if/elif thresholds."""
+
+    def test_boundaries(self):
+        scores = np.array([0.0, 0.0999, 0.10, 0.2999, 0.30, 0.5, 0.70, 0.7001, 1.0])
+        np.testing.assert_array_equal(
+            score_buckets(scores),
+            [0, 0, 1, 1, 2, 2, 2, 3, 3],
+        )
+
+
 class TestApplyAllocation:
     """Tests for reward/punish allocation rules."""
 
@@ -436,6 +614,16 @@ class TestSimulationLogic:
         dd = max(peak - np.array(equity))
         assert dd == 15  # peak 115, drops to 100
 
+    def test_fused_equity_curve_and_mdd(self):
+        """One-pass curve/MDD matches cumsum + maximum.accumulate."""
+        rng = np.random.default_rng(5)
+        daily = rng.normal(0.0, 10.0, 500)
+        daily[0] = -25.0  # first-day loss is not a drawdown from a prior peak
+        curve, mdd = equity_curve_and_mdd(daily, 1000.0)
+        ref = 1000.0 + np.cumsum(daily)
+        np.testing.assert_allclose(curve, ref)
+        assert mdd == pytest.approx((np.maximum.accumulate(ref) - ref).max())
+
     def test_profitable_days_count(self):
         daily = [10, -5, 10, 0, -3, 10, 10]
         pos = sum(1 for d in daily if d > 0)
@@ -30,6 +30,13 @@ class TestInitialState:
         assert det.sell_toxicity == 0.3
         assert det.fills_measured == 0
 
+    def test_slotted_instances(self):
+        det = _make_detector()
+        det.on_fill("buy", 100.0, 100.0, 1.0)
+        assert not hasattr(det, "__dict__")
+        assert not hasattr(det._pending_fills[0], "__dict__")
+        assert det._pending_fills[0]._fill_bar == 0
+
 
 class TestFillRecording:
     def test_on_fill_creates_pending(self):